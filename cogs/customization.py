@@ -337,6 +337,7 @@ class Customization(Cog):
         
         data = await self.api.get_stats(region=game_account.region, game_id=game_account.game_id)
         diff_data = await get_session_stats(data, data, zero_bypass=True)
+        await self.db.load_image(member)
         
         image = ImageGenSession().generate(
             data=data, 
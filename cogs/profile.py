@@ -52,6 +52,7 @@ class Profile(commands.Cog):
             _, member, _ = await standard_account_validate(account_id=user.id, slot=None)
         
         username = user.display_name if user is not None else ctx.user.display_name
+        await self.db.load_last_stats(member)
         image = ProfileImageGen().generate(member=member, username=username)
         level_info = get_level(member.profile.level_exp)
         
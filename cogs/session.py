@@ -48,7 +48,8 @@ class Session(commands.Cog):
         stats = await self.api.get_stats(
             game_id=game_account.game_id,
             region=game_account.region,
-            requested_by=member
+            requested_by=member,
+            stale_while_revalidate=True
         )
 
         last_stats = await self.db.get_last_stats(member=member, slot=slot)
@@ -59,9 +60,10 @@ class Session(commands.Cog):
         
         await self.db.set_session_settings(slot, member.id, session_settings)
         diff_stats = await get_session_stats(last_stats, stats)
+        await self.db.load_image(member)
         
         image = ImageGenSession().generate(
-            data=game_account.last_stats,
+            data=last_stats,
             diff_data=diff_stats,
             player=member,
             server=server,
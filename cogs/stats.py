@@ -609,7 +609,8 @@ class Stats(commands.Cog):
                 game_id=game_id,
                 search=nickname,
                 region=region,
-                requested_by=requested_by
+                requested_by=requested_by,
+                stale_while_revalidate=True
                 )
         except* api.EmptyDataError:
             exception = 'unknown_error'
@@ -636,6 +637,7 @@ class Stats(commands.Cog):
             else:
                 await ctx.respond(embed=embed_func())
         else:
+            await self.db.load_image(requested_by)
             img_data = self.img_gen.generate(
                 data=data,
                 server=server,
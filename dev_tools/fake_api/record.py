@@ -0,0 +1,82 @@
+import asyncio
+import json
+from pathlib import Path
+
+import aiohttp
+import typer
+
+from lib.settings.settings import Config, EnvConfig
+from lib.utils.string_parser import insert_data
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+_config = Config().get()
+app = typer.Typer()
+
+# Fixture directory -> URL template, complete documents are recorded so any projection can be served later
+TEMPLATES = {
+    'account_info': _config.game_api.urls.get_stats,
+    'achievements': _config.game_api.urls.get_achievements,
+    'clan_info': _config.game_api.urls.get_clan_stats,
+    'tanks_stats': _config.game_api.urls.get_tank_stats,
+}
+REG_URLS = {
+    'ru': _config.game_api.reg_urls.ru,
+    'eu': _config.game_api.reg_urls.eu,
+    'na': _config.game_api.reg_urls.na,
+    'asia': _config.game_api.reg_urls.asia,
+}
+
+
+async def record(region: str, account_ids: list[int], vehicles: bool) -> None:
+    app_ids = EnvConfig.LT_APP_IDS if region == 'ru' else EnvConfig.WG_APP_IDS
+    async with aiohttp.ClientSession() as session:
+        async def get(url: str) -> dict:
+            async with session.get(url) as response:
+                return await response.json(content_type=None)
+
+        for endpoint, template in TEMPLATES.items():
+            (FIXTURES_DIR / endpoint).mkdir(exist_ok=True)
+            for account_id in account_ids:
+                url = insert_data(
+                    template,
+                    {'reg_url': REG_URLS[region], 'app_id': next(app_ids), 'player_id': account_id, 'fields': ''}
+                )
+                data = await get(url)
+                if data.get('status') != 'ok' or data['data'].get(str(account_id)) is None:
+                    typer.echo(f'{endpoint}: no data for {account_id}: {data.get("error")}')
+                    continue
+
+                path = FIXTURES_DIR / endpoint / f'{account_id}.json'
+                path.write_text(json.dumps(data['data'][str(account_id)], indent=2), encoding='utf-8')
+                typer.echo(f'{endpoint}: {path}')
+
+        if region != 'ru':
+            for account_id in account_ids:
+                data = await get(f'https://{region}.wotblitz.com/eu/api/rating-leaderboards/user/{account_id}')
+                if 'spa_id' in data:
+                    path = FIXTURES_DIR / 'leaderboard' / f'{account_id}.json'
+                    path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+                    typer.echo(f'leaderboard: {path}')
+
+        if vehicles:
+            url = insert_data(
+                _config.game_api.urls.get_tankopedia,
+                {'reg_url': REG_URLS[region], 'app_id': next(app_ids), 'fields': ''}
+            )
+            data = await get(url)
+            (FIXTURES_DIR / 'encyclopedia_vehicles.json').write_text(json.dumps(data['data'], indent=2), encoding='utf-8')
+            typer.echo('encyclopedia_vehicles: recorded')
+
+
+@app.command()
+def run(region: str, account_ids: list[int], vehicles: bool = False):
+    asyncio.run(record(region, account_ids, vehicles))
+
+
+if __name__ == '__main__':
+    app()
+
+# use: python -m dev_tools.fake_api.record eu 594859325 524552183 --vehicles
+# records the real responses of the accounts into dev_tools/fake_api/fixtures,
+# the application IDs are taken from the .env file
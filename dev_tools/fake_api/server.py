@@ -0,0 +1,277 @@
+import asyncio
+import json
+import random
+from copy import deepcopy
+from pathlib import Path
+from time import monotonic
+from zlib import crc32
+
+import typer
+from aiohttp import web
+from pydantic import BaseModel
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+ENDPOINTS = ('account_info', 'achievements', 'clan_info', 'tanks_stats', 'leaderboard')
+
+app = typer.Typer()
+
+
+class FakeApiSettings(BaseModel):
+    latency: float = 0.05        # Mean response time, seconds
+    jitter: float = 0.02         # Standard deviation of the response time, seconds
+    error_rate: float = 0.0      # Share of requests answered with 504 or SOURCE_NOT_AVAILABLE
+    rate_limit: int = 20         # Requests per second per (host, application_id), 0 to disable
+    tanks: int | None = None     # Number of tanks of accounts without a recorded fixture
+
+
+class Fixtures:
+    """
+    Recorded responses, `fixtures/<endpoint>/<account_id>.json` holds the `data` entry of one account.
+    Accounts without a recording get a copy of `default.json` with their ID and nickname.
+    """
+    def __init__(self, directory: Path, tanks: int | None = None) -> None:
+        self.recorded: dict[str, dict[int, dict | list]] = {}
+        for endpoint in ENDPOINTS:
+            self.recorded[endpoint] = {
+                int(path.stem): json.loads(path.read_text(encoding='utf-8'))
+                for path in (directory / endpoint).glob('*.json') if path.stem.isdigit()
+            }
+
+        self.defaults = {
+            endpoint: json.loads((directory / endpoint / 'default.json').read_text(encoding='utf-8'))
+            for endpoint in ENDPOINTS
+        }
+        self.vehicles = json.loads((directory / 'encyclopedia_vehicles.json').read_text(encoding='utf-8'))
+
+        if tanks is not None:
+            self.defaults['tanks_stats'] = self._resize_tanks(self.defaults['tanks_stats'], tanks)
+
+        # Nicknames of the recorded accounts and of the accounts made up by `account/list`
+        self.nicknames: dict[int, str] = {
+            account_id: data['nickname'] for account_id, data in self.recorded['account_info'].items()
+        }
+        self.made_up: dict[str, set[int]] = {}
+
+    @staticmethod
+    def _resize_tanks(tanks: list[dict], count: int) -> list[dict]:
+        resized = []
+        for index in range(count):
+            tank = deepcopy(tanks[index % len(tanks)])
+            tank['tank_id'] += (index // len(tanks)) * 16   # Keep the IDs unique
+            resized.append(tank)
+
+        return resized
+
+    def find(self, host: str, search: str, exact: bool, limit: int) -> list[dict]:
+        search = search.lower()
+        made_up = self.made_up.setdefault(host, set())
+        found = [
+            {'nickname': self.nicknames[account_id], 'account_id': account_id}
+            for account_id in [*self.recorded['account_info'], *made_up]
+            if (
+                self.nicknames[account_id].lower() == search if exact
+                else self.nicknames[account_id].lower().startswith(search)
+            )
+        ][:limit]
+
+        if not found:
+            # Any nickname resolves to a stable made up account of the region
+            account_id = crc32(f'{host}/{search}'.encode()) % 10 ** 9
+            self.nicknames[account_id] = search
+            made_up.add(account_id)
+            found.append({'nickname': search, 'account_id': account_id})
+
+        return found
+
+    def get(self, endpoint: str, account_id: int) -> dict | list:
+        data = self.recorded[endpoint].get(account_id)
+        if data is not None:
+            return data
+
+        data = deepcopy(self.defaults[endpoint])
+        nickname = self.nicknames.get(account_id, f'fake_{account_id}')
+        for item in data if isinstance(data, list) else [data]:
+            for key in ('account_id', 'spa_id'):
+                if key in item:
+                    item[key] = account_id
+            for key in ('nickname', 'account_name'):
+                if key in item:
+                    item[key] = nickname
+
+        return data
+
+
+def project(data: dict, fields: str) -> dict:
+    """
+    Applies the `fields` parameter of the WG API: `a,b.c` keeps only these fields, `-a,-b.c` drops them.
+    """
+    if not fields:
+        return data
+
+    paths = [field.strip().split('.') for field in fields.split(',') if field.strip()]
+    if all(path[0].startswith('-') for path in paths):
+        data = deepcopy(data)
+        for path in paths:
+            node = data
+            path[0] = path[0][1:]
+            for key in path[:-1]:
+                node = node.get(key) if isinstance(node, dict) else None
+            if isinstance(node, dict):
+                node.pop(path[-1], None)
+        return data
+
+    def keep(node: dict, tree: dict) -> dict:
+        result = {}
+        for key, subtree in tree.items():
+            if key not in node:
+                continue
+            value = node[key]
+            result[key] = keep(value, subtree) if subtree and isinstance(value, dict) else value
+        return result
+
+    tree: dict = {}
+    for path in paths:
+        node = tree
+        for key in path:
+            node = node.setdefault(key, {})
+
+    return keep(data, tree)
+
+
+def create_app(settings: FakeApiSettings, fixtures_dir: Path = FIXTURES_DIR) -> web.Application:
+    """
+    Builds the fake API application. Requests are routed as `/<regional host>/<API path>`,
+    which is the form `API` uses when `game_api.fake_api.enabled` is set.
+    """
+    fixtures = Fixtures(fixtures_dir, settings.tanks)
+    windows: dict[tuple[str, str], tuple[int, int]] = {}
+    metrics = {'requests': 0, 'errors': 0, 'rate_limited': 0, 'bytes_sent': 0}
+
+    def error(message: str, code: int) -> web.Response:
+        return web.json_response(
+            {'status': 'error', 'error': {'field': None, 'message': message, 'code': code, 'value': None}}
+        )
+
+    @web.middleware
+    async def emulation(request: web.Request, handler) -> web.StreamResponse:
+        if request.path.startswith('/_'):
+            return await handler(request)
+
+        metrics['requests'] += 1
+        await asyncio.sleep(max(0.0, random.gauss(settings.latency, settings.jitter)))
+
+        if random.random() < settings.error_rate:
+            metrics['errors'] += 1
+            if random.random() < 0.5:
+                return web.Response(status=504, text='<html><body>504 Gateway Time-out</body></html>', content_type='text/html')
+            return error('SOURCE_NOT_AVAILABLE', 504)
+
+        if settings.rate_limit and 'application_id' in request.query:
+            key = (request.match_info.get('host', ''), request.query['application_id'])
+            second = int(monotonic())
+            window, count = windows.get(key, (second, 0))
+            count = count + 1 if window == second else 1
+            windows[key] = (second, count)
+
+            if count > settings.rate_limit:
+                metrics['rate_limited'] += 1
+                return error('REQUEST_LIMIT_EXCEEDED', 407)
+
+        response = await handler(request)
+        metrics['bytes_sent'] += response.content_length or 0
+        return response
+
+    def envelope(request: web.Request, endpoint: str) -> web.Response:
+        account_ids = [int(value) for value in request.query.get('account_id', '').split(',') if value.isdigit()]
+        if not account_ids:
+            return error('ACCOUNT_ID_NOT_SPECIFIED', 402)
+
+        fields = request.query.get('fields', '')
+        data = {}
+        for account_id in account_ids:
+            account = fixtures.get(endpoint, account_id)
+            if isinstance(account, list):
+                account = [project(item, fields) for item in account]
+            else:
+                account = project(account, fields)
+            data[str(account_id)] = account
+
+        return web.json_response({'status': 'ok', 'meta': {'count': len(data)}, 'data': data})
+
+    async def account_list(request: web.Request) -> web.Response:
+        search = request.query.get('search', '').strip()
+        if len(search) < 3:
+            return error('INVALID_SEARCH', 407)
+
+        # The values of the `account/list` URL templates are followed by spaces as well
+        exact = request.query.get('type', '').strip() == 'exact'
+        found = fixtures.find(request.match_info['host'], search, exact, int(request.query.get('limit', 100)))
+        return web.json_response({'status': 'ok', 'meta': {'count': len(found)}, 'data': found})
+
+    async def account_info(request: web.Request) -> web.Response:
+        return envelope(request, 'account_info')
+
+    async def achievements(request: web.Request) -> web.Response:
+        return envelope(request, 'achievements')
+
+    async def clan_info(request: web.Request) -> web.Response:
+        return envelope(request, 'clan_info')
+
+    async def tanks_stats(request: web.Request) -> web.Response:
+        return envelope(request, 'tanks_stats')
+
+    async def vehicles(request: web.Request) -> web.Response:
+        fields = request.query.get('fields', '')
+        data = {tank_id: project(vehicle, fields) for tank_id, vehicle in fixtures.vehicles.items()}
+        return web.json_response({'status': 'ok', 'meta': {'count': len(data)}, 'data': data})
+
+    async def leaderboard(request: web.Request) -> web.Response:
+        return web.json_response(fixtures.get('leaderboard', int(request.match_info['account_id'])))
+
+    async def get_metrics(request: web.Request) -> web.Response:
+        return web.json_response(metrics)
+
+    application = web.Application(middlewares=[emulation])
+    application.add_routes(
+        [
+            # The `account/list` URL templates have a space after the path
+            web.get('/{host}/wotb/account/list/{tail:.*}', account_list),
+            web.get('/{host}/wotb/account/info/', account_info),
+            web.get('/{host}/wotb/account/achievements/', achievements),
+            web.get('/{host}/wotb/clans/accountinfo/', clan_info),
+            web.get('/{host}/wotb/tanks/stats/', tanks_stats),
+            web.get('/{host}/wotb/encyclopedia/vehicles/', vehicles),
+            web.get('/{host}/{lang}/api/rating-leaderboards/user/{account_id}', leaderboard),
+            web.get('/_metrics', get_metrics),
+        ]
+    )
+    return application
+
+
+@app.command()
+def run(
+        host: str = '127.0.0.1',
+        port: int = 8100,
+        latency: float = 0.05,
+        jitter: float = 0.02,
+        error_rate: float = 0.0,
+        rate_limit: int = 20,
+        tanks: int = typer.Option(None, help='Number of tanks of accounts without a recorded fixture'),
+    ):
+    settings = FakeApiSettings(
+        latency=latency,
+        jitter=jitter,
+        error_rate=error_rate,
+        rate_limit=rate_limit,
+        tanks=tanks
+    )
+    typer.echo(f'Fake API: {settings}')
+    web.run_app(create_app(settings), host=host, port=port)
+
+
+if __name__ == '__main__':
+    app()
+
+# use: python -m dev_tools.fake_api.server --latency 0.1 --error-rate 0.01 --rate-limit 20 --tanks 400
+# and set `game_api.fake_api.enabled: true` in settings.yaml, the API client sends all game API requests here
+# record real responses into the fixtures with: python -m dev_tools.fake_api.record <region> <account_id> ...
@@ -0,0 +1,75 @@
+import json
+import sys
+from timeit import Timer
+
+from colorama import Fore, Style, init
+
+from lib.data_classes.api.tanks_stats import TanksStatsResponse
+from lib.utils import json_backend
+
+init(autoreset=True)
+
+# benchmark settings
+REPEAT = 5
+SYNTHETIC_TANKS = 400
+TOOL_NAME = f'{Fore.CYAN}JSON benchmark{Fore.RESET}: '
+
+
+def synthetic_payload(tanks: int = SYNTHETIC_TANKS) -> bytes:
+    """
+    Builds a `tanks/stats` response of a single account with `tanks` tanks.
+    """
+    stats = {
+        key: 1000 for key in (
+            'spotted', 'hits', 'frags', 'max_xp', 'wins', 'losses', 'capture_points', 'battles', 'damage_dealt',
+            'damage_received', 'max_frags', 'shots', 'frags8p', 'xp', 'win_and_survived', 'survived_battles',
+            'dropped_capture_points'
+        )
+    }
+    data = [
+        {
+            'all': stats,
+            'last_battle_time': 1700000000 + tank_id,
+            'account_id': 1,
+            'max_xp': 1500,
+            'in_garage_updated': 1700000000,
+            'max_frags': 5,
+            'frags': None,
+            'mark_of_mastery': 3,
+            'battle_life_time': 100000,
+            'in_garage': None,
+            'tank_id': tank_id
+        } for tank_id in range(tanks)
+    ]
+    return json.dumps({'status': 'ok', 'meta': {'count': 1}, 'data': {'1': data}}).encode()
+
+
+def run(name: str, raw: bytes) -> None:
+    cases = {
+        'json.loads(text)': lambda: json.loads(raw.decode()),
+        f'json_backend.loads ({json_backend.BACKEND})': lambda: json_backend.loads(raw),
+    }
+    if 'tanks_stats' in name or name == 'synthetic':
+        cases['json.loads + model_validate'] = lambda: TanksStatsResponse.model_validate(json.loads(raw))
+        cases['model_validate_json'] = lambda: TanksStatsResponse.model_validate_json(raw)
+        cases[f'json_backend.validate ({json_backend.BACKEND})'] = lambda: json_backend.validate(TanksStatsResponse, raw)
+
+    print(f'{TOOL_NAME}{Fore.YELLOW}{name}{Fore.RESET} ({len(raw) / 1024:.1f} KiB)')
+    for case, func in cases.items():
+        timer = Timer(func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(REPEAT, number)) / number
+        print(f'    {case:<40}{Style.BRIGHT}{best * 1000:8.3f} ms')
+
+
+if len(sys.argv) > 1:
+    for path in sys.argv[1:]:
+        with open(path, 'rb') as f:
+            run(path, f.read())
+else:
+    run('synthetic', synthetic_payload())
+
+# use: python -m dev_tools.json_benchmark [payload.json ...]
+# compares the JSON decoding paths of API.response_handler,
+# payloads are raw API responses saved to files, a 400 tanks `tanks/stats` response is generated if none are given.
+# files with `tanks_stats` in the name are also validated into TanksStatsResponse
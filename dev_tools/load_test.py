@@ -0,0 +1,344 @@
+import asyncio
+import json
+from collections import defaultdict
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from statistics import mean
+from time import monotonic, perf_counter
+
+import typer
+
+from cogs.session import Session
+from cogs.stats import Stats
+from lib.api.async_wotb_api import API
+from lib.api.http_session import HttpSessionManager
+from lib.api.rate_limiter import RequestPriority, request_priority
+from lib.data_classes.api.api_data import PlayerGlobalData
+from lib.data_classes.db_player import AccountSlotsEnum, GameAccount, SessionSettings
+from lib.data_parser.parse_data import get_normalized_data
+from lib.database.players import PlayersDB
+from lib.database.servers import ServersDB
+from lib.exceptions.api import DeadlineExceeded
+from lib.image import common as image_common
+from lib.image import session as image_session
+from lib.locale.locale import Text
+from lib.settings.settings import Config
+from lib.utils.deadline import deadline
+
+import cogs.session
+
+_config = Config().get()
+app = typer.Typer()
+
+MEMBER_ID_BASE = 900_000_000_000_000_000   # Discord IDs of the virtual users, far from the real ones
+GAME_ID_BASE = 800_000_000
+STAGES = ('db', 'api', 'diff', 'render', 'png_encode', 'other')
+COUNTERS = (
+    'spotted', 'hits', 'frags', 'wins', 'losses', 'capture_points', 'damage_dealt', 'damage_received',
+    'shots', 'frags8p', 'xp', 'win_and_survived', 'survived_battles', 'dropped_capture_points'
+)
+
+# Time accumulator of the request the current task works for, and of the innermost running stage
+_request: ContextVar[dict[str, float] | None] = ContextVar('request', default=None)
+_children: ContextVar[list[float] | None] = ContextVar('children', default=None)
+
+
+@contextmanager
+def measure(stage: str):
+    """
+    Adds the time spent in the block to `stage` of the current request.
+    Time spent in nested stages is counted only to the nested ones.
+    """
+    times = _request.get()
+    if times is None:
+        yield
+        return
+
+    parent = _children.get()
+    children = [0.0]
+    token = _children.set(children)
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = perf_counter() - start
+        _children.reset(token)
+        times[stage] += max(0.0, elapsed - children[0])
+        if parent is not None:
+            parent[0] += elapsed
+
+
+def probe(stage: str, func: Callable) -> Callable:
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with measure(stage):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with measure(stage):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def install_probes(api: API) -> None:
+    """
+    Wraps the stages of the pipelines with timing probes, the production code is not changed.
+    """
+    for db in (PlayersDB(), ServersDB(), api.stats_cache.db, api.nicknames):
+        for name in dir(db):
+            method = getattr(db, name)
+            if not name.startswith('_') and asyncio.iscoroutinefunction(method):
+                setattr(db, name, probe('db', method))
+
+    api.get_stats = probe('api', api.get_stats)
+    cogs.session.get_session_stats = probe('diff', cogs.session.get_session_stats)
+    image_common.ImageGenCommon.generate = probe('render', image_common.ImageGenCommon.generate)
+    image_session.ImageGenSession.generate = probe('render', image_session.ImageGenSession.generate)
+    image_common.img_to_readable_buffer = probe('png_encode', image_common.img_to_readable_buffer)
+    image_session.img_to_readable_buffer = probe('png_encode', image_session.img_to_readable_buffer)
+
+
+class FakeGuild:
+    id = 0
+    name = 'load test'
+
+
+class FakeContext:
+    """
+    Stands in for `ApplicationContext`, the pipelines only read the guild and the author and respond on errors.
+    """
+    def __init__(self, member_id: int) -> None:
+        self.guild = FakeGuild()
+        self.author = type('Author', (), {'id': member_id})()
+        self.responses = []
+
+    async def respond(self, *args, **kwargs) -> None:
+        self.responses.append(kwargs.get('embed'))
+
+
+def rewind(stats: PlayerGlobalData, battles: int, tanks: int) -> PlayerGlobalData:
+    """
+    Makes an older snapshot of the stats, as if the last `battles` battles were played on `tanks` tanks,
+    so the session pipeline has a difference to render.
+    """
+    data = stats.model_dump()
+
+    def scale(block: dict | None, played: int) -> None:
+        if block is None:
+            return
+
+        played = min(played, block['battles'] - 1)
+        if played <= 0:
+            return
+
+        factor = (block['battles'] - played) / block['battles']
+        for key in COUNTERS:
+            if block.get(key) is not None:
+                block[key] = int(block[key] * factor)
+        block['battles'] -= played
+
+    scale(data['data']['statistics']['all'], battles)
+    scale(data['data']['statistics']['rating'], battles // 10)
+    for tank in list(data['data']['tank_stats'].values())[:tanks]:
+        scale(tank['all'], max(1, battles // tanks))
+        tank['last_battle_time'] -= 86400
+
+    return get_normalized_data(PlayerGlobalData.model_validate(data))
+
+
+async def seed(users: int, region: str, session_battles: int) -> None:
+    db = PlayersDB()
+    api = API()
+
+    for index in range(users):
+        member_id = MEMBER_ID_BASE + index
+        game_id = GAME_ID_BASE + index
+        await db.set_member(
+            AccountSlotsEnum.slot_1,
+            member_id,
+            GameAccount(nickname=f'load_test_{index}', game_id=game_id, region=region),
+            slot_override=True
+        )
+        stats = await api.get_stats(region=region, game_id=game_id)
+        await db.start_session(
+            AccountSlotsEnum.slot_1,
+            member_id,
+            rewind(stats, session_battles, tanks=5),
+            SessionSettings()
+        )
+
+
+async def cleanup(users: int) -> None:
+    for index in range(users):
+        await PlayersDB().delete_member(MEMBER_ID_BASE + index)
+
+
+def percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+async def benchmark(
+        scenario: str,
+        users: int,
+        duration: float,
+        region: str,
+        session_battles: int,
+        keep: bool
+    ) -> dict:
+    Text().load(_config.default.lang)
+    api = API()
+    stats_cog = Stats(None)
+    session_cog = Session(None)
+
+    typer.echo(f'Seeding {users} virtual users...', err=True)
+    await seed(users, region, session_battles)
+    install_probes(api)
+
+    budget = _config.deadline.deferred
+    latencies: list[float] = []
+    stages: list[dict[str, float]] = []
+    errors: dict[str, int] = defaultdict(int)
+    deadline_misses = 0
+
+    async def request(index: int) -> None:
+        member_id = MEMBER_ID_BASE + index
+        ctx = FakeContext(member_id)
+        member = await PlayersDB().get_member(member_id)
+
+        if scenario == 'stats':
+            image = await stats_cog.get_stats(
+                ctx,
+                region=region,
+                slot=AccountSlotsEnum.slot_1,
+                game_id=GAME_ID_BASE + index,
+                requested_by=member
+            )
+            if image is None:
+                raise RuntimeError(ctx.responses[-1].description if ctx.responses else 'no image')
+        else:
+            await session_cog._generate_image(ctx, member, AccountSlotsEnum.slot_1)
+
+    async def virtual_user(index: int, end: float) -> None:
+        nonlocal deadline_misses
+
+        while monotonic() < end:
+            times = defaultdict(float)
+            token = _request.set(times)
+            start = perf_counter()
+            try:
+                # The same context a slash command runs in, see `with_user_context_wrapper`
+                with deadline(budget), request_priority(RequestPriority.INTERACTIVE):
+                    await request(index)
+            except DeadlineExceeded:
+                deadline_misses += 1
+                errors['DeadlineExceeded'] += 1
+                continue
+            except Exception as e:
+                errors[type(e).__name__] += 1
+                continue
+            finally:
+                _request.reset(token)
+
+            elapsed = perf_counter() - start
+            if elapsed > budget:
+                deadline_misses += 1
+
+            times['other'] = max(0.0, elapsed - sum(times.values()))
+            latencies.append(elapsed)
+            stages.append(dict(times))
+
+    typer.echo(f'Running {scenario} with {users} users for {duration} s...', err=True)
+    start = monotonic()
+    await asyncio.gather(*[virtual_user(index, start + duration) for index in range(users)])
+    elapsed = monotonic() - start
+
+    if not keep:
+        await cleanup(users)
+    await HttpSessionManager().close()
+
+    return {
+        'scenario': scenario,
+        'users': users,
+        'duration': round(elapsed, 3),
+        'fake_api': _config.game_api.fake_api.enabled,
+        'requests': len(latencies),
+        'errors': dict(errors),
+        'deadline_budget': budget,
+        'deadline_misses': deadline_misses,
+        'throughput_rps': round(len(latencies) / elapsed, 3),
+        'latency_ms': {
+            'mean': round(mean(latencies) * 1000, 2) if latencies else 0.0,
+            'p50': round(percentile(latencies, 50) * 1000, 2),
+            'p95': round(percentile(latencies, 95) * 1000, 2),
+            'p99': round(percentile(latencies, 99) * 1000, 2),
+            'max': round(max(latencies, default=0.0) * 1000, 2),
+        },
+        'stages_ms': {
+            stage: {
+                'mean': round(mean(times) * 1000, 2) if times else 0.0,
+                'p95': round(percentile(times, 95) * 1000, 2),
+            }
+            for stage in STAGES
+            for times in [[request.get(stage, 0.0) for request in stages]]
+        },
+        'api': {
+            # Keyed by region and the index of the application ID, the IDs themselves are not reported
+            'rate_limits': {
+                f'{host}:{index}': rate for index, ((host, _), rate) in enumerate(api.rate_limiters.get_rates().items())
+            },
+            'circuit_breakers': {region: state.value for region, state in api.circuit_breakers.get_states().items()},
+            'hedging': api.hedging.get_metrics(),
+            'stats_cache': api.stats_cache.get_metrics(),
+            'http': HttpSessionManager().get_metrics(),
+        },
+    }
+
+
+@app.command()
+def run(
+        scenario: str = typer.Option('stats', help='stats or session'),
+        users: int = typer.Option(10, help='Number of concurrent virtual users'),
+        duration: float = typer.Option(30, help='Run time, seconds'),
+        region: str = 'eu',
+        session_battles: int = typer.Option(25, help='Battles in the seeded sessions'),
+        fake_api: bool = typer.Option(True, help='Send the game API requests to dev_tools/fake_api'),
+        stats_cache: bool = typer.Option(True, help='Use the stats cache, disable to load the API on every request'),
+        keep: bool = typer.Option(False, help='Keep the virtual users in the database'),
+        output: str = typer.Option(None, help='Write the JSON report to a file instead of stdout'),
+    ):
+    if scenario not in ('stats', 'session'):
+        raise typer.BadParameter('scenario must be stats or session')
+
+    _config.game_api.fake_api.enabled = fake_api
+    if not stats_cache:
+        _config.game_api.stats_cache.ttl = 0
+        _config.game_api.stats_cache.stale_ttl = 0
+
+    report = asyncio.run(benchmark(scenario, users, duration, region, session_battles, keep))
+    report['stats_cache_enabled'] = stats_cache
+
+    if output is None:
+        typer.echo(json.dumps(report, indent=2))
+    else:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    app()
+
+# use: python -m dev_tools.fake_api.server --tanks 400
+#      python -m dev_tools.load_test --scenario session --users 50 --duration 60 --output session_50.json
+# drives Stats.get_stats or Session._generate_image without Discord against the local MongoDB,
+# the virtual users are created in the players database before the run and deleted after it
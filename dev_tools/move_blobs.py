@@ -0,0 +1,11 @@
+import asyncio
+
+from lib.database.players import PlayersDB
+
+
+if __name__ == '__main__':
+    asyncio.run(PlayersDB().move_blobs())
+
+# use: python -m dev_tools.move_blobs
+# moves the background images and the session snapshots stored inline in the players documents
+# to the `images` and `last_stats` collections, safe to run again
@@ -1,11 +1,10 @@
-from aiohttp import ClientSession
+from lib.api.http_session import HttpSessionManager
 
 
 class DiscordApi:
     def __init__(self) -> None:
-        pass
+        self.http = HttpSessionManager()
 
     async def get_user_data(self, access_token: str) -> dict:
-        async with ClientSession() as session:
-            async with session.get('https://discord.com/api/v9/users/@me', headers={'Authorization': f'Bearer {access_token}'}) as response:
-                return await response.json()
\ No newline at end of file
+        async with self.http.session.get('https://discord.com/api/v9/users/@me', headers={'Authorization': f'Bearer {access_token}'}) as response:
+            return await response.json()
\ No newline at end of file
@@ -1,71 +1,96 @@
 from collections.abc import Callable
-from typing import Dict, Union
-from datetime import datetime
-from time import time
+from functools import partial
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, urlsplit, urlunsplit
+from time import monotonic
+import contextvars
 import traceback
 import asyncio
-import atexit
-import json
 
 import pytz
 import aiohttp
 from the_retry import retry
-from asynciolimiter import Limiter
-from pydantic import ValidationError
-from cacheout import FIFOCache, Cache
+from pydantic import BaseModel, ValidationError
+from cacheout import Cache
 from aiohttp.client_exceptions import ClientConnectionError
 
-from lib.data_classes.api.api_data import PlayerGlobalData
-from lib.data_classes.api.player_achievements import Achievements
-from lib.data_classes.api.player_clan_stats import ClanStats
-from lib.data_classes.api.player_stats import PlayerStats
+from lib.data_classes.api.api_data import Player, PlayerGlobalData
+from lib.data_classes.api.player_achievements import AccountAchievements, Achievements, AchievementsResponse
+from lib.data_classes.api.player_clan_stats import ClanData, ClanStatsResponse
+from lib.data_classes.api.player_stats import PlayerData, PlayerStats
 from lib.data_classes.api.rating_leaderboard import RatingLeaderboardAPIResponse
-from lib.data_classes.api.tanks_stats import TankStats
+from lib.data_classes.api.tanks_stats import TankStats, TanksStatsResponse
 from lib.data_classes.db_player import DBPlayer, GameAccount
+from lib.data_classes.stats_cache import StatsCacheEntry
 from lib.data_classes.tankopedia import Tank
+from lib.api.rate_limiter import (
+    AdaptiveLimiter, 
+    RateLimiterRegistry, 
+    RequestPriority, 
+    get_request_priority, 
+    request_priority
+)
+from lib.api.circuit_breaker import CircuitBreakerRegistry
+from lib.api.hedging import HedgingPolicy
+from lib.api.http_session import HttpSessionManager
+from lib.api.stats_cache import StatsCache
+from lib.database.nicknames import NicknamesDB
 from lib.database.players import PlayersDB
 from lib.data_parser.parse_data import get_normalized_data
 from lib.exceptions import api as api_exceptions
 from lib.logger.logger import get_logger
 from lib.settings.settings import Config, EnvConfig
+from lib.utils import json_backend
 from lib.utils.singleton_factory import singleton
 from lib.utils.string_parser import insert_data
 from lib.utils.api_timeout_handler import timeout_handler
+from lib.utils.api_fields import get_api_fields
+from lib.utils.deadline import check_deadline, deadline, get_remaining
 
 _log = get_logger(__file__, 'AsyncWotbAPILogger', 'logs/async_wotb_api.log')
 _config = Config().get()
 _custom_timeout = aiohttp.ClientTimeout(total=10, connect=4, sock_read=2, sock_connect=4)
+_ACCOUNTS_PER_REQUEST = 100  # WG / Lesta API limit of comma-separated account_id values
+_MISSING = object()  # Cache miss marker, None is a valid cached clan
+
+# Server-side projections of the responses, derived from the models that consume them
+_player_fields = get_api_fields(PlayerData)
+_achievements_fields = get_api_fields(AccountAchievements)
+_clan_fields = get_api_fields(ClanData)
+_tank_fields = get_api_fields(TankStats)
+_tankopedia_fields = get_api_fields(Tank, exclude=('id',))  # The tank ID is the key of the `data` section
 
 
 @singleton
 class API:
     def __init__(self) -> None:
-        self.exact = True
-        self.raw_dict = False
-        self._players_stats = []
-        self.start_time = 0
-        self.rate_limiter = Limiter(19)
+        self.rate_limiters = RateLimiterRegistry(_config.game_api.rate_limit)
+        self.circuit_breakers = CircuitBreakerRegistry(_config.game_api.circuit_breaker)
+        self.hedging = HedgingPolicy(_config.game_api.hedging, _config.game_api.rate_limit.rate)
         self.rating_leaderboard_num_cache = Cache(ttl=210)
-        self.cache = FIFOCache(maxsize=100, ttl=60)
+        self.stats_cache = StatsCache(_config.game_api.stats_cache)
+        # Clan membership and achievements change far less often than battle counts
+        self.clan_cache = Cache(
+            maxsize=_config.game_api.slow_data_cache.max_size,
+            ttl=_config.game_api.slow_data_cache.clan_ttl
+        )
+        self.achievements_cache = Cache(
+            maxsize=_config.game_api.slow_data_cache.max_size,
+            ttl=_config.game_api.slow_data_cache.achievements_ttl
+        )
+        self._in_flight: dict[tuple[int, str], tuple[asyncio.Task, RequestPriority]] = {}
+        self._refreshing: dict[tuple[int, str], asyncio.Task] = {}
         self.pdb = PlayersDB()
-        self.session = aiohttp.ClientSession()
-        self._session = self.session
-
-        self.player_stats = {}
-        self.player = {}
-        
-        atexit.register(self.__at_exit__)
+        self.nicknames = NicknamesDB()
+        self.http = HttpSessionManager()
     
     @property
     def session(self) -> aiohttp.ClientSession:
-        if self._session.closed:
-            self._session = aiohttp.ClientSession()
-        
-        return self._session
+        return self.http.session
 
     @session.setter
     def session(self, session: aiohttp.ClientSession) -> None:
-        self._session = session
+        self.http.session = session
 
     def _get_id_by_reg(self, reg: str) -> str:
         reg = reg.lower()
@@ -76,6 +101,16 @@ class API:
             _log.debug(f'Used app ID: {tok}')
             return tok
         raise api_exceptions.UncorrectRegion(f'Uncorrect region: {reg}')
+    
+    def _get_other_id_by_reg(self, reg: str, app_id: str) -> str:
+        """
+        Returns an application ID of the region other than `app_id`, if there is one.
+        """
+        other_id = self._get_id_by_reg(reg)
+        if other_id == app_id:
+            other_id = self._get_id_by_reg(reg)
+            
+        return other_id
 
     def _reg_normalizer(self, reg: str) -> str:
         if reg in {'ru', 'eu', 'asia'}:
@@ -85,6 +120,149 @@ class API:
         else:
             raise api_exceptions.UncorrectRegion(f'Uncorrect region: {reg}')
         
+    async def _request(
+            self,
+            region: str,
+            url: str,
+            params: dict[str, str | int] | None = None,
+            timeout: aiohttp.ClientTimeout = _custom_timeout,
+            hedge: bool = False,
+            **handler_kwargs
+            ) -> dict | BaseModel:
+        """
+        Sends a GET request to the game API of the region and returns the handled response data.
+
+        The application ID is picked before waiting for the rate limiter,
+        so the request is throttled by the bucket of its own `(region, app_id)` pair.
+        While the circuit breaker of the region is open, the request fails without waiting.
+        The wait for the rate limiter and the request itself are bounded by the deadline of the current task.
+
+        Args:
+            region (str): The region of the API.
+            url (str): URL template from `settings.yaml -> game_api.urls`. `<reg_url>` and `<app_id>` are inserted here.
+            params (dict[str, str | int] | None): Other values to insert into the URL template.
+            timeout (aiohttp.ClientTimeout): The request timeout.
+            hedge (bool): Whether a duplicate is sent with another application ID if the response is slow,
+            see `HedgingPolicy`.
+            **handler_kwargs: Arguments passed to `response_handler`.
+
+        Raises:
+            api_exceptions.RegionUnavailable: If the circuit breaker of the region is open.
+            api_exceptions.DeadlineExceeded: If the deadline of the current task has passed.
+
+        Returns:
+            dict | BaseModel: The data returned from the API as a dictionary, or as the `model` passed to `response_handler`.
+        """
+        breaker = self.circuit_breakers.get(self._reg_normalizer(region))
+        
+        with breaker.guard():
+            if hedge:
+                return await self._send_hedged(region, url, params, timeout, **handler_kwargs)
+            
+            return await self._send(region, url, params, timeout, **handler_kwargs)
+    
+    async def _send(
+            self,
+            region: str,
+            url: str,
+            params: dict[str, str | int] | None = None,
+            timeout: aiohttp.ClientTimeout = _custom_timeout,
+            app_id: str | None = None,
+            sent: asyncio.Event | None = None,
+            **handler_kwargs
+            ) -> dict:
+        """
+        Waits for the rate limiter and sends a single request, see `_request`.
+
+        Args:
+            app_id (str | None): The application ID to use, the next one of the region if not set.
+            sent (asyncio.Event | None): Set once the request has passed the rate limiter.
+        """
+        endpoint = urlparse(url).path
+        check_deadline(endpoint)
+        
+        app_id = app_id or self._get_id_by_reg(region)
+        limiter = self.rate_limiters.get(self._reg_normalizer(region), app_id)
+        url = self._route_url(
+            insert_data(
+                url,
+                {
+                    'reg_url': self._get_url_by_reg(region),
+                    'app_id': app_id,
+                    **(params or {})
+                }
+            )
+        )
+        
+        try:
+            async with asyncio.timeout(get_remaining()):
+                await limiter.wait()
+                if sent is not None:
+                    sent.set()
+                    
+                start_time = monotonic()
+                async with self.session.get(url, verify_ssl=False, timeout=timeout) as response:
+                    data = await self.response_handler(response, limiter=limiter, **handler_kwargs)
+        except TimeoutError:
+            # A timeout caused by the deadline is not a failure of the API
+            check_deadline(endpoint)
+            raise
+            
+        self.hedging.record(endpoint, self._reg_normalizer(region), monotonic() - start_time)
+        return data
+    
+    async def _send_hedged(
+            self,
+            region: str,
+            url: str,
+            params: dict[str, str | int] | None = None,
+            timeout: aiohttp.ClientTimeout = _custom_timeout,
+            **handler_kwargs
+            ) -> dict:
+        """
+        Sends a request and, if it has not been answered within the hedge delay, a duplicate of it
+        with another application ID. The first successful response is returned, the other request is cancelled.
+        """
+        delay = self.hedging.get_delay(urlparse(url).path, self._reg_normalizer(region))
+        if delay is None:
+            return await self._send(region, url, params, timeout, **handler_kwargs)
+        
+        app_id = self._get_id_by_reg(region)
+        sent = asyncio.Event()
+        primary = asyncio.create_task(self._send(region, url, params, timeout, app_id=app_id, sent=sent, **handler_kwargs))
+        tasks = {primary}
+        waiter = asyncio.create_task(sent.wait())
+        
+        try:
+            # The hedge delay counts from the moment the request has left the rate limiter
+            await asyncio.wait({primary, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self.hedging.acquire(self._reg_normalizer(region)):
+                return await primary
+            
+            _log.debug(f'No response in {delay:.2f} s, sending a hedged request to {urlparse(url).path}')
+            tasks.add(
+                asyncio.create_task(
+                    self._send(region, url, params, timeout, app_id=self._get_other_id_by_reg(region, app_id), **handler_kwargs)
+                )
+            )
+            
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedging.hedges_won += 1
+                        return task.result()
+            
+            # Both requests have failed
+            return primary.result()
+        finally:
+            waiter.cancel()
+            for task in tasks:
+                task.cancel()
+        
     async def response_handler(
             self,
             response: aiohttp.ClientResponse, 
@@ -92,28 +270,37 @@ class API:
             check_count: bool = True,
             check_battles: bool = False,
             check_data: bool = False,
-            check_meta: bool = False
-            ) -> dict: 
+            check_meta: bool = False,
+            limiter: AdaptiveLimiter | None = None,
+            model: type[BaseModel] | None = None
+            ) -> dict | BaseModel: 
         """
         Asynchronously handles the response from the API and returns the data as a dictionary.
+        
+        The body is read as bytes and parsed by `json_backend`. If `model` is set, the body is validated
+        straight into it by `json_backend.validate`. A body that does not match the model (e.g. an error response)
+        is parsed as a dictionary and goes through the usual checks.
 
         Args:
             response (aiohttp.ClientResponse): The response object received from the API.
             check_data_status (bool, optional): Flag to indicate whether to check the status of the data. Defaults to True.
+            limiter (AdaptiveLimiter | None, optional): The rate limiter the request passed through, it is penalized if the request limit is exceeded.
+            model (type[BaseModel] | None, optional): The response model to validate the body into.
 
         Raises:
             api_exceptions.APIError: Raised if the response status is not 200 or the data status is not 'ok'.
             api_exceptions.NeedMoreBattlesError: Raised if the number of battles is less than 100 (Optional).
             api_exceptions.RequestsLimitExceeded: Raised if the request limit is exceeded.
             api_exceptions.EmptyDataError: Raised if the data is empty.
-            api_exceptions.APISourceNotAvailable: Raised if the API source is not available (code 504).
+            api_exceptions.APISourceNotAvailable: Raised if the API source is not available (code 502, 503 or 504).
+            ValidationError: Raised if the body is a valid response that does not match `model`.
         Returns:
-            dict: The data returned from the API as a dictionary.
+            dict | BaseModel: The data returned from the API as a dictionary, or as `model` if it is set.
         """
         
-        data = await response.text()
-        data = json.loads(data)
-        if response.status == 504:
+        raw = await response.read()
+        # Gateway errors come with an HTML body
+        if response.status in {502, 503, 504}:
             raise api_exceptions.APISourceNotAvailable()
         if response.status == 407:
             raise api_exceptions.UncorrectName('Uncorrect nickname')
@@ -121,11 +308,22 @@ class API:
         if response.status != 200:
             _log.error(f'Error get data, bad response code: {response.status}')
             raise api_exceptions.APIError()
+        
+        validation_error = None
+        if model is not None:
+            try:
+                return json_backend.validate(model, raw)
+            except ValidationError as e:
+                validation_error = e
+        
+        data = json_backend.loads(raw)
 
         if check_data_status:
             if data['status'] != 'ok':
                 if data['error']['message'] == 'REQUEST_LIMIT_EXCEEDED':
                     _log.warning('Ignoring Exception caused by API: Request Limit Exceeded')
+                    if limiter is not None:
+                        limiter.penalize()
                     raise api_exceptions.RequestsLimitExceeded('Rate Limit Exceeded')
                 
                 elif data['error']['message'] == 'INVALID_SEARCH':
@@ -169,9 +367,24 @@ class API:
             elif isinstance(data['data'], dict):
                 if data['data'][list(data['data'].keys())[0]]['statistics']['all']['battles'] < 1:
                     raise api_exceptions.NeedMoreBattlesError('Need more battles')
+        
+        if validation_error is not None:
+            raise validation_error
             
         return data
 
+    def _route_url(self, url: str) -> str:
+        """
+        Sends the request to the fake API server (`dev_tools/fake_api`) if `game_api.fake_api` is enabled,
+        the regional host becomes the first segment of the path: `https://<host>/<path>` -> `<fake_api.url>/<host>/<path>`.
+        """
+        if not _config.game_api.fake_api.enabled:
+            return url
+        
+        fake_api = urlsplit(_config.game_api.fake_api.url)
+        parts = urlsplit(url)
+        return urlunsplit(parts._replace(scheme=fake_api.scheme, netloc=fake_api.netloc, path=f'/{parts.netloc}{parts.path}'))
+
     def _get_url_by_reg(self, reg: str):
         reg = self._reg_normalizer(reg)
         match reg:
@@ -186,67 +399,73 @@ class API:
             case _:
                 raise api_exceptions.UncorrectRegion(f'Uncorrect region: {reg}')
     
-    def get_players_callback(self, task: asyncio.Task) -> PlayerStats:
-        self._players_stats.append(task.result())
-    
     async def get_players_stats(self, players_id: list[int], region: str) -> list[PlayerStats | bool]:
         """
         Retrieves the statistics of multiple players based on their IDs and region.
 
+        IDs are sent to the `account/info` endpoint in comma-separated batches of up to
+        `_ACCOUNTS_PER_REQUEST` accounts, so a whole replay costs a single request.
+
         Parameters:
             players_id (list[int]): A list of player IDs.
             region (str): The region of the players.
 
         Returns:
-            list[PlayerStats | bool]: A list of PlayerStats objects representing the statistics of each player. If an error occurs during the retrieval, a boolean value indicating the success of the operation is returned.
+            list[PlayerStats | bool]: PlayerStats objects in the same order as `players_id`. If the statistics of a player can't be retrieved, False is placed instead.
         """
-        self._players_stats = []
+        chunks = [
+            players_id[i:i + _ACCOUNTS_PER_REQUEST] 
+            for i in range(0, len(players_id), _ACCOUNTS_PER_REQUEST)
+        ]
         
-        async with self.session:
-            async with asyncio.TaskGroup() as tg:
-                for i in players_id:
-                    tg.create_task(self._get_players_stats(i, region, self.session))
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self._get_players_stats(chunk, region=region)) for chunk in chunks]
+        
+        players_stats: dict[int, PlayerStats] = {}
+        for task in tasks:
+            players_stats.update(task.result())
             
-            return self._players_stats
+        return [players_stats.get(int(player_id), False) for player_id in players_id]
     
     @timeout_handler()
-    async def _get_players_stats(self, player_id: int, region: str) -> None:
+    async def _get_players_stats(self, players_id: list[int], region: str) -> dict[int, PlayerStats]:
         """
-        Asynchronously gets the player stats for a given player ID and region.
+        Asynchronously gets the stats of a batch of players with one `account/info` request.
 
         Parameters:
-            player_id (int): The ID of the player.
-            region (str): The region of the player.
-            session (aiohttp.ClientSession): The HTTP session for making requests.
+            players_id (list[int]): The IDs of the players, no more than `_ACCOUNTS_PER_REQUEST`.
+            region (str): The region of the players.
 
         Returns:
-            None
+            dict[int, PlayerStats]: The stats of the players by account ID. Players without data are omitted.
         """
-        await self.rate_limiter.wait()
+        try:
+            data = await self._request(
+                region,
+                _config.game_api.urls.get_stats,
+                {'player_id': ','.join(str(player_id) for player_id in players_id), 'fields': _player_fields}
+            )
+        except api_exceptions.APIError:
+            _log.debug(f'Error get players stats\n{traceback.format_exc()}')
+            return {}
         
-        url_get_stats = insert_data(
-            _config.game_api.urls.get_stats,
-            {
-                'reg_url' : self._get_url_by_reg(region),
-                'app_id': self._get_id_by_reg(region),
-                'player_id': player_id
-            }
-        )
-        async with self.session.get(url_get_stats, verify_ssl=False, timeout=_custom_timeout) as response:
+        players_stats: dict[int, PlayerStats] = {}
+        for account_id, player_data in data['data'].items():
+            if player_data is None:
+                continue
+            
             try:
-                data = await self.response_handler(response, check_battles=False, check_data=True)
-            except api_exceptions.EmptyDataError:
-                _log.debug(f'Error get player stats\n{traceback.format_exc()}')
-                self._players_stats.append(False)
-            except api_exceptions.APIError:
-                _log.debug(f'Error get player stats\n{traceback.format_exc()}')
-                self._players_stats.append(False)
-            else:
-                account_id = list(data['data'].keys())[0]
-                data['data'] = data['data'][account_id]
-                self._players_stats.append(PlayerStats.model_validate(data))
+                players_stats[int(account_id)] = PlayerStats.model_validate(
+                    {'status': data['status'], 'meta': data['meta'], 'data': player_data}
+                )
+            except ValidationError:
+                _log.debug(f'Error validate player stats {account_id}\n{traceback.format_exc()}')
+                
+        return players_stats
 
     async def retry_callback(self=None):
+        # Do not start an attempt that cannot finish before the deadline
+        check_deadline('retry', _config.deadline.min_attempt)
         _log.debug('Task failed, retrying...')
 
     @retry(
@@ -271,63 +490,76 @@ class API:
 
         """
         _log.debug('Get tankopedia data')
-        url_get_tankopedia = (
-            f'https://{self._get_url_by_reg(region)}/wotb/encyclopedia/vehicles/'
-            f'?application_id={self._get_id_by_reg(region)}&language=en&fields='
-            f'-description%2C+-engines%2C+-guns%2C-next_tanks%2C+-prices_xp%2C+'
-            f'-suspensions%2C+-turrets%2C+-cost%2C+-default_profile%2C+-modules_tree%2C+-images'
-        )
-
-        async with self.session.get(url_get_tankopedia, verify_ssl=False, timeout=_custom_timeout) as response:
-            data = await self.response_handler(response, False)
-            tanks = []
-            for key, value in data['data'].items():
-                tanks.append(
-                    Tank.model_validate(
-                        {
-                            'id': int(key),
-                            'name' : value['name'],
-                            'tier': value['tier'],
-                            'type': value['type'],
-                        }
-                    )
+        data = await self._request(region, _config.game_api.urls.get_tankopedia, {'fields': _tankopedia_fields}, check_data_status=False)
+        tanks = []
+        for key, value in data['data'].items():
+            tanks.append(
+                Tank.model_validate(
+                    {
+                        'id': int(key),
+                        'name' : value['name'],
+                        'tier': value['tier'],
+                        'type': value['type'],
+                    }
                 )
-            
-            return tanks
+            )
+        
+        return tanks
     
-    @retry(
-        expected_exception=(
-            api_exceptions.RequestsLimitExceeded,
-            api_exceptions.APISourceNotAvailable,
-            ClientConnectionError
-        ),
-        attempts=3,
-        on_exception=retry_callback
-    )
-    @timeout_handler()
-    async def get_players_list(self, search: str, limit: int = 8, peer_reg_timeout: int = 0.75) -> dict[str, str]:
+    async def get_players_list(self, search: str, limit: int = 8, timeout: float = 1.5) -> dict[str, str]:
+        """
+        Searches players by the beginning of the nickname in all available regions at once.
+
+        Regions that do not respond within `timeout` or fail are dropped from the result,
+        the search is not retried, because autocomplete has to answer within the Discord deadline.
+
+        Args:
+            search (str): The beginning of the nickname.
+            limit (int): Max number of players per region.
+            timeout (float): Overall deadline of the search in seconds.
+
+        Returns:
+            dict[str, str]: Formatted `nickname | REGION` strings by account ID.
+        """
+        tasks = {
+            asyncio.create_task(
+                self._request(
+                    reg,
+                    _config.game_api.urls.search,
+                    {
+                        'nickname' : search,
+                        'search_type' : 'startswith',
+                        'limit' : str(limit)
+                    },
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                    check_battles=False, 
+                    check_count=False
+                )
+            ): reg
+            for reg in _config.default.available_regions
+        }
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        
+        for task in pending:
+            _log.debug(f'Players search in {tasks[task]} region missed the deadline')
+            task.cancel()
+        
+        # The cancelled requests are awaited, so they do not outlive the search and their errors are retrieved
+        await asyncio.gather(*pending, return_exceptions=True)
+        
         data = {}
         
-        for reg in _config.default.available_regions:
-            url_get_players_list = insert_data(
-                _config.game_api.urls.search,
-                {
-                    'reg_url' : self._get_url_by_reg(reg),
-                    'app_id' : self._get_id_by_reg(reg),
-                    'nickname' : search,
-                    'search_type' : 'startswith',
-                    'limit' : str(limit)
-                }
-            )
-            await self.rate_limiter.wait()
-            try:
-                async with self.session.get(url_get_players_list, verify_ssl=False, timeout=aiohttp.ClientTimeout(total=peer_reg_timeout)) as response:
-                    original_resp_data = await self.response_handler(response, check_battles=False, check_count=False)
-                    
-                    for resp_data in original_resp_data['data']:
-                        data.setdefault(resp_data['account_id'], f'{resp_data["nickname"]} | {reg.upper()}')
-            except asyncio.TimeoutError:
-                pass
+        # Merged in the order of available_regions, not in the order of responses
+        for task, reg in tasks.items():
+            if task not in done:
+                continue
+            
+            if task.exception() is not None:
+                _log.debug(f'Players search in {reg} region failed: {task.exception()!r}')
+                continue
+                
+            for resp_data in task.result()['data']:
+                data.setdefault(resp_data['account_id'], f'{resp_data["nickname"]} | {reg.upper()}')
                 
         return data
 
@@ -347,6 +579,7 @@ class API:
         discord_id: int, 
         nickname: str | None = None, 
         game_id: int | None = None,
+        exact: bool = True,
         ) -> GameAccount:
         """
         Check a player's information.
@@ -362,48 +595,36 @@ class API:
         Returns:
             GameAccount: The player's information or None if the player is not found.
         """
-        url_get_id = (
-            f'https://{self._get_url_by_reg(region)}/wotb/account/list/'
-            f'?application_id={self._get_id_by_reg(region)}'
-            f'&search={nickname}'
-            f'&type={"exact" if self.exact else "startswith"}'
-        )
-
         region = self._reg_normalizer(region)
+        from_index = False
         
         if game_id is None:
-            await self.rate_limiter.wait()
-            async with self.session.get(url_get_id, verify_ssl=False, timeout=_custom_timeout) as response:
-                try:
-                    data = await self.response_handler(response, check_data=True)
-                    data = data['data'][0]
-                    game_id = int(data['account_id'])
-                except Exception as e:
-                    _log.debug(f'Error check player\n{traceback.format_exc()}')
-                    raise e
-            
-        url_get_stats = (
-            f'https://{self._get_url_by_reg(region)}/wotb/account/info/'
-            f'?application_id={self._get_id_by_reg(region)}'
-            f'&account_id={game_id}'
-            f'&fields=-statistics.clan'
+            try:
+                game_id, from_index = await self._resolve_account_id(region, nickname, exact, check_data=True)
+            except Exception as e:
+                _log.debug(f'Error check player\n{traceback.format_exc()}')
+                raise e
+        
+        data = await self._request(
+            region,
+            _config.game_api.urls.get_stats,
+            {'player_id': game_id, 'fields': _player_fields},
+            check_battles=True, 
+            check_data=True
         )
+        data = data['data'][[*data['data'].keys()][0]]
         
-        await self.rate_limiter.wait()
-        async with self.session.get(url_get_stats, verify_ssl=False, timeout=_custom_timeout) as response:
-            data = await self.response_handler(response, check_battles=True, check_data=True)
-            data = data['data'][[*data['data'].keys()][0]]
-            game_account = {
-                'nickname': data['nickname'],
-                'game_id': int(data['account_id']),
-                'region': region,
-            }
+        if not await self._check_resolved(region, nickname, data, from_index):
+            return await self.check_and_get_player(region=region, discord_id=discord_id, nickname=nickname, exact=exact)
+        
+        game_account = {
+            'nickname': data['nickname'],
+            'game_id': int(data['account_id']),
+            'region': region,
+        }
         
         return GameAccount.model_validate(game_account)
             
-    def done_callback(self, task: asyncio.Task):
-        pass
-
     async def get_stats(
         self, 
         region: str = None,
@@ -413,7 +634,9 @@ class API:
         raw_dict: bool = False,
         requested_by: DBPlayer | None = None,
         ignore_lock: bool = False,
-        disable_cache: bool = False
+        disable_cache: bool = False,
+        reference: PlayerGlobalData | None = None,
+        stale_while_revalidate: bool = False
         ) -> PlayerGlobalData:
         """
         Asynchronously retrieves player statistics for a game. Optionally filters by game ID, player search string, and region.
@@ -424,6 +647,11 @@ class API:
         - search (str | None): Optional search string for a player's nickname.
         - exact (bool): Whether to perform an exact match on the player's nickname. Defaults to True.
         - raw_dict (bool): Whether to return the player's stats as a raw dictionary. Defaults to False.
+        - reference (PlayerGlobalData | None): Previously stored data of the player, e.g. session `last_stats`.
+        If the player has not played since it, its tanks are reused, its achievements and clan data
+        only if it is younger than `stats_cache.reference_ttl`.
+        - stale_while_revalidate (bool): Whether cached data past `stats_cache.ttl` but within `stats_cache.stale_ttl`
+        is returned at once (marked `from_cache`) while it is refreshed in background. Defaults to False.
 
         Returns:
         - PlayerGlobalData: An object containing normalized player statistics data or a raw dictionary if raw_dict is True.
@@ -434,100 +662,303 @@ class API:
         - Normalizes and formats the collected data.
         - Returns the player statistics in the desired format.
         """
-        need_caching: bool = False
-
-        self.exact = exact
-        self.raw_dict = raw_dict
-
-        self.start_time = time()
-
+        cached = None
+        
+        # With a known account ID a cache hit needs no requests at all
+        if game_id is not None:
+            cached = await self.stats_cache.get(game_id, self._reg_normalizer(region), stale_while_revalidate)
+            if not disable_cache and self._is_servable(cached, stale_while_revalidate):
+                return self._serve_cached(cached, region)
+        
         try:
             player = await self.get_player(
                 region=region, 
                 nickname=search,
                 game_id=game_id,
+                exact=exact,
                 requested_by=requested_by,
                 ignore_lock=ignore_lock
             )
         except (ClientConnectionError, TimeoutError) as e:
             raise api_exceptions.APIError(real_exc = e)
         
-        if not disable_cache:
-            cached_data = self.cache.get((str(player['account_id']), region))
-            if cached_data is not None:
-                data = PlayerGlobalData.model_validate(cached_data)
-                # if not ignore_lock:
-                #     if self.pdb.find_lock(player['account_id'], requested_by):
-                #         raise api_exceptions.LockedPlayer()
-                data.from_cache = True
-                return get_normalized_data(data)
-            else:
-                need_caching = True
+        key = (int(player['account_id']), self._reg_normalizer(region))
+        
+        if game_id is None:
+            cached = await self.stats_cache.get(*key, stale_while_revalidate)
+            if not disable_cache and self._is_servable(cached, stale_while_revalidate):
+                return self._serve_cached(cached, region)
+        
+        priority = get_request_priority()
+        task, task_priority = self._in_flight.get(key, (None, None))
+        
+        # A background fan-out only gets spare capacity, so a more urgent caller starts its own
+        if task is None or task_priority > priority:
+            # The fan-out is shared, so it does not inherit the deadline or the member scope of the caller
+            # that happened to start it, every caller waits for it within its own deadline
+            task = asyncio.create_task(
+                self._collect_shared(priority, player, region, cached, reference),
+                context=contextvars.Context()
+            )
+            task.add_done_callback(partial(self._in_flight_done, key))
+            self._in_flight[key] = (task, priority)
+        else:
+            _log.debug(f'Joining in-flight stats request for {key}')
         
-        self.player['id'] = player['account_id']
+        try:
+            async with asyncio.timeout(get_remaining()):
+                player_stats = await asyncio.shield(task)
+        except TimeoutError:
+            check_deadline('stats request')
+            raise
+        
+        # Every caller gets its own copy: the result is normalized and cached in place
+        player_stats = player_stats.model_copy(deep=True)
 
-        tasks: list[Callable] = [
-            self.get_player_stats,
-            self.get_player_clan_stats,
-            self.get_player_achievements,
-            self.get_player_tanks_stats,
-        ]
+        if raw_dict:
+            return player_stats.model_dump()
+
+        _log.debug('all user data collected')
+        return get_normalized_data(player_stats)
+
+    async def _collect_shared(self, priority: RequestPriority, *args) -> PlayerGlobalData:
+        with request_priority(priority):
+            return await self._collect_stats(*args)
+
+    async def _collect_stats(
+            self, 
+            player: dict, 
+            region: str, 
+            cached: StatsCacheEntry | None = None, 
+            reference: PlayerGlobalData | None = None
+        ) -> PlayerGlobalData:
+        """
+        Runs the stats fan-out for one account and builds a PlayerGlobalData object.
+
+        Only one `_collect_stats` task runs per `(account_id, region)` at a time,
+        concurrent `get_stats` calls for the same account await it via `self._in_flight`.
+        
+        The account data from `get_player` is used as a cheap probe: if `last_battle_time`
+        and the battle counts match the last known data (`cached` or `reference`), the tanks are copied from it
+        and only the rating leaderboard position is requested. The achievements and clan data can change
+        without battles, so they are copied only from data collected within `stats_cache.reference_ttl`,
+        for older data they are requested through the slow data caches.
+        The result is written to the stats cache.
+
+        Args:
+            player (dict): Account data returned by `get_player`.
+            region (str): The region of the player.
+            cached (StatsCacheEntry | None): Stats cache entry of the player.
+            reference (PlayerGlobalData | None): Previously stored data of the player.
+
+        Returns:
+            PlayerGlobalData: Not normalized player data.
+        """
+        account_id = player['account_id']
+        key = (int(account_id), self._reg_normalizer(region))
+        tasks: dict[str, Callable] = {
+            'statistics': partial(self.get_player_stats, account_data=player),
+            'clan_stats': self.get_player_clan_stats,
+            'achievements': self.get_player_achievements,
+            'tank_stats': self.get_player_tanks_stats,
+        }
+        
+        candidates: list[tuple[PlayerGlobalData, datetime]] = []
+        
+        if cached is not None:
+            candidates.append((cached.data, cached.collected_at))
+        if reference is not None:
+            collected_at = reference.timestamp
+            if collected_at.tzinfo is None:
+                collected_at = collected_at.replace(tzinfo=pytz.utc)
+            candidates.append((reference, collected_at))
+        
+        for last_known, collected_at in candidates:
+            if self._is_unchanged(player, last_known):
+                # Clan and achievements can change without battles, so they are trusted for a limited time
+                refresh_slow_data = datetime.now(pytz.utc) - collected_at >= timedelta(seconds=self.stats_cache.settings.reference_ttl)
+                _log.debug(f'No new battles for {key}, reusing last known data')
+                player_stats = await self._collect_from_reference(player, region, last_known, refresh_slow_data)
+                await self._cache_stats(player_stats, player_stats.timestamp if refresh_slow_data else collected_at)
+                return player_stats
+        
+        # Only the tanks played since the last known snapshot are validated again
+        last_known = candidates[0][0] if len(candidates) != 0 else None
+        if last_known is not None and last_known.id == int(account_id):
+            tasks['tank_stats'] = partial(self.get_player_tanks_stats, previous=last_known.data.tank_stats)
 
         # TODO Костыль для ру региона
         if region == 'ru':
-            tasks.pop(1)
+            tasks.pop('clan_stats')
         # Удалить как только леста встанет с колен
         
-        default_params = {"account_id": player['account_id'], "region": region}
-        self.player, self.player_stats = {}, {}
         _log.debug('start collect data')
         
         try:
             async with asyncio.TaskGroup() as tg:
-                for i, task in enumerate(tasks):
-                    self.create_task(tg, task.__name__, task, default_params)
+                results = {
+                    name: tg.create_task(task(account_id=account_id, region=region), name=name)
+                    for name, task in tasks.items()
+                }
         except ClientConnectionError as e:
             raise api_exceptions.APIError(real_exc=e)
 
-        self.player['timestamp'] = int(datetime.now().timestamp())
-        self.player['end_timestamp'] = int(
-            datetime.now().timestamp() +
-            _config.session.ttl
-        )
-        self.player['id'] = player['account_id']
-        self.player['region'] = self._reg_normalizer(region)
-        self.player['lower_nickname'] = player['nickname'].lower()
-        self.player['timestamp'] = datetime.now(pytz.utc)
-        self.player['nickname'] = player['nickname']
-        self.player['data'] = self.player_stats
+        player_data = {name: task.result() for name, task in results.items()}
+        player_data['statistics'] = player_data['statistics'].data.statistics
+        
+        clan = player_data.pop('clan_stats', None)
+        player_data['clan_stats'] = clan.clan if clan is not None else None
+        player_data['clan_tag'] = clan.clan.tag if clan is not None else None
         
         # TODO Костыль для ру региона
         if region == 'ru':
-            self.player['data']['clan_tag'] = 'N/A'
+            player_data['clan_tag'] = 'N/A'
         # Удалить как только леста встанет с колен
         
-        player_stats = PlayerGlobalData.model_validate(self.player)
+        player_stats = self._build_global_data(player, region, player_data)
+        await self._cache_stats(player_stats, player_stats.timestamp)
+        return player_stats
+    
+    async def _cache_stats(self, player_stats: PlayerGlobalData, collected_at: datetime) -> None:
+        if collected_at.tzinfo is None:
+            collected_at = collected_at.replace(tzinfo=pytz.utc)
+            
+        await self.stats_cache.set(
+            StatsCacheEntry(
+                data=player_stats,
+                stored_at=datetime.now(pytz.utc),
+                collected_at=collected_at
+            )
+        )
+    
+    async def _collect_from_reference(
+            self, 
+            player: dict, 
+            region: str, 
+            reference: PlayerGlobalData, 
+            refresh_slow_data: bool = False
+        ) -> PlayerGlobalData:
+        """
+        Builds a PlayerGlobalData object from the account data of `get_player`
+        and the tanks, achievements and clan data of `reference`.
 
-        if self.raw_dict:
-            return player_stats.model_dump()
+        If `refresh_slow_data` is True, the achievements and clan data are requested instead.
+        """
+        account_id = player['account_id']
+        tasks: dict[str, Callable] = {'statistics': partial(self.get_player_stats, account_data=player)}
+        
+        if refresh_slow_data:
+            tasks['achievements'] = self.get_player_achievements
+            # TODO Костыль для ру региона
+            if region != 'ru':
+                tasks['clan_stats'] = self.get_player_clan_stats
+        
+        try:
+            async with asyncio.TaskGroup() as tg:
+                results = {
+                    name: tg.create_task(task(account_id=account_id, region=region), name=name)
+                    for name, task in tasks.items()
+                }
+        except ClientConnectionError as e:
+            raise api_exceptions.APIError(real_exc=e)
+        
+        player_data = reference.data.model_copy(deep=True)
+        player_data.statistics = results['statistics'].result().data.statistics
+        
+        if 'achievements' in results:
+            player_data.achievements = results['achievements'].result()
+        if 'clan_stats' in results:
+            clan = results['clan_stats'].result()
+            player_data.clan_stats = clan.clan if clan is not None else None
+            player_data.clan_tag = clan.clan.tag if clan is not None else None
         
-        if need_caching:
-            player_stats.from_cache = False
-            self.cache.add((str(game_id), region), player_stats.model_dump())
+        return self._build_global_data(player, region, player_data)
+    
+    def _build_global_data(self, player: dict, region: str, player_data: dict | Player) -> PlayerGlobalData:
+        return PlayerGlobalData.model_validate(
+            {
+                'id': player['account_id'],
+                'region': self._reg_normalizer(region),
+                'lower_nickname': player['nickname'].lower(),
+                'timestamp': datetime.now(pytz.utc),
+                'nickname': player['nickname'],
+                'last_battle_time': player.get('last_battle_time'),
+                'data': player_data,
+            }
+        )
+    
+    @staticmethod
+    def _is_unchanged(player: dict, reference: PlayerGlobalData | None) -> bool:
+        """
+        Checks whether the player has played any battles since `reference` was collected.
 
-        _log.debug('all user data collected')
-        return get_normalized_data(player_stats)
+        Args:
+            player (dict): Account data returned by `get_player`.
+            reference (PlayerGlobalData | None): Previously collected data of the player.
 
-    def create_task(
-            self, 
-            tg: asyncio.TaskGroup, 
-            task_name: str, 
-            task, 
-            params: Dict[str, Union[str, int]]
-            ) -> None:
-        task = tg.create_task(task(**params))
-        task.set_name(task_name)
-        task.add_done_callback(self.done_callback)
+        Returns:
+            bool: True if `last_battle_time` and the battle counts are the same.
+        """
+        if reference is None or reference.id != int(player['account_id']):
+            return False
+        
+        # Data stored before last_battle_time was collected is checked by battle counts only
+        if reference.last_battle_time is not None and reference.last_battle_time != player.get('last_battle_time'):
+            return False
+        
+        statistics = player['statistics']
+        reference_statistics = reference.data.statistics
+        rating_battles = (statistics.get('rating') or {}).get('battles', 0)
+        reference_rating_battles = reference_statistics.rating.battles if reference_statistics.rating is not None else 0
+        
+        return (
+            statistics['all']['battles'] == reference_statistics.all.battles and
+            rating_battles == reference_rating_battles
+        )
+
+    def _is_servable(self, cached: StatsCacheEntry | None, stale_while_revalidate: bool) -> bool:
+        return cached is not None and self.stats_cache.is_fresh(cached, stale=stale_while_revalidate)
+    
+    def _serve_cached(self, cached: StatsCacheEntry, region: str) -> PlayerGlobalData:
+        """
+        Returns the normalized cached data and starts a background refresh if it is past `stats_cache.ttl`.
+
+        The refresh is requested with the region of the caller, the cached data keeps the normalized one.
+        """
+        data = cached.data
+        data.from_cache = True
+        
+        if not self.stats_cache.is_fresh(cached):
+            self._refresh_in_background(data.id, region)
+            
+        return get_normalized_data(data)
+    
+    def _refresh_in_background(self, account_id: int, region: str) -> None:
+        key = (int(account_id), self._reg_normalizer(region))
+        if key in self._refreshing:
+            return
+        
+        _log.debug(f'Serving stale stats for {key}, refreshing in background')
+        task = asyncio.create_task(self._refresh_stats(int(account_id), region))
+        task.add_done_callback(partial(self._refresh_done, key))
+        self._refreshing[key] = task
+        
+    async def _refresh_stats(self, account_id: int, region: str) -> None:
+        # The caller has already got its data, so the refresh takes only spare capacity
+        # and is not bound by the deadline of its interaction
+        with request_priority(RequestPriority.BACKGROUND), deadline(None):
+            await self.get_stats(region=region, game_id=account_id, disable_cache=True)
+            
+    def _refresh_done(self, key: tuple[int, str], task: asyncio.Task) -> None:
+        if self._refreshing.get(key) is task:
+            del self._refreshing[key]
+            
+        if not task.cancelled() and task.exception() is not None:
+            _log.warning(f'Background stats refresh for {key} failed: {task.exception()!r}')
+
+    def _in_flight_done(self, key: tuple[int, str], task: asyncio.Task) -> None:
+        if self._in_flight.get(key, (None,))[0] is task:
+            del self._in_flight[key]
 
     @retry(
             expected_exception=(
@@ -545,7 +976,8 @@ class API:
         nickname: str | None = None, 
         game_id: int | None = None,
         requested_by: DBPlayer | None = None,
-        ignore_lock: bool = False
+        ignore_lock: bool = False,
+        exact: bool = True
         ) -> dict:
         """
         Get account data for a player.
@@ -553,7 +985,8 @@ class API:
         Args:
             region (str): The region of the player.
             nickname (str): The nickname of the player.
-            **kwargs: Additional keyword arguments.
+            game_id (int | None): The ID of the player. If set, the nickname search is skipped.
+            exact (bool): Whether to perform an exact match on the player's nickname. Defaults to True.
 
         Returns:
             dict: The account data of the player.
@@ -564,41 +997,81 @@ class API:
             api_exceptions.UncorrectName: If the player name is incorrect.
             api_exceptions.MoreThanOnePlayerFound: If more than one player is found with the given nickname.
             api_exceptions.NoPlayersFound: If no players are found with the given nickname."""
+        from_index = False
+        
+        if game_id is None:
+            game_id, from_index = await self._resolve_account_id(region, nickname, exact, check_meta=True)
+        
+        # if not ignore_lock:
+        #     if self.pdb.find_lock(game_id, requested_by):
+        #         raise api_exceptions.LockedPlayer()
+        
+        data = await self._request(
+            region,
+            _config.game_api.urls.get_stats,
+            {'player_id': game_id, 'fields': _player_fields},
+            hedge=True,
+            check_data=True, 
+            check_battles=True
+        )
+        player = data['data'][str(game_id)]
+        
+        if not await self._check_resolved(region, nickname, player, from_index):
+            return await self.get_player(region=region, nickname=nickname, requested_by=requested_by, ignore_lock=ignore_lock, exact=exact)
+        
+        return player
+    
+    async def _resolve_account_id(self, region: str, nickname: str, exact: bool, **handler_kwargs) -> tuple[int, bool]:
+        """
+        Resolves the nickname to an account ID, with the nicknames index first for the exact search.
+
+        Args:
+            region (str): The region of the player.
+            nickname (str): The nickname of the player.
+            exact (bool): Whether to perform an exact match on the player's nickname.
+            **handler_kwargs: Arguments passed to `response_handler` of the `account/list` request.
+
+        Returns:
+            tuple[int, bool]: The account ID and whether it was taken from the index.
+        """
+        if exact:
+            account_id = await self.nicknames.get(nickname, self._reg_normalizer(region))
+            if account_id is not None:
+                return account_id, True
             
-        url_get_id = insert_data(
+        data = await self._request(
+            region,
             _config.game_api.urls.get_id,
             {   
-                'app_id'  : self._get_id_by_reg(region),
-                'reg_url' : self._get_url_by_reg(region),
                 'nickname': nickname,
-                'search_type' : 'exact' if self.exact else 'startswith',
-            }
+                'search_type' : 'exact' if exact else 'startswith',
+            },
+            **handler_kwargs
         )
-        
-        if game_id is None:
-            await self.rate_limiter.wait()
-            async with self.session.get(url_get_id, verify_ssl=False, timeout=_custom_timeout) as response:
+        return int(data['data'][0]['account_id']), False
+    
+    async def _check_resolved(self, region: str, nickname: str | None, account: dict, from_index: bool) -> bool:
+        """
+        Updates the nicknames index with the `account/info` data.
 
-                data = await self.response_handler(response, check_meta=True)
-                game_id: int = data['data'][0]['account_id']
-                
-        url_get_stats = insert_data(
-        _config.game_api.urls.get_stats,
-            {
-                'app_id'  : self._get_id_by_reg(region),
-                'reg_url' : self._get_url_by_reg(region),
-                'player_id' : game_id
-            }
-        )
+        Args:
+            region (str): The region of the player.
+            nickname (str | None): The requested nickname.
+            account (dict): Account data returned by `account/info`.
+            from_index (bool): Whether the account ID was taken from the index.
+
+        Returns:
+            bool: False if the index entry was stale (the account has another nickname now) and has been deleted.
+        """
+        region = self._reg_normalizer(region)
         
-        # if not ignore_lock:
-        #     if self.pdb.find_lock(game_id, requested_by):
-        #         raise api_exceptions.LockedPlayer()
+        if from_index and account['nickname'].lower() != nickname.lower():
+            _log.debug(f'Stale nicknames index entry {region}:{nickname.lower()} -> {account["account_id"]}')
+            await self.nicknames.delete(nickname, region)
+            return False
         
-        await self.rate_limiter.wait()
-        async with self.session.get(url_get_stats, verify_ssl=False, timeout=_custom_timeout) as response:
-            data = await self.response_handler(response, check_data=True, check_battles=True)
-            return data['data'][str(game_id)]
+        await self.nicknames.set(account['nickname'], region, account['account_id'])
+        return True
             
     @retry(
             expected_exception=(
@@ -622,17 +1095,12 @@ class API:
         Returns:
             tuple: The number of common and rating battles of the player.
         """
-        url_get_battles = (
-            f'https://{self._get_url_by_reg(region)}/wotb/account/info/'
-            f'?application_id={self._get_id_by_reg(region)}'
-            f'&account_id={account_id}'
-            f'&fields=-statistics.clan'
-            f'&extra=statistics.rating'
+        data = await self._request(
+            region,
+            _config.game_api.urls.get_stats,
+            {'player_id': account_id, 'fields': _player_fields},
+            check_data=True
         )
-        await self.rate_limiter.wait()
-    
-        async with self.session.get(url_get_battles, verify_ssl=False, timeout=_custom_timeout) as response:
-            data = await self.response_handler(response, check_data=True)
 
         return (
             data['data'][str(account_id)]['statistics']['all']['battles'], 
@@ -650,14 +1118,14 @@ class API:
             on_exception=retry_callback
     )
     @timeout_handler()
-    async def get_player_stats(self, region: str, account_id: str) -> PlayerStats:
+    async def get_player_stats(self, region: str, account_id: str, account_data: dict | None = None) -> PlayerStats:
         """
         Retrieves the player statistics for a given region and account ID.
         
         Args:
             region (str): The region of the player (e.g. "NA", "EU", "ASIA").
             account_id (str): The ID of the player's account.
-            **kwargs: Additional keyword arguments to be passed.
+            account_data (dict | None): Account data already returned by `get_player`, the request is skipped if set.
         
         Returns:
             PlayerStats: An object containing the player's statistics.
@@ -668,29 +1136,31 @@ class API:
             EmptyDataError: If the "battles" field is not present in the output data.
             NeedMoreBattlesError: If the player has less than 100 battles.
         """
-        url_get_stats = insert_data(
-            _config.game_api.urls.get_stats,
+        if account_data is None:
+            data = await self._request(
+                region,
+                _config.game_api.urls.get_stats,
+                {'player_id': account_id, 'fields': _player_fields},
+                hedge=True,
+                check_battles=True
+            )
+            account_data = data['data'][str(account_id)]
+
+        data = PlayerStats.model_validate(
             {
-                'app_id'  : self._get_id_by_reg(region),
-                'reg_url' : self._get_url_by_reg(region),
-                'player_id' : account_id
+                'status': 'ok',
+                'meta': {'count': 1},
+                'data': account_data
             }
         )
 
-        await self.rate_limiter.wait()
-        
-        async with self.session.get(url_get_stats, verify_ssl=False, timeout=_custom_timeout) as response:
-            data = await self.response_handler(response, check_battles=True)
-
-        data['data'] = data['data'][str(account_id)]
-
-        data = PlayerStats.model_validate(data)
-
-        self.player_stats['statistics'] = data.data.statistics
         try:
-            await self.get_rating_leaderboard_num(region, account_id)
+            leaderboard_position = await self.get_rating_leaderboard_num(region, account_id)
         except Exception:
-            self.player_stats['statistics'].rating.leaderboard_position = 0
+            leaderboard_position = 0
+            
+        data.data.statistics.rating.leaderboard_position = leaderboard_position
+        return data
 
     @retry(
             expected_exception=(
@@ -705,27 +1175,30 @@ class API:
     async def get_player_achievements(self, region: str, account_id: str) -> Achievements:
         """
         Retrieves the achievements of a player.
+        Results are cached for `slow_data_cache.achievements_ttl` seconds.
 
         Args:
             region (str): The region of the player.
             account_id (str): The ID of the player's account.
 
         Returns:
-            None
+            Achievements: The achievements of the player.
         """
-        url_get_achievements = (
-            f'https://{self._get_url_by_reg(region)}/wotb/account/achievements/'
-            f'?application_id={self._get_id_by_reg(region)}'
-            f'&fields=-max_series&account_id={account_id}'
-        )
-
-        await self.rate_limiter.wait()
+        key = (int(account_id), self._reg_normalizer(region))
+        achievements = self.achievements_cache.get(key)
         
-        async with self.session.get(url_get_achievements, verify_ssl=False, timeout=_custom_timeout) as response:
-            data = await self.response_handler(response)
+        if achievements is None:
+            data: AchievementsResponse = await self._request(
+                region,
+                _config.game_api.urls.get_achievements,
+                {'player_id': account_id, 'fields': _achievements_fields},
+                model=AchievementsResponse
+            )
+            achievements = data.data[str(account_id)].achievements
+            self.achievements_cache.set(key, achievements)
 
-        self.player_stats['achievements'] = Achievements.model_validate(data['data'][str(account_id)]['achievements'])
-        return self.player_stats['achievements']
+        # `get_normalized_data` fills the missing values in place, the cached object is not shared
+        return achievements.model_copy()
 
     @retry(
             expected_exception=(
@@ -737,7 +1210,7 @@ class API:
             on_exception=retry_callback
     )
     @timeout_handler()
-    async def get_player_clan_stats(self, region: str, account_id: str | int) -> None:
+    async def get_player_clan_stats(self, region: str, account_id: str | int) -> ClanData | None:
         """
         Retrieves clan statistics for a player.
 
@@ -746,36 +1219,27 @@ class API:
             account_id (str | int): The account ID of the player.
 
         Returns:
-            None
+            ClanData | None: The clan membership data of the player, None if the player is not in a clan.
+            Results are cached for `slow_data_cache.clan_ttl` seconds.
 
         Raises:
             api_exceptions.RequestsLimitExceeded: If the API requests limit is exceeded.
             api_exceptions.SourceNotAvailable: If the API source is not available.
         """
-        url_get_clan_stats = (
-            f'https://{self._get_url_by_reg(region)}/wotb/clans/accountinfo/'
-            f'?application_id={self._get_id_by_reg(region)}'
-            f'&account_id={account_id}'
-            f'&extra=clan'
-        )
-
-        await self.rate_limiter.wait()
-        
-        async with self.session.get(url_get_clan_stats, verify_ssl=False, timeout=_custom_timeout) as response:
-            data = await self.response_handler(response)
-
-        if data['data'][str(account_id)] is None:
-            self.player_stats['clan_tag'] = None
-            self.player_stats['clan_stats'] = None
-            return
+        key = (int(account_id), self._reg_normalizer(region))
+        clan = self.clan_cache.get(key, default=_MISSING)
         
-        data['data'] = data['data'][str(account_id)]
-
-
-        data = ClanStats.model_validate(data)
+        if clan is _MISSING:
+            data: ClanStatsResponse = await self._request(
+                region,
+                _config.game_api.urls.get_clan_stats,
+                {'player_id': account_id, 'fields': _clan_fields},
+                model=ClanStatsResponse
+            )
+            clan = data.data.get(str(account_id))
+            self.clan_cache.set(key, clan)
 
-        self.player_stats['clan_tag'] = data.data.clan.tag
-        self.player_stats['clan_stats'] = data.data.clan
+        return clan
 
     @retry(
             expected_exception=(
@@ -787,40 +1251,72 @@ class API:
             on_exception=retry_callback
     )
     @timeout_handler()
-    async def get_player_tanks_stats(self, region: str, account_id: str,  **kwargs):
+    async def get_player_tanks_stats(
+            self, 
+            region: str, 
+            account_id: str, 
+            previous: dict[str, TankStats] | None = None, 
+            **kwargs
+        ) -> dict[str, TankStats]:
         """
         Retrieves the statistics of the tanks owned by a player.
+        
+        If `previous` is set, only the tanks whose `last_battle_time` has moved are validated,
+        the rest are carried over from `previous` as is.
 
         Args:
             region (str): The region of the player.
             account_id (str): The account ID of the player.
-            nickname (str): The nickname of the player.
+            previous (dict[str, TankStats] | None): Previous tank statistics snapshot of the player.
             **kwargs: Additional keyword arguments.
 
         Returns:
-            None
+            dict[str, TankStats]: The statistics of the player's tanks by tank ID.
 
         Raises:
             api_exceptions.RequestsLimitExceeded: If the requests limit has been exceeded.
             api_exceptions.SourceNotAvailable: If the data source is not available.
         """
-        url_get_tanks_stats = (
-            f'https://{self._get_url_by_reg(region)}/wotb/tanks/stats/'
-            f'?application_id={self._get_id_by_reg(region)}'
-            f'&account_id={account_id}'
-        )
-
-        await self.rate_limiter.wait()
+        if not previous:
+            # Nothing to carry over, validate the whole response without the intermediate dictionary
+            data: TanksStatsResponse = await self._request(
+                region,
+                _config.game_api.urls.get_tank_stats,
+                {'player_id': account_id, 'fields': _tank_fields},
+                hedge=True,
+                model=TanksStatsResponse
+            )
+            tanks_stats = {str(tank.tank_id): tank for tank in data.data[str(account_id)]}
+            
+            _log.debug(f'Tanks validated: {len(tanks_stats)} of {len(tanks_stats)}')
+            return tanks_stats
         
-        async with self.session.get(url_get_tanks_stats, verify_ssl=False, timeout=_custom_timeout) as response:
-            data = await self.response_handler(response)
+        data = await self._request(
+            region,
+            _config.game_api.urls.get_tank_stats,
+            {'player_id': account_id, 'fields': _tank_fields},
+            hedge=True
+        )
 
-            tanks_stats: dict[str, TankStats] = {}
+        tanks_stats: dict[str, TankStats] = {}
+        validated = 0
 
-            for tank in data['data'][str(account_id)]:
-                tanks_stats[str(tank['tank_id'])] = TankStats.model_validate(tank)
-                
-            self.player_stats['tank_stats'] = tanks_stats
+        for tank in data['data'][str(account_id)]:
+            tank_id = str(tank['tank_id'])
+            previous_tank = previous.get(tank_id)
+            
+            if (
+                previous_tank is not None and 
+                previous_tank.last_battle_time == tank['last_battle_time'] and 
+                previous_tank.in_garage == tank.get('in_garage')
+            ):
+                tanks_stats[tank_id] = previous_tank
+            else:
+                tanks_stats[tank_id] = TankStats.model_validate(tank)
+                validated += 1
+        
+        _log.debug(f'Tanks validated: {validated} of {len(tanks_stats)}')
+        return tanks_stats
 
     @retry(
         expected_exception=(
@@ -832,28 +1328,33 @@ class API:
             ValidationError
         )
     )
-    async def get_rating_leaderboard_num(self, region: int | str, account_id: int | str) -> None:
+    async def get_rating_leaderboard_num(self, region: int | str, account_id: int | str) -> int:
+        """
+        Retrieves the rating leaderboard position of a player.
+
+        Returns:
+            int: The leaderboard position, 0 if the player is not on the leaderboard.
+        """
         if region not in ["eu", "asia", "na"]:
-            self.player_stats['statistics'].rating.leaderboard_position = 0
-            return
+            return 0
         
         account_id = int(account_id)
 
         if (account_id, region) in self.rating_leaderboard_num_cache:
             return self.rating_leaderboard_num_cache.get((account_id, region))
 
-        url = f"https://{region}.wotblitz.com/eu/api/rating-leaderboards/user/{account_id}"
+        url = self._route_url(f"https://{region}.wotblitz.com/eu/api/rating-leaderboards/user/{account_id}")
 
-        async with self.session.get(url) as response:
+        check_deadline('rating leaderboard request')
+        async with asyncio.timeout(get_remaining()), self.session.get(url) as response:
             response_data = await response.json()
             try:
                 data = RatingLeaderboardAPIResponse.model_validate(response_data)
-                self.rating_leaderboard_num_cache.set((account_id, region), data)
-                self.player_stats['statistics'].rating.leaderboard_position = data.number if data.number is not None else 0
             except ValidationError:
                 _log.warning(f"RatingLeaderboardAPI: {traceback.format_exc()}")
                 _log.warning(f"RatingLeaderboardAPI: error while validating model, response data:\n{response_data}")
-                self.player_stats['statistics'].rating.leaderboard_position = 0
-
-    def __at_exit__(self):
-        asyncio.run(self.session.close())
+                return 0
+            
+            leaderboard_position = data.number if data.number is not None else 0
+            self.rating_leaderboard_num_cache.set((account_id, region), leaderboard_position)
+            return leaderboard_position
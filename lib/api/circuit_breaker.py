@@ -0,0 +1,130 @@
+from contextlib import contextmanager
+from collections.abc import Iterator
+from time import monotonic
+from enum import Enum
+import asyncio
+
+from aiohttp.client_exceptions import ClientConnectionError
+
+from lib.data_classes.settings import CircuitBreaker as CircuitBreakerSettings
+from lib.exceptions import api as api_exceptions
+from lib.logger.logger import get_logger
+
+_log = get_logger(__file__, 'CircuitBreakerLogger', 'logs/circuit_breaker.log')
+
+# Errors that mean the regional API is down, any other response means it is up
+_FAILURES = (api_exceptions.APISourceNotAvailable, ClientConnectionError, TimeoutError)
+
+
+class CircuitState(Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of a single regional API.
+
+    Opens after `failure_threshold` consecutive failures (source not available, connection errors
+    and timeouts). While it is open, requests fail at once with `RegionUnavailable`.
+    After `open_time` seconds a single probe request is let through: if it succeeds
+    the breaker closes, otherwise it opens again.
+    """
+    def __init__(self, region: str, settings: CircuitBreakerSettings) -> None:
+        self.region = region
+        self.settings = settings
+        self.failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        
+    @property
+    def state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and monotonic() - self._opened_at >= self.settings.open_time:
+            return CircuitState.HALF_OPEN
+        
+        return self._state
+    
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Wraps a single request to the regional API.
+
+        Raises:
+            api_exceptions.RegionUnavailable: If the breaker is open.
+        """
+        self._before_request()
+        try:
+            yield
+        except _FAILURES:
+            self._record_failure()
+            raise
+        except (asyncio.CancelledError, api_exceptions.DeadlineExceeded):
+            # Says nothing about the state of the API
+            self._probe_in_flight = False
+            raise
+        except Exception:
+            self._record_success()
+            raise
+        else:
+            self._record_success()
+    
+    def _before_request(self) -> None:
+        state = self.state
+        
+        if state is CircuitState.CLOSED:
+            return
+        
+        if state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+            _log.info(f'Sending a probe request to the {self.region} region API')
+            self._probe_in_flight = True
+            return
+        
+        retry_after = max(0, round(self.settings.open_time - (monotonic() - self._opened_at)))
+        raise api_exceptions.RegionUnavailable(
+            real_exc=TimeoutError(
+                f'API of the {self.region} region is not available, next attempt in {retry_after} s'
+            )
+        )
+    
+    def _record_success(self) -> None:
+        if self._state is not CircuitState.CLOSED:
+            _log.info(f'Circuit breaker of the {self.region} region closed')
+            
+        self._state = CircuitState.CLOSED
+        self._probe_in_flight = False
+        self.failures = 0
+        
+    def _record_failure(self) -> None:
+        self.failures += 1
+        
+        if self._probe_in_flight or self.failures >= self.settings.failure_threshold:
+            if self._state is CircuitState.CLOSED:
+                _log.warning(f'Circuit breaker of the {self.region} region opened after {self.failures} failures')
+                
+            self._state = CircuitState.OPEN
+            self._opened_at = monotonic()
+            
+        self._probe_in_flight = False
+
+
+class CircuitBreakerRegistry:
+    """
+    Allocates a `CircuitBreaker` to each region.
+    """
+    def __init__(self, settings: CircuitBreakerSettings) -> None:
+        self.settings = settings
+        self._breakers: dict[str, CircuitBreaker] = {}
+        
+    def get(self, region: str) -> CircuitBreaker:
+        breaker = self._breakers.get(region)
+        
+        if breaker is None:
+            breaker = CircuitBreaker(region, self.settings)
+            self._breakers[region] = breaker
+            
+        return breaker
+    
+    def get_states(self) -> dict[str, CircuitState]:
+        return {region: breaker.state for region, breaker in self._breakers.items()}
@@ -0,0 +1,81 @@
+from collections import deque
+from time import monotonic
+
+from lib.data_classes.settings import Hedging as HedgingSettings
+from lib.logger.logger import get_logger
+
+_log = get_logger(__file__, 'HedgingLogger', 'logs/hedging.log')
+
+
+class HedgingPolicy:
+    """
+    Decides when a duplicate of a slow request is sent.
+
+    The hedge delay is the `percentile` of the recent latencies of the same
+    `(endpoint, region)` pair. Hedges of a region are limited by a token bucket
+    refilled at `max_share` of the region request rate, so they never take
+    more than that share of the rate budget.
+    """
+    def __init__(self, settings: HedgingSettings, rate: float) -> None:
+        self.settings = settings
+        self.hedge_rate = rate * settings.max_share
+        self._latencies: dict[tuple[str, str], deque[float]] = {}
+        self._buckets: dict[str, tuple[float, float]] = {}
+        
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.hedges_rejected = 0
+        
+    def record(self, endpoint: str, region: str, latency: float) -> None:
+        latencies = self._latencies.get((endpoint, region))
+        
+        if latencies is None:
+            latencies = deque(maxlen=self.settings.window_size)
+            self._latencies[(endpoint, region)] = latencies
+            
+        latencies.append(latency)
+        
+    def get_delay(self, endpoint: str, region: str) -> float | None:
+        """
+        Returns:
+            float | None: Seconds to wait for the response before the hedge is sent,
+            None if hedging is disabled or there are not enough latency samples yet.
+        """
+        if not self.settings.enabled:
+            return None
+        
+        latencies = self._latencies.get((endpoint, region))
+        if latencies is None or len(latencies) < self.settings.min_samples:
+            return None
+        
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.settings.percentile / 100))
+        return ordered[index]
+    
+    def acquire(self, region: str) -> bool:
+        """
+        Takes a hedge token of the region.
+
+        Returns:
+            bool: False if the hedge rate of the region is exhausted.
+        """
+        now = monotonic()
+        capacity = max(1.0, self.hedge_rate)
+        tokens, updated_at = self._buckets.get(region, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * self.hedge_rate)
+        
+        if tokens < 1:
+            self._buckets[region] = (tokens, now)
+            self.hedges_rejected += 1
+            return False
+        
+        self._buckets[region] = (tokens - 1, now)
+        self.hedges_sent += 1
+        return True
+    
+    def get_metrics(self) -> dict[str, int]:
+        return {
+            'hedges_sent': self.hedges_sent,
+            'hedges_won': self.hedges_won,
+            'hedges_rejected': self.hedges_rejected,
+        }
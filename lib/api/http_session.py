@@ -0,0 +1,119 @@
+from types import SimpleNamespace
+import asyncio
+import atexit
+
+import aiohttp
+
+from lib.logger.logger import get_logger
+from lib.settings.settings import Config
+from lib.utils.singleton_factory import singleton
+
+_log = get_logger(__file__, 'HttpSessionLogger', 'logs/http_session.log')
+_config = Config().get()
+
+
+@singleton
+class HttpSessionManager:
+    """
+    Owns the single `aiohttp.ClientSession` shared by the game API, rating leaderboard and Discord clients.
+
+    The session uses a `TCPConnector` configured in `settings.yaml -> http`, so connections
+    (and TLS sessions) to the same host are kept alive and reused, and DNS lookups are cached.
+    The session is created lazily in the running event loop and recreated if it was closed
+    or the loop has changed, the session of the previous loop is closed then.
+    """
+    def __init__(self) -> None:
+        self.settings = _config.http
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closing: set[asyncio.Task] = set()
+        self._metrics = {
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'connections_queued': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0,
+        }
+        
+        atexit.register(self.__at_exit__)
+        
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._close_previous_session()
+            self._session = self._create_session()
+            self._loop = loop
+            
+        return self._session
+    
+    @session.setter
+    def session(self, session: aiohttp.ClientSession) -> None:
+        self._session = session
+        self._loop = asyncio.get_running_loop()
+    
+    def _close_previous_session(self) -> None:
+        if self._session is None or self._session.closed:
+            return
+        
+        # The connector does not need its own loop to be running, the connections of a closed loop are just dropped
+        _log.debug('Closing HTTP session of a previous event loop')
+        task = asyncio.create_task(self._close_session(self._session))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+    
+    async def _close_session(self, session: aiohttp.ClientSession) -> None:
+        try:
+            await session.close()
+        except Exception:
+            _log.warning('Failed to close HTTP session of a previous event loop', exc_info=True)
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        _log.debug('Creating HTTP session')
+        connector = aiohttp.TCPConnector(
+            limit=self.settings.limit,
+            limit_per_host=self.settings.limit_per_host,
+            keepalive_timeout=self.settings.keepalive_timeout,
+            ttl_dns_cache=self.settings.ttl_dns_cache,
+            use_dns_cache=True,
+        )
+        return aiohttp.ClientSession(connector=connector, trace_configs=[self._get_trace_config()])
+    
+    def _get_trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        
+        def counter(name: str):
+            async def on_event(session: aiohttp.ClientSession, context: SimpleNamespace, params) -> None:
+                self._metrics[name] += 1
+            return on_event
+        
+        trace_config.on_request_start.append(counter('requests'))
+        trace_config.on_connection_create_end.append(counter('connections_created'))
+        trace_config.on_connection_reuseconn.append(counter('connections_reused'))
+        trace_config.on_connection_queued_start.append(counter('connections_queued'))
+        trace_config.on_dns_cache_hit.append(counter('dns_cache_hits'))
+        trace_config.on_dns_cache_miss.append(counter('dns_cache_misses'))
+        return trace_config
+    
+    def get_metrics(self) -> dict[str, int]:
+        """
+        Returns the connection pool counters since the start of the process.
+        `connections_queued` counts requests that had to wait for a free connection slot.
+        """
+        return dict(self._metrics)
+    
+    def log_metrics(self) -> None:
+        metrics = self.get_metrics()
+        connections = metrics['connections_created'] + metrics['connections_reused']
+        reuse_ratio = metrics['connections_reused'] / connections if connections else 0.0
+        _log.info(f'HTTP session metrics: {metrics}, connection reuse ratio {reuse_ratio:.1%}')
+    
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+    
+    def __at_exit__(self) -> None:
+        if self._session is not None and not self._session.closed:
+            asyncio.run(self._session.close())
@@ -0,0 +1,176 @@
+from contextvars import ContextVar
+from heapq import heappop, heappush
+from itertools import count
+from time import monotonic
+from enum import IntEnum
+import asyncio
+
+from asynciolimiter import Limiter
+
+from lib.data_classes.settings import RateLimit
+from lib.logger.logger import get_logger
+
+_log = get_logger(__file__, 'RateLimiterLogger', 'logs/rate_limiter.log')
+
+
+class RequestPriority(IntEnum):
+    """
+    Priority lanes of the game API requests, lower value is served first.
+    """
+    INTERACTIVE = 0  # Slash commands waiting on the Discord interaction deadline
+    WIDGET = 1       # Session widget refreshes
+    BACKGROUND = 2   # Workers, take only spare capacity
+
+
+# Priority of the requests sent from the current task, set by `request_priority`
+_request_priority: ContextVar[RequestPriority] = ContextVar('request_priority', default=RequestPriority.INTERACTIVE)
+
+
+def get_request_priority() -> RequestPriority:
+    return _request_priority.get()
+
+
+class request_priority:
+    """
+    Context manager that sets the priority of all game API requests
+    sent from the current task and from the tasks it creates.
+
+    Usage:
+        with request_priority(RequestPriority.BACKGROUND):
+            await API().get_stats(...)
+    """
+    def __init__(self, priority: RequestPriority) -> None:
+        self.priority = priority
+        
+    def __enter__(self) -> RequestPriority:
+        self._token = _request_priority.set(self.priority)
+        return self.priority
+    
+    def __exit__(self, *_) -> None:
+        _request_priority.reset(self._token)
+
+
+class AdaptiveLimiter:
+    """
+    Token bucket for a single `(region, app_id)` pair.
+
+    The rate is lowered by `backoff_factor` every time the API reports
+    `REQUEST_LIMIT_EXCEEDED` and is restored by `recovery_step` requests
+    per second every `recovery_interval` seconds until it reaches the configured rate again.
+    
+    Tokens are handed out by priority: a waiting `INTERACTIVE` request gets the next token
+    before any `WIDGET` or `BACKGROUND` one, requests of the same priority are served in FIFO order.
+    """
+    def __init__(self, name: str, settings: RateLimit) -> None:
+        self.name = name
+        self.settings = settings
+        self._limiter = Limiter(settings.rate)
+        self._last_change = monotonic()
+        self._last_penalty = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = count()
+        self._dispatcher: asyncio.Task | None = None
+        
+    @property
+    def rate(self) -> float:
+        return self._limiter.rate
+
+    @property
+    def queued(self) -> dict[RequestPriority, int]:
+        """
+        Number of requests waiting for a token in each priority lane.
+        """
+        queued = {priority: 0 for priority in RequestPriority}
+        for priority, _, waiter in self._waiters:
+            if not waiter.done():
+                queued[RequestPriority(priority)] += 1
+                
+        return queued
+
+    async def wait(self, priority: RequestPriority | None = None) -> None:
+        """
+        Waits for a free token in the bucket.
+        
+        Args:
+            priority (RequestPriority | None): Priority of the request,
+            the priority of the current context is used if not specified.
+        """
+        self._recover()
+        if priority is None:
+            priority = get_request_priority()
+        
+        waiter = asyncio.get_running_loop().create_future()
+        heappush(self._waiters, (priority, next(self._counter), waiter))
+        
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+            
+        await waiter
+
+    async def _dispatch(self) -> None:
+        """
+        Takes tokens from the bucket while there are waiters
+        and passes each one to the most urgent waiter.
+        """
+        while self._waiters:
+            await self._limiter.wait()
+            
+            while self._waiters:
+                _, _, waiter = heappop(self._waiters)
+                # Skip the waiters that were cancelled while in queue
+                if not waiter.done():
+                    waiter.set_result(None)
+                    break
+
+    def penalize(self) -> None:
+        """
+        Lowers the rate after a `REQUEST_LIMIT_EXCEEDED` response.
+
+        Penalties that arrive within one `recovery_interval` are counted once,
+        because requests that were already in flight are rejected together.
+        """
+        now = monotonic()
+        if now - self._last_penalty < self.settings.recovery_interval:
+            return
+        
+        new_rate = max(self.settings.min_rate, self.rate * self.settings.backoff_factor)
+        _log.warning(f'Rate limit exceeded for {self.name}, lowering rate {self.rate:.2f} -> {new_rate:.2f} rps')
+        self._limiter.rate = new_rate
+        self._last_penalty = now
+        self._last_change = now
+
+    def _recover(self) -> None:
+        if self.rate >= self.settings.rate:
+            return
+        
+        steps = int((monotonic() - self._last_change) // self.settings.recovery_interval)
+        if steps == 0:
+            return
+        
+        self._limiter.rate = min(self.settings.rate, self.rate + steps * self.settings.recovery_step)
+        self._last_change += steps * self.settings.recovery_interval
+        _log.debug(f'Restoring rate for {self.name}: {self.rate:.2f} rps')
+
+
+class RateLimiterRegistry:
+    """
+    Allocates an `AdaptiveLimiter` to each `(region, app_id)` pair,
+    every region and application ID has its own API quota.
+    """
+    def __init__(self, settings: RateLimit) -> None:
+        self.settings = settings
+        self._limiters: dict[tuple[str, str], AdaptiveLimiter] = {}
+
+    def get(self, region: str, app_id: str) -> AdaptiveLimiter:
+        key = (region, app_id)
+        limiter = self._limiters.get(key)
+        
+        if limiter is None:
+            # Do not log the application ID itself
+            limiter = AdaptiveLimiter(f'{region}:{len(self._limiters)}', self.settings)
+            self._limiters[key] = limiter
+            
+        return limiter
+    
+    def get_rates(self) -> dict[tuple[str, str], float]:
+        return {key: limiter.rate for key, limiter in self._limiters.items()}
@@ -0,0 +1,158 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+import pytz
+from pydantic import ValidationError
+from pymongo.errors import PyMongoError
+
+from lib.data_classes.settings import StatsCache as StatsCacheSettings
+from lib.data_classes.stats_cache import StatsCacheEntry
+from lib.database.stats_cache import StatsCacheDB
+from lib.logger.logger import get_logger
+
+_log = get_logger(__file__, 'StatsCacheLogger', 'logs/stats_cache.log')
+
+
+class StatsCache:
+    """
+    Two tier cache of the player stats, keyed by `(account_id, region)`.
+
+    The first tier is an in-process LRU bounded by the total size of the serialized entries,
+    the second one is a Mongo collection with a TTL index shared by all processes.
+    Entries are kept for `reference_ttl` seconds, but only the ones younger than `ttl`
+    (or `stale_ttl` for stale-while-revalidate reads) are served as is,
+    older ones are used as the last known data of the player.
+    """
+    def __init__(self, settings: StatsCacheSettings) -> None:
+        self.settings = settings
+        self.db = StatsCacheDB()
+        self._memory: OrderedDict[str, tuple[datetime, bytes]] = OrderedDict()
+        self._memory_size = 0
+        
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.reference_hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def _key(account_id: int | str, region: str) -> str:
+        return f'{region}:{int(account_id)}'
+    
+    def is_fresh(self, entry: StatsCacheEntry, stale: bool = False) -> bool:
+        """
+        Checks whether the entry can be served.
+
+        Args:
+            entry (StatsCacheEntry): The cache entry.
+            stale (bool): Whether entries past `ttl` but within `stale_ttl` can be served.
+        """
+        ttl = self.settings.stale_ttl if stale else self.settings.ttl
+        return datetime.now(pytz.utc) - entry.stored_at < timedelta(seconds=ttl)
+    
+    async def get(self, account_id: int | str, region: str, stale: bool = False) -> StatsCacheEntry | None:
+        """
+        Looks up the entry in memory first and then in the database.
+
+        Only an entry that can be served, see `is_fresh`, is counted as a hit.
+        An older one is counted in `reference_hits`, it is only the last known data of the player.
+
+        Args:
+            account_id (int | str): The account ID of the player.
+            region (str): The normalized region of the player.
+            stale (bool): Whether the caller serves entries within `stale_ttl`.
+
+        Returns:
+            StatsCacheEntry | None: The entry if it has not expired yet.
+        """
+        key = self._key(account_id, region)
+        payload = self._memory_get(key)
+        from_memory = payload is not None
+        
+        if not from_memory:
+            try:
+                payload = await self.db.get(key)
+            except PyMongoError:
+                _log.warning(f'Failed to read {key} from the database cache', exc_info=True)
+                
+            if payload is None:
+                self.misses += 1
+                return None
+        
+        try:
+            entry = StatsCacheEntry.model_validate_json(payload)
+        except ValidationError:
+            _log.warning(f'Dropping the cache entry {key} that does not match the current models')
+            self._memory_pop(key)
+            self.misses += 1
+            return None
+        
+        if not from_memory:
+            self._memory_set(key, entry.stored_at, payload)
+        
+        if not self.is_fresh(entry, stale):
+            self.reference_hits += 1
+        elif from_memory:
+            self.memory_hits += 1
+        else:
+            self.db_hits += 1
+            
+        return entry
+    
+    async def set(self, entry: StatsCacheEntry) -> None:
+        key = self._key(entry.data.id, entry.data.region)
+        payload = entry.model_dump_json().encode()
+        self._memory_set(key, entry.stored_at, payload)
+        
+        try:
+            await self.db.set(key, payload, self.settings.reference_ttl)
+        except PyMongoError:
+            _log.warning(f'Failed to write {key} to the database cache', exc_info=True)
+    
+    def get_metrics(self) -> dict[str, int]:
+        return {
+            'memory_hits': self.memory_hits,
+            'db_hits': self.db_hits,
+            'reference_hits': self.reference_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'memory_entries': len(self._memory),
+            'memory_size': self._memory_size,
+        }
+    
+    def log_metrics(self) -> None:
+        metrics = self.get_metrics()
+        hits = metrics['memory_hits'] + metrics['db_hits']
+        lookups = hits + metrics['reference_hits'] + metrics['misses']
+        hit_ratio = hits / lookups if lookups else 0.0
+        _log.info(f'Stats cache metrics: {metrics}, hit ratio {hit_ratio:.1%}')
+    
+    def _memory_get(self, key: str) -> bytes | None:
+        if key not in self._memory:
+            return None
+        
+        stored_at, payload = self._memory[key]
+        if datetime.now(pytz.utc) - stored_at >= timedelta(seconds=self.settings.reference_ttl):
+            self._memory_pop(key)
+            return None
+        
+        self._memory.move_to_end(key)
+        return payload
+    
+    def _memory_set(self, key: str, stored_at: datetime, payload: bytes) -> None:
+        self._memory_pop(key)
+        if len(payload) > self.settings.memory_max_size:
+            return
+        
+        self._memory[key] = (stored_at, payload)
+        self._memory_size += len(payload)
+        
+        while self._memory_size > self.settings.memory_max_size:
+            _, (_, evicted) = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+            self.evictions += 1
+            
+    def _memory_pop(self, key: str) -> None:
+        item = self._memory.pop(key, None)
+        if item is not None:
+            self._memory_size -= len(item[1])
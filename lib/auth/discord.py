@@ -1,8 +1,9 @@
 import hashlib
 from random import randint
 
-from aiohttp import BasicAuth, ClientSession
+from aiohttp import BasicAuth
 
+from lib.api.http_session import HttpSessionManager
 from lib.exceptions.api import APIError
 from lib.logger.logger import get_logger
 from lib.settings.settings import Config, EnvConfig
@@ -32,6 +33,9 @@ class DiscordOAuth:
         f'scope=identify&'
         f'state={state}'
     )
+    def __init__(self) -> None:
+        self.http = HttpSessionManager()
+
     def get_state(self) -> str:
         """
         Get the current state of the object.
@@ -64,10 +68,9 @@ class DiscordOAuth:
             'Content-Type': 'application/x-www-form-urlencoded',
         }
 
-        async with ClientSession() as session:
-            async with session.post('https://discord.com/api/v9/oauth2/token', data=data, headers=headers, auth=BasicAuth(self.client_id, self.client_secret)) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data['access_token']
-                else:
-                    raise APIError(f'Error exchanging code: {response.status}, \ntext: {await response.text()}\njson: {await response.json()}')
+        async with self.http.session.post('https://discord.com/api/v9/oauth2/token', data=data, headers=headers, auth=BasicAuth(self.client_id, self.client_secret)) as response:
+            if response.status == 200:
+                data = await response.json()
+                return data['access_token']
+            else:
+                raise APIError(f'Error exchanging code: {response.status}, \ntext: {await response.text()}\njson: {await response.json()}')
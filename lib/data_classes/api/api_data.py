@@ -25,4 +25,5 @@ class PlayerGlobalData(BaseModel):
     lower_nickname: str
     timestamp: datetime
     nickname: str
+    last_battle_time: Optional[int] = None
     from_cache: Optional[bool] = False
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel
 
@@ -8,4 +8,13 @@ class Achievements(BaseModel):
     medalRadleyWalters: Optional[int | str] = None
     markOfMastery: Optional[int | str] = None
     medalKolobanov: Optional[int | str] = None
-    warrior: Optional[int | str] = None
\ No newline at end of file
+    warrior: Optional[int | str] = None
+
+
+class AccountAchievements(BaseModel):
+    achievements: Achievements
+
+
+class AchievementsResponse(BaseModel):
+    status: Literal['ok']
+    data: dict[str, Optional[AccountAchievements]]
@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic import BaseModel
 
 
@@ -27,3 +29,9 @@ class ClanStats(BaseModel):
     status: str
     meta: Meta
     data: ClanData
+
+
+class ClanStatsResponse(BaseModel):
+    status: Literal['ok']
+    meta: Meta
+    data: dict[str, Optional[ClanData]]
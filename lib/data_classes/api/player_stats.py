@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import ClassVar, Optional
 
 from pydantic import BaseModel
 
@@ -8,6 +8,11 @@ class Meta(BaseModel):
 
 
 class Rating(BaseModel):
+    # Calculated by the bot, not requested from the API
+    _derived_fields: ClassVar[set[str]] = {
+        'rating', 'avg_xp', 'avg_damage', 'accuracy', 'winrate', 'avg_spotted', 'frags_per_battle',
+        'not_survived_battles', 'survival_ratio', 'damage_ratio', 'destruction_ratio', 'leaderboard_position'
+    }
     
     spotted: int
     calibration_battles_left: int
@@ -47,6 +52,12 @@ class Rating(BaseModel):
 
 
 class All(BaseModel):
+    # Calculated by the bot, not requested from the API
+    _derived_fields: ClassVar[set[str]] = {
+        'avg_xp', 'avg_damage', 'accuracy', 'winrate', 'avg_spotted', 'frags_per_battle',
+        'not_survived_battles', 'survival_ratio', 'damage_ratio', 'destruction_ratio'
+    }
+    
     spotted: int
     max_frags_tank_id: int
     hits: int
@@ -1,9 +1,15 @@
-from typing import Optional
+from typing import ClassVar, Literal, Optional
 
 from pydantic import BaseModel
 
 
 class All(BaseModel):
+    # Calculated by the bot, not requested from the API
+    _derived_fields: ClassVar[set[str]] = {
+        'winrate', 'avg_damage', 'accuracy', 'damage_ratio', 'destruction_ratio',
+        'frags_per_battle', 'avg_spotted', 'survival_ratio'
+    }
+    
     spotted: int
     hits: int
     frags: int
@@ -44,3 +50,8 @@ class TankStats(BaseModel):
     battle_life_time: int
     in_garage: Optional[bool]
     tank_id: int
+
+
+class TanksStatsResponse(BaseModel):
+    status: Literal['ok']
+    data: dict[str, Optional[list[TankStats]]]
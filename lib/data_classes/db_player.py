@@ -121,7 +121,9 @@ class GameAccount(BaseModel):
     nickname: str
     game_id: int
     region: str
+    # Stored in `SnapshotsDB`, loaded on demand by `PlayersDB.load_last_stats`
     last_stats: Optional[PlayerGlobalData] = None
+    last_stats_id: Optional[str] = None
     session_settings: SessionSettings = SessionSettings()
     image_settings: ImageSettings = ImageSettings()
     widget_settings: WidgetSettings = WidgetSettings()
@@ -185,8 +187,26 @@ class Profile(BaseModel):
 class DBPlayer(BaseModel):
     id: int
     lang: Optional[str] = None
+    # Stored in `ImagesDB`, loaded on demand by `PlayersDB.load_image`
     image: Optional[str] = None
+    image_id: Optional[str] = None
     use_custom_image: bool = True
     game_accounts: GameAccounts
     profile: Profile
     current_game_account: str = AccountSlotsEnum.slot_1.name
+
+
+class PartialDBPlayer(BaseModel):
+    '''
+    Player document read with a projection, see `PlayersDB.get_member_fields`.
+    Fields outside the projection hold the same defaults as in `DBPlayer`,
+    `game_accounts` is None unless it was projected.
+    '''
+    id: int
+    lang: Optional[str] = None
+    image: Optional[str] = None
+    image_id: Optional[str] = None
+    use_custom_image: bool = True
+    game_accounts: Optional[GameAccounts] = None
+    profile: Profile = Profile()
+    current_game_account: str = AccountSlotsEnum.slot_1.name
@@ -129,6 +129,7 @@ class Errors(BaseModel):
     parser_error: str
     verify_error: str
     locked_player: str
+    region_unavailable: str
     slot_is_empty: str
     slot_not_accessed: str
     premium_not_found: str
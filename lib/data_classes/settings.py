@@ -75,11 +75,78 @@ class Urls(BaseModel):
     get_achievements: str
     get_clan_stats: str
     get_tank_stats: str
+    get_tankopedia: str
+
+
+class RateLimit(BaseModel):
+    rate: float
+    min_rate: float
+    backoff_factor: float
+    recovery_step: float
+    recovery_interval: float
+
+
+class CircuitBreaker(BaseModel):
+    failure_threshold: int
+    open_time: float
+
+
+class Hedging(BaseModel):
+    enabled: bool
+    percentile: float
+    min_samples: int
+    window_size: int
+    max_share: float
+
+
+class StatsCache(BaseModel):
+    ttl: int
+    stale_ttl: int
+    reference_ttl: int
+    memory_max_size: int
+    metrics_interval: float
+
+
+class SlowDataCache(BaseModel):
+    clan_ttl: int
+    achievements_ttl: int
+    max_size: int
+
+
+class FakeApi(BaseModel):
+    enabled: bool
+    url: str
 
 
 class GameApi(BaseModel):
     reg_urls: RegUrls
     urls: Urls
+    rate_limit: RateLimit
+    circuit_breaker: CircuitBreaker
+    hedging: Hedging
+    stats_cache: StatsCache
+    slow_data_cache: SlowDataCache
+    fake_api: FakeApi
+
+
+class Deadline(BaseModel):
+    deferred: float
+    immediate: float
+    min_attempt: float
+
+
+class AnalyticsBuffer(BaseModel):
+    enabled: bool
+    flush_interval: float
+    batch_size: int
+    max_queue: int
+
+
+class Http(BaseModel):
+    limit: int
+    limit_per_host: int
+    keepalive_timeout: float
+    ttl_dns_cache: int
 
 
 class Urls1(BaseModel):
@@ -129,6 +196,9 @@ class ConfigStruct(BaseModel):
     help_urls: HelpUrls
     session_widget: SessionWidget
     auth: Auth
+    deadline: Deadline
+    analytics_buffer: AnalyticsBuffer
+    http: Http
     game_api: GameApi
     ds_api: DsApi
     report: Report
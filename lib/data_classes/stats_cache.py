@@ -0,0 +1,11 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from lib.data_classes.api.api_data import PlayerGlobalData
+
+
+class StatsCacheEntry(BaseModel):
+    data: PlayerGlobalData
+    stored_at: datetime
+    collected_at: datetime  # Time of the full request the tanks, achievements and clan data come from
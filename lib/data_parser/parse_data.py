@@ -335,13 +335,17 @@ async def _generate_tank_session_dict(data_old: PlayerGlobalData, data_new: Play
     for _, (key, tank) in enumerate(tanks.items()):
         tank_stats: dict = {}
         try:
-            diff = tank.all.battles - tanks_old[key].all.battles
-            # _log.debug(f'compare tanks battles {key}: {tank.all.battles} - {tanks_old[key].all.battles} = {diff}')
+            tank_old = tanks_old[key]
         except KeyError:
             continue
-        else:
-            if diff > 0:
-                diff_battles.append([tank.tank_id, diff])
+        
+        # Tanks that have not been played since data_old are skipped without computing the diff
+        if tank.last_battle_time == tank_old.last_battle_time:
+            continue
+        
+        diff = tank.all.battles - tank_old.all.battles
+        if diff > 0:
+            diff_battles.append([tank.tank_id, diff])
 
     _log.debug(f'Len diff_battles: {len(diff_battles)}')
     
@@ -0,0 +1,168 @@
+import asyncio
+from collections import Counter
+from datetime import datetime
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from lib.data_classes.db_player import UsedCommand
+from lib.logger.logger import get_logger
+from lib.settings.settings import Config
+from lib.utils.analytics_update import build_analytics_update, get_commands_exp
+
+_log = get_logger(__file__, 'AnalyticsBufferLogger', 'logs/analytics_buffer.log')
+_config = Config().get()
+
+
+class AnalyticsBuffer:
+    """
+    Write-behind buffer of the command analytics, see `PlayersDB.set_analytics`.
+
+    The events are queued in memory and written by `run` in one `bulk_write` per batch,
+    at most `analytics_buffer.flush_interval` seconds after they are queued.
+    The queue is bounded, when it is full or `run` is not running the caller writes directly.
+    Batches that fail to be written are kept and written with the next one.
+    """
+    def __init__(self, collection: AsyncIOMotorCollection) -> None:
+        self.settings = _config.analytics_buffer
+        self.collection = collection
+        self.queue: asyncio.Queue[tuple[int, UsedCommand, datetime]] = asyncio.Queue(maxsize=self.settings.max_queue)
+        self.running = False
+        self._batch_ready = asyncio.Event()
+        self._retry: list[tuple[int, UsedCommand, datetime]] = []
+        self._run_task: asyncio.Task | None = None
+        self._writing: asyncio.Task | None = None
+        self.metrics = {'queued': 0, 'rejected': 0, 'flushed': 0, 'batches': 0, 'retried': 0, 'failed': 0}
+
+    def put(self, member_id: int, analytics: UsedCommand, at: datetime) -> bool:
+        """
+        Queues a used command of the member.
+
+        Returns:
+            bool: False if the event was not queued and must be written directly.
+        """
+        if not self.running:
+            return False
+
+        try:
+            self.queue.put_nowait((member_id, analytics, at))
+        except asyncio.QueueFull:
+            self.metrics['rejected'] += 1
+            return False
+
+        self.metrics['queued'] += 1
+        if self.queue.qsize() >= self.settings.batch_size:
+            self._batch_ready.set()
+
+        return True
+
+    @staticmethod
+    def build_operations(events: list[tuple[int, UsedCommand, datetime]]) -> list[UpdateOne]:
+        """
+        Merges the events of each member into one update, the result is the same as of
+        `PlayersDB.set_analytics` called for every event in order.
+        """
+        by_member: dict[int, list[tuple[UsedCommand, datetime]]] = {}
+        for member_id, analytics, at in events:
+            by_member.setdefault(member_id, []).append((analytics, at))
+
+        return [
+            UpdateOne({'id': member_id}, build_analytics_update(commands, get_commands_exp(commands)))
+            for member_id, commands in by_member.items()
+        ]
+
+    async def flush(self) -> int:
+        """
+        Writes the queued events and the ones kept after a failed write.
+
+        The write is not interrupted if the caller is cancelled, the next flush waits for it.
+
+        Returns:
+            int: Number of the events written.
+        """
+        if self._writing is not None and not self._writing.done():
+            await asyncio.wait({self._writing})
+
+        events = self._retry
+        self._retry = []
+        while not self.queue.empty():
+            events.append(self.queue.get_nowait())
+
+        if not events:
+            return 0
+
+        self._writing = asyncio.create_task(self._write(events))
+        return await asyncio.shield(self._writing)
+
+    async def _write(self, events: list[tuple[int, UsedCommand, datetime]]) -> int:
+        written = len(events)
+        try:
+            await self.collection.bulk_write(self.build_operations(events), ordered=False)
+        except BulkWriteError as e:
+            # The other updates are applied, a rejected one would be rejected again
+            errors = e.details['writeErrors']
+            # The updates are built per member, in order of the first event of the member
+            members_events = list(Counter(member_id for member_id, _, _ in events).values())
+            failed = sum(members_events[error['index']] for error in errors)
+            written -= failed
+            self.metrics['failed'] += failed
+            _log.error(f'{len(errors)} analytics updates rejected, {failed} events dropped: {errors[:3]}')
+        except PyMongoError:
+            self._keep(events)
+            _log.exception(f'Failed to write {len(events)} analytics events, retrying with the next batch')
+            return 0
+
+        self.metrics['flushed'] += written
+        self.metrics['batches'] += 1
+        return written
+
+    def _keep(self, events: list[tuple[int, UsedCommand, datetime]]) -> None:
+        # The oldest events are dropped first, the order of the kept ones is preserved
+        dropped = max(0, len(events) - self.settings.max_queue)
+        if dropped:
+            self.metrics['failed'] += dropped
+            _log.error(f'Analytics retry buffer is full, {dropped} events dropped')
+
+        self._retry = events[dropped:]
+        self.metrics['retried'] += len(self._retry)
+
+    async def run(self) -> None:
+        """
+        Flushes the buffer every `flush_interval` seconds or when `batch_size` events are queued,
+        until `stop` is called or the task is cancelled. The remaining events are flushed on exit.
+        """
+        self._run_task = asyncio.current_task()
+        self.running = True
+        _log.info('Analytics buffer started')
+        try:
+            while self.running:
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=self.settings.flush_interval)
+                except TimeoutError:
+                    pass
+
+                self._batch_ready.clear()
+                await self.flush()
+        finally:
+            self.running = False
+            await self.flush()
+
+    async def stop(self) -> None:
+        """
+        Stops `run` and waits until the remaining events are written.
+        """
+        self.running = False
+        self._batch_ready.set()
+        if self._run_task is not None:
+            await asyncio.wait({self._run_task})
+
+        # `run` may have been cancelled before its last flush was done
+        flushed = await self.flush()
+        if self._retry:
+            _log.error(f'Analytics buffer stopped, {len(self._retry)} events were not written')
+        else:
+            _log.info(f'Analytics buffer stopped, {flushed} events flushed on stop')
+
+    def get_metrics(self) -> dict[str, int]:
+        return {**self.metrics, 'queue_size': self.queue.qsize(), 'retry_size': len(self._retry)}
@@ -0,0 +1,60 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from lib.logger.logger import get_logger
+from lib.utils.singleton_factory import singleton
+
+_log = get_logger(__file__, 'ImagesDBLogger', 'logs/images_db.log')
+
+
+@singleton
+class ImagesDB:
+    """
+    Custom backgrounds of the members, base64 PNG.
+
+    The images are kept out of the players documents, which are read for every command,
+    a member references its image by `DBPlayer.image_id`. See `PlayersDB.load_image`.
+    """
+    def __init__(self) -> None:
+        self.client = AsyncIOMotorClient("mongodb://localhost:27017")
+        self.db = self.client.get_database('PlayersDB')
+        self.collection = self.db.get_collection('images')
+        self._index_created = False
+        
+    async def _create_index(self) -> None:
+        if self._index_created:
+            return
+        
+        await self.collection.create_index('member_id')
+        self._index_created = True
+        
+    @staticmethod
+    def get_id(member_id: int | str) -> str:
+        return str(member_id)
+        
+    async def get(self, image_id: str) -> str | None:
+        data = await self.collection.find_one({'_id': image_id}, {'image': 1})
+        if data is None:
+            _log.warning(f'Image {image_id} is referenced but not found')
+            return None
+        
+        return data['image']
+    
+    async def set(self, member_id: int | str, image: str) -> str:
+        """
+        Stores the image of the member, replacing the previous one.
+
+        Returns:
+            str: The ID to reference the image by.
+        """
+        await self._create_index()
+        image_id = self.get_id(member_id)
+        await self.collection.replace_one(
+            {'_id': image_id},
+            {'member_id': int(member_id), 'image': image},
+            upsert=True
+        )
+        return image_id
+    
+    async def delete_member(self, member_id: int | str) -> None:
+        await self._create_index()
+        await self.collection.delete_many({'member_id': int(member_id)})
@@ -1,6 +1,7 @@
 import pytz
 import motor.motor_asyncio
 from bson.codec_options import CodecOptions
+from cacheout import Cache
 
 from lib.logger.logger import get_logger
 from lib.utils.singleton_factory import singleton
@@ -14,6 +15,8 @@ class InternalDB():
         self.client = motor.motor_asyncio.AsyncIOMotorClient("mongodb://localhost:27017")
         self.db = self.client.get_database('InternalDB')
         self.collection = self.db.get_collection('internal', codec_options=CodecOptions(tz_aware=True, tzinfo=pytz.utc))
+        # The ban list is checked for every command, bans set by another process apply within the TTL
+        self.ban_cache = Cache(maxsize=1, ttl=60)
         
     async def set_actual_premium_users(self, users: list[int]) -> None:
         if await self.collection.find_one({'name': 'internal_info'}) is None:
@@ -36,20 +39,24 @@ class InternalDB():
                 {'name': 'internal_info'},
                 {'$push': {'banned_users': user_id}},
             )
+        self.ban_cache.clear()
     
     async def remove_ban(self, user_id: int) -> None:
         await self.collection.update_one(
             {'name': 'internal_info'},
             {'$pull': {'banned_users': user_id}},
         )
+        self.ban_cache.clear()
         
     async def check_ban(self, user_id: int) -> bool:
-        data = await self.collection.find_one({'name': 'internal_info'})
+        banned_users: set[int] | None = self.ban_cache.get('banned_users')
         
-        try:
-            return user_id in data['banned_users']
-        except KeyError:
-            return False
+        if banned_users is None:
+            data = await self.collection.find_one({'name': 'internal_info'}, {'banned_users': 1})
+            banned_users = set(data.get('banned_users', [])) if data is not None else set()
+            self.ban_cache.set('banned_users', banned_users)
+            
+        return user_id in banned_users
         
     async def get_actual_premium_users(self) -> list[int]:
         data = await self.collection.find_one({'name': 'internal_info'})
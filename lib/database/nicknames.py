@@ -0,0 +1,85 @@
+from datetime import datetime
+
+import pytz
+from cacheout import Cache
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import PyMongoError
+
+from lib.logger.logger import get_logger
+from lib.utils.singleton_factory import singleton
+
+_log = get_logger(__file__, 'NicknamesDBLogger', 'logs/nicknames_db.log')
+
+
+@singleton
+class NicknamesDB:
+    """
+    Resolution index of `(lower_nickname, region) -> account_id`.
+
+    Built from the account data returned by the game API, so a nickname lookup
+    does not need the `account/list` request. The index is only a hint:
+    the caller has to check the nickname in the `account/info` response.
+    Database errors are logged and handled as a missing entry.
+    """
+    def __init__(self) -> None:
+        self.client = AsyncIOMotorClient("mongodb://localhost:27017")
+        self.db = self.client.get_database('NicknamesDB')
+        self.collection = self.db.get_collection('nicknames')
+        # Recently resolved or written entries, saves the database round-trip for popular nicknames
+        self.cache = Cache(maxsize=10000, ttl=3600)
+        
+    @staticmethod
+    def _key(nickname: str, region: str) -> str:
+        return f'{region}:{nickname.lower()}'
+        
+    async def get(self, nickname: str, region: str) -> int | None:
+        key = self._key(nickname, region)
+        account_id = self.cache.get(key)
+        
+        if account_id is not None:
+            return account_id
+        
+        try:
+            data = await self.collection.find_one({'_id': key}, {'account_id': 1})
+        except PyMongoError:
+            _log.warning(f'Failed to resolve nickname {key}', exc_info=True)
+            return None
+        
+        if data is None:
+            return None
+        
+        self.cache.set(key, data['account_id'])
+        return data['account_id']
+    
+    async def set(self, nickname: str, region: str, account_id: int) -> None:
+        key = self._key(nickname, region)
+        account_id = int(account_id)
+        
+        if self.cache.get(key) == account_id:
+            return
+        
+        try:
+            await self.collection.update_one(
+                {'_id': key},
+                {'$set': {
+                    'lower_nickname': nickname.lower(),
+                    'region': region,
+                    'account_id': account_id,
+                    'updated_at': datetime.now(pytz.utc)
+                }},
+                upsert=True
+            )
+        except PyMongoError:
+            _log.warning(f'Failed to save nickname {key}', exc_info=True)
+            return
+        
+        self.cache.set(key, account_id)
+        
+    async def delete(self, nickname: str, region: str) -> None:
+        key = self._key(nickname, region)
+        self.cache.delete(key)
+        
+        try:
+            await self.collection.delete_one({'_id': key})
+        except PyMongoError:
+            _log.warning(f'Failed to delete nickname {key}', exc_info=True)
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from asyncio import sleep
 from types import NoneType
@@ -12,6 +13,7 @@ from lib.data_classes.db_player import (
     DBPlayer,
     HookStats,
     ImageSettings,
+    PartialDBPlayer,
     SessionSettings, 
     StatsViewSettings, 
     WidgetSettings,
@@ -23,10 +25,14 @@ from lib.data_classes.db_player import (
     SlotAccessState
 )
 from lib.data_classes.db_player_old import DBPlayerOld
+from lib.database.analytics_buffer import AnalyticsBuffer
+from lib.database.images import ImagesDB
+from lib.database.snapshots import SnapshotsDB
 from lib.exceptions import database
 from lib.logger.logger import get_logger
 from lib.settings.settings import Config
-from lib.utils.calculate_exp import exp_add
+from lib.utils.analytics_update import build_analytics_update, build_cached_analytics_update, get_commands_exp
+from lib.utils.member_scope import cache_member, get_cached, is_cached, update_cached_member
 from lib.utils.singleton_factory import singleton
 from lib.utils.validate_badges import validate_badge
 
@@ -40,6 +46,11 @@ class PlayersDB:
         self.client = motor.motor_asyncio.AsyncIOMotorClient("mongodb://localhost:27017")
         self.db = self.client['PlayersDB']
         self.collection = self.db.get_collection('players', codec_options=CodecOptions(tz_aware=True, tzinfo=pytz.utc))
+        # Large values referenced by the players documents
+        self.images = ImagesDB()
+        self.snapshots = SnapshotsDB()
+        # Written by `AnalyticsWorker`, see `set_analytics`
+        self.analytics = AnalyticsBuffer(self.collection)
     
     async def _multi_args_member_checker(self, member_id: int | str | None = None, member: DBPlayer | None = None, raise_error: bool = True) -> DBPlayer:
         """
@@ -68,6 +79,63 @@ class PlayersDB:
         else:
             return member
         
+    async def _update_member(
+        self, 
+        member_id: int | str, 
+        update: dict | list[dict], 
+        condition: dict | None = None,
+        cache_update: dict | None = None
+        ) -> bool:
+        """
+        Applies a MongoDB update document to the member and to the member object cached by `member_scope`.
+
+        Args:
+            member_id (int | str): The ID of the member.
+            update (dict | list[dict]): The update document or pipeline.
+            condition (dict | None, optional): Additional filter, the member is not updated if it does not match.
+            cache_update (dict | None, optional): Update document applied to the cached member instead of `update`,
+            for pipelines. The cached member is dropped if a pipeline is applied without it.
+
+        Returns:
+            bool: True if the member was updated, False if it does not exist or does not match `condition`.
+        """
+        member_id = int(member_id)
+        result = await self.collection.update_one({'id': member_id} | (condition or {}), update)
+        if result.matched_count == 0:
+            return False
+        
+        update_cached_member(member_id, cache_update or update)
+        return True
+        
+    async def _partial_member_checker(
+        self, 
+        fields: Iterable[str], 
+        member_id: int | str | None = None, 
+        member: DBPlayer | None = None, 
+        raise_error: bool = True
+        ) -> DBPlayer | PartialDBPlayer | None:
+        """
+        Same as `_multi_args_member_checker`, but reads only `fields` of the document
+        if the member object is not provided.
+
+        Args:
+            fields (Iterable[str]): Field paths the caller needs, e.g. `profile.badges`.
+            member_id (int | str | None): The ID of the member.
+            member (DBPlayer | None): The member object.
+            raise_error (bool, optional): Whether to raise MemberNotFound if the member does not exist. Defaults to True.
+
+        Returns:
+            DBPlayer | PartialDBPlayer | None: The member object if it is not None, otherwise the partial
+            document of the member, None if it does not exist and `raise_error` is False.
+        """
+        if (member_id is None) and (member is None):
+            raise ValueError('You must provide either id or member')
+        
+        if member is None:
+            return await self.get_member_fields(member_id, fields, raise_error=raise_error)
+        else:
+            return member
+        
     async def create_index_for_id(self):
         """
         Asynchronously creates an index on the 'id' field of the collection.
@@ -137,6 +205,16 @@ class PlayersDB:
         """
         return await self.collection.distinct('id')
     
+    async def _dump_game_account(self, member_id: int, slot: AccountSlotsEnum, game_account: GameAccount) -> dict:
+        """
+        Serializes a game account for the players document, its `last_stats` are stored in `SnapshotsDB`.
+        """
+        data = game_account.model_dump(exclude={'last_stats'})
+        if game_account.last_stats is not None:
+            data['last_stats_id'] = await self.snapshots.set(member_id, slot.name, game_account.last_stats)
+            
+        return data
+    
     async def set_member(self, slot: AccountSlotsEnum, member_id: int | str, game_account: GameAccount, slot_override: bool = False) -> None:
         """
         Sets a member's game account in the specified slot or creates a new member if it doesn't exist.
@@ -163,17 +241,21 @@ class PlayersDB:
             await self.check_access_to_slot(slot, member=member)
             slot_is_empty = await self.check_slot_empty(slot, member=member, raise_error=False)
             if slot_is_empty or slot_override:
-                await self.collection.update_one(
-                    {'id': member_id},
-                    {'$set': {f'game_accounts.{slot.name}': game_account.model_dump()}}
+                if not slot_is_empty:
+                    # The session of the replaced account
+                    await self.snapshots.delete(self.snapshots.get_id(member_id, slot.name))
+                    
+                await self._update_member(
+                    member_id,
+                    {'$set': {f'game_accounts.{slot.name}': await self._dump_game_account(member_id, slot, game_account)}}
                 )
         else:
-            await self.collection.insert_one({
+            document = {
                 'id': member_id,
                 'lang' : None,
-                'image' : None,
+                'image_id' : None,
                 'game_accounts':{
-                    'slot_1': game_account.model_dump(),
+                    'slot_1': await self._dump_game_account(member_id, AccountSlotsEnum.slot_1, game_account),
                     'slot_2': None,
                     'slot_3': None,
                     'slot_4': None,
@@ -181,7 +263,10 @@ class PlayersDB:
                 },
                 'profile': Profile().model_dump(),
                 'current_game_account': AccountSlotsEnum.slot_1.name
-            })
+            }
+            await self.collection.insert_one(document)
+            # The member may be cached as missing
+            cache_member(member_id, DBPlayer.model_validate(document))
         
             
     async def get_member(self, member_id: int | str, raise_error: bool = True) -> DBPlayer | bool:
@@ -197,6 +282,44 @@ class PlayersDB:
         member: DBPlayer = await self.check_member_exists(member_id=member_id, get_if_exist=True, raise_error=raise_error)
         return member
     
+    async def get_member_fields(self, member_id: int | str, fields: Iterable[str], raise_error: bool = True) -> PartialDBPlayer | None:
+        """
+        Asynchronously retrieves only the specified fields of a member.
+        
+        The full document holds the settings of all slots,
+        getters that need a few small fields should use this method instead of `get_member`.
+
+        Args:
+            member_id (int | str): The ID of the member to retrieve.
+            fields (Iterable[str]): Field paths to retrieve, e.g. `lang` or `profile.level_exp`.
+            Game accounts can only be retrieved as whole slots, e.g. `game_accounts.slot_1`.
+            raise_error (bool, optional): Whether to raise MemberNotFound if the member does not exist. Defaults to True.
+
+        Returns:
+            PartialDBPlayer | None: The partial document of the member, None if it does not exist and `raise_error` is False.
+
+        Raises:
+            MemberNotFound: If raise_error is True and the member does not exist.
+        """
+        member_id = int(member_id)
+        if is_cached(member_id):
+            # The full member read earlier in this command has all the fields
+            member = get_cached(member_id)
+            if member is None and raise_error:
+                raise database.MemberNotFound()
+            return member
+        
+        projection = {'_id': 0, 'id': 1} | {field: 1 for field in fields}
+        result = await self.collection.find_one({'id': member_id}, projection)
+        
+        if result is None:
+            if raise_error:
+                _log.info(f'Player with id {member_id} not found')
+                raise database.MemberNotFound()
+            return None
+        
+        return PartialDBPlayer.model_validate(result)
+    
     async def get_slot_state(self, slot: AccountSlotsEnum, member_id: int | str | None = None, member: DBPlayer | None = None) -> SlotAccessState:
         """
         Asynchronously retrieves the state of a game slot for a given member.
@@ -342,6 +465,9 @@ class PlayersDB:
             None: This function does not return anything.
         """
         await self.collection.delete_one({'id': member_id})
+        cache_member(int(member_id), None)
+        await self.images.delete_member(member_id)
+        await self.snapshots.delete_member(member_id)
         
     async def check_member_exists(self, member_id: int | str, get_if_exist: bool = False, raise_error: bool = True) -> bool | DBPlayer:
         """
@@ -360,7 +486,21 @@ class PlayersDB:
             MemberNotFound: If raise_error is True and the player does not exist.
         """
         member_id = int(member_id)
-        result = await self.collection.find_one({'id': member_id})
+        if is_cached(member_id):
+            player = get_cached(member_id)
+            if raise_error and (player is None):
+                raise database.MemberNotFound()
+            
+            if get_if_exist:
+                return player if player is not None else False
+            return player is not None
+        
+        # Existence checks do not need the document itself
+        projection = None if get_if_exist else {'_id': 1}
+        result = await self.collection.find_one({'id': member_id}, projection)
+        
+        if result is None:
+            cache_member(member_id, None)
         
         if raise_error and (result is None):
             _log.info(f'Player with id {member_id} not found')
@@ -369,6 +509,7 @@ class PlayersDB:
         if get_if_exist:
             if result is not None:
                 player = DBPlayer.model_validate(result)
+                cache_member(member_id, player)
                 return player
             else:
                 return False
@@ -452,8 +593,8 @@ class PlayersDB:
         if curr_slot.value > 2:
             await self.set_current_account(member_id=member.id, slot=AccountSlotsEnum.slot_1, validate=False)
         
-        await self.collection.update_one(
-            {'id': member.id}, 
+        await self._update_member(
+            member.id,
             {'$set': {'profile.premium': False, 'profile.premium_time': None}}
         )
         
@@ -475,8 +616,8 @@ class PlayersDB:
         """
         _log.info(f'Setting premium for id {member_id}, end_time: {end_time}')
         end_time = datetime.now(pytz.utc) + timedelta(days=14) if end_time is None else end_time
-        await self.collection.update_one(
-            {'id': int(member_id)},
+        await self._update_member(
+            int(member_id),
             {'$set': {'profile.premium': True, 'profile.premium_time': end_time}}
         )
         
@@ -506,7 +647,7 @@ class PlayersDB:
         """
         # TODO: For the premium check to work, remove the return and uncomment the code below
         #
-        # member = await self._multi_args_member_checker(member_id, member)
+        # member = await self._partial_member_checker(('profile.premium', 'profile.premium_time'), member_id, member)
         
         # premium = member.profile.premium
         # premium_time = member.profile.premium_time
@@ -559,7 +700,7 @@ class PlayersDB:
         Returns:
             AccountSlotsEnum: The current game slot associated with the specified member.
         """
-        member = await self._multi_args_member_checker(member_id, member)
+        member = await self._partial_member_checker(('current_game_account',), member_id, member)
         return AccountSlotsEnum[member.current_game_account]
         
     async def start_session(self, slot: AccountSlotsEnum, member_id: int | str, last_stats: PlayerGlobalData, session_settings: SessionSettings) -> None:
@@ -577,13 +718,15 @@ class PlayersDB:
         """
         member = await self.check_member_exists(member_id, get_if_exist=True)
         slot = await self.validate_slot(member=member, slot=slot)
-        await self.collection.update_one(
-            {'id': member_id},
-            {'$set': 
-                {
-                    f'game_accounts.{slot.name}.last_stats': last_stats.model_dump(),
+        last_stats_id = await self.snapshots.set(member.id, slot.name, last_stats)
+        await self._update_member(
+            member.id,
+            {
+                '$set': {
+                    f'game_accounts.{slot.name}.last_stats_id': last_stats_id,
                     f'game_accounts.{slot.name}.session_settings': session_settings.model_dump(),
-                }
+                },
+                '$unset': {f'game_accounts.{slot.name}.last_stats': ''}
             },
         )
     
@@ -672,6 +815,7 @@ class PlayersDB:
         """
         member = await self._multi_args_member_checker(member_id, member)
         slot = await self.validate_slot(member=member, slot=slot)
+        await self.load_last_stats(member, [slot])
         last_stats = getattr(member.game_accounts, slot.name).last_stats
         if last_stats is None:
             _log.warn(f'Member {member.id} has no last stats in slot {slot.name}')
@@ -725,10 +869,14 @@ class PlayersDB:
             None: This function does not return anything.
         """
         slot = await self.validate_slot(member_id=member_id, slot=slot)
-        await self.collection.update_one(
-            {'id': member_id},
-            {'$set': {f'game_accounts.{slot.name}.last_stats': None}}
+        await self._update_member(
+            member_id,
+            {
+                '$set': {f'game_accounts.{slot.name}.last_stats_id': None},
+                '$unset': {f'game_accounts.{slot.name}.last_stats': ''}
+            }
         )
+        await self.snapshots.delete(self.snapshots.get_id(member_id, slot.name))
     
     async def check_member_last_stats(self, slot: AccountSlotsEnum, member_id: int | str | None = None, member: DBPlayer | None = None, premium_bypass: bool = False) -> bool:
         """
@@ -746,9 +894,9 @@ class PlayersDB:
         member = await self._multi_args_member_checker(member_id, member)
         slot = await self.validate_slot(member=member, slot=slot)
         game_account: GameAccount = getattr(member.game_accounts, slot.name)
-        last_stats = game_account.last_stats
         session_settings = game_account.session_settings
-        if last_stats is None:
+        # The snapshot itself is not needed, documents not moved by `move_blobs` still hold it inline
+        if game_account.last_stats_id is None and game_account.last_stats is None:
             return False
         else:
             if session_settings.last_get + timedelta(seconds=_config.session.ttl) < datetime.now(pytz.utc):
@@ -825,13 +973,15 @@ class PlayersDB:
         curr_slot = await self.get_current_game_slot(member_id, member) if slot is None else slot
         restart_time = session_settings.time_to_restart + timedelta(days=1)
         session_settings.time_to_restart = restart_time
-        await self.collection.update_one(
-            {'id': member_id},
-            {'$set': 
-                {
-                    f'game_accounts.{curr_slot.name}.last_stats': last_stats.model_dump(), 
+        last_stats_id = await self.snapshots.set(member.id, curr_slot.name, last_stats)
+        await self._update_member(
+            member.id,
+            {
+                '$set': {
+                    f'game_accounts.{curr_slot.name}.last_stats_id': last_stats_id, 
                     f'game_accounts.{curr_slot.name}.session_settings': session_settings.model_dump(),
-                }
+                },
+                '$unset': {f'game_accounts.{curr_slot.name}.last_stats': ''}
             }
         )
         
@@ -870,8 +1020,9 @@ class PlayersDB:
         Returns:
             str | None: The language of the member if it exists, otherwise None.
         """
-        member = await self._multi_args_member_checker(member_id, member, raise_error=False)
-        return DBPlayer.model_validate(member).lang if member is not None else None
+        # Called for every command by `Text().load_from_context`
+        member = await self._partial_member_checker(('lang',), member_id, member, raise_error=False)
+        return member.lang if member is not None else None
     
     async def set_lang(self, member_id: int | str, lang: str | None) -> None:
         """
@@ -886,8 +1037,8 @@ class PlayersDB:
 
         This function updates the 'lang' field of the member with the given ID in the database. If the language is None, it sets the language field to None.
         """
-        await self.collection.update_one(
-            {'id': int(member_id)},
+        await self._update_member(
+            int(member_id),
             {'$set': {'lang': lang}}
         )
     
@@ -921,8 +1072,8 @@ class PlayersDB:
         """
         member = await self.check_member_exists(member_id, get_if_exist=True)
         slot = await self.validate_slot(slot=slot, member=member)
-        await self.collection.update_one(
-            {'id': member.id},
+        await self._update_member(
+            member.id,
             {'$set': {f'game_accounts.{slot.name}.lock': lock}}
         )
     
@@ -937,7 +1088,7 @@ class PlayersDB:
         Returns:
             None: This function does not return anything.
 
-        This function updates the 'image' field of the member with the given ID in the database. If the image is None, it sets the image field to None.
+        The image is stored in `ImagesDB` and referenced by the 'image_id' field of the member. If the image is None, the reference is set to None.
         """
         if not isinstance(image, (str, NoneType)):
             raise TypeError(f'image must be either a string or None, not {image.__class__.__name__}')
@@ -946,10 +1097,16 @@ class PlayersDB:
             if len(image) == 0:
                 image = None
         
-        member = await self.check_member_exists(member_id, get_if_exist=True)
-        await self.collection.update_one(
-            {'id': member.id},
-            {'$set': {'image': image}}
+        member = await self.get_member_fields(member_id, ())
+        if image is None:
+            await self.images.delete_member(member.id)
+            image_id = None
+        else:
+            image_id = await self.images.set(member.id, image)
+            
+        await self._update_member(
+            member.id,
+            {'$set': {'image_id': image_id}, '$unset': {'image': ''}}
         )
         
     async def set_stats_view_settings(self, slot: AccountSlotsEnum | None, member_id: int | str, settings: StatsViewSettings) -> None:
@@ -966,8 +1123,8 @@ class PlayersDB:
         """
         member = await self.check_member_exists(member_id, get_if_exist=True)
         slot = await self.validate_slot(member=member, slot=slot)
-        await self.collection.update_one(
-            {'id': member.id},
+        await self._update_member(
+            member.id,
             {'$set': {f'game_accounts.{slot.name}.stats_view_settings': settings.model_dump()}}
         )
         
@@ -985,8 +1142,8 @@ class PlayersDB:
         """
         member = await self.check_member_exists(member_id, get_if_exist=True)
         slot = await self.validate_slot(member=member, slot=slot)
-        await self.collection.update_one(
-            {'id': member.id},
+        await self._update_member(
+            member.id,
             {'$set': {f'game_accounts.{slot.name}.image_settings': settings.model_dump()}}
         )
         
@@ -1001,14 +1158,51 @@ class PlayersDB:
         Returns:
             str | None: The image of the member if it exists, otherwise None.
         """
-        member = await self._multi_args_member_checker(member_id, member)
+        member = await self._partial_member_checker(('image', 'image_id'), member_id, member)
+        await self.load_image(member)
         return member.image
     
+    async def load_image(self, member: DBPlayer | PartialDBPlayer | None) -> DBPlayer | PartialDBPlayer | None:
+        """
+        Loads the custom background of the member into `member.image`, if it has one.
+        The image is not read with the member document, code that renders it must call this method first.
+
+        Args:
+            member (DBPlayer | PartialDBPlayer | None): The member object, None is returned as is.
+
+        Returns:
+            DBPlayer | PartialDBPlayer | None: The same member object.
+        """
+        if member is not None and member.image is None and member.image_id is not None:
+            member.image = await self.images.get(member.image_id)
+            
+        return member
+    
+    async def load_last_stats(self, member: DBPlayer, slots: Iterable[AccountSlotsEnum] | None = None) -> DBPlayer:
+        """
+        Loads the session snapshots of the member into `last_stats` of its game accounts.
+        The snapshots are not read with the member document, code that diffs them must call this method
+        or `get_last_stats` first.
+
+        Args:
+            member (DBPlayer): The member object.
+            slots (Iterable[AccountSlotsEnum] | None, optional): The slots to load. Defaults to all slots.
+
+        Returns:
+            DBPlayer: The same member object.
+        """
+        for slot in AccountSlotsEnum if slots is None else slots:
+            game_account: GameAccount | None = getattr(member.game_accounts, slot.name)
+            if game_account is not None and game_account.last_stats is None and game_account.last_stats_id is not None:
+                game_account.last_stats = await self.snapshots.get(game_account.last_stats_id)
+                
+        return member
+    
     async def set_session_settings(self, slot: AccountSlotsEnum, member_id: int | str, settings: SessionSettings) -> None:
         member = await self.check_member_exists(member_id, get_if_exist=True)
         slot = await self.validate_slot(member=member, slot=slot)
-        await self.collection.update_one(
-            {'id': member.id},
+        await self._update_member(
+            member.id,
             {'$set': {f'game_accounts.{slot.name}.session_settings': settings.model_dump()}}
         )
         
@@ -1021,49 +1215,49 @@ class PlayersDB:
     async def set_widget_settings(self, slot: AccountSlotsEnum, member_id: int | str, settings: WidgetSettings) -> None:
         member = await self.check_member_exists(member_id, get_if_exist=True)
         slot = await self.validate_slot(member=member, slot=slot)
-        await self.collection.update_one(
-            {'id': member.id},
+        await self._update_member(
+            member.id,
             {'$set': {f'game_accounts.{slot.name}.widget_settings': settings.model_dump()}}
         )
         
     async def set_current_account(self, member_id: int | str, slot: AccountSlotsEnum, validate: bool = True) -> None:
         member = await self.check_member_exists(member_id, get_if_exist=True)
         slot = await self.validate_slot(member=member, slot=slot) if validate else slot
-        await self.collection.update_one(
-            {'id': member.id},
+        await self._update_member(
+            member.id,
             {'$set': {'current_game_account': slot.name}}
         )
         
     async def set_verification(self, member_id: int | str, slot: AccountSlotsEnum, verified: bool) -> None:
         member = await self.check_member_exists(member_id, get_if_exist=True)
         slot = await self.validate_slot(member=member, slot=slot)
-        await self.collection.update_one(
-            {'id': int(member_id)},
+        await self._update_member(
+            int(member_id),
             {'$set': {f'game_accounts.{slot.name}.verified': verified}}
         )
         
     async def get_member_exp(self, member_id: int | str | None = None, member: DBPlayer | None = None) -> int:
-        member = await self._multi_args_member_checker(member_id, member)
+        member = await self._partial_member_checker(('profile.level_exp',), member_id, member)
         return member.profile.level_exp
     
     async def set_member_exp(self, member_id: int | str, exp: int) -> None:
-        await self.collection.update_one(
-            {'id': int(member_id)},
+        await self._update_member(
+            int(member_id),
             {'$set': {'profile.level_exp': exp}}
         )
         
     async def set_last_activity(self, member_id: int | str, time: datetime = datetime.now(pytz.utc)) -> None:
-        await self.collection.update_one(
-            {'id': member_id},
+        await self._update_member(
+            member_id,
             {'$set': {'profile.last_activity': time}}
         )
     
     async def get_last_activity(self, member_id: int | str | None = None, member: DBPlayer | None = None) -> datetime:
-        member = await self._multi_args_member_checker(member_id, member)
+        member = await self._partial_member_checker(('profile.last_activity',), member_id, member)
         return member.profile.last_activity
         
     async def get_analytics(self, member_id: int | str | None = None, member: DBPlayer | None = None, raw: bool = False) -> list[UsedCommand] | list[dict]:
-        member = await self._multi_args_member_checker(member_id, member)
+        member = await self._partial_member_checker(('profile.used_commands',), member_id, member)
         if len(member.profile.used_commands) == 0:
             return []
         
@@ -1073,31 +1267,42 @@ class PlayersDB:
         return member.profile.used_commands
         
     async def set_analytics(self, analytics: UsedCommand, member: DBPlayer | None = None, member_id: int | str | None = None) -> None:
-        member = await self._multi_args_member_checker(member_id, member)
-        used_commands: list[dict] = await self.get_analytics(member=member, raw=True)
+        """
+        Records a used command: keeps the last 10 commands, counts the command and adds level experience.
+        Commands used within 10 seconds of the previous one add 1 experience point.
+
+        The member is not read, each command is a single atomic write, so concurrent commands do not lose updates.
+        While the analytics worker runs, the command is queued and written in a batch, see `AnalyticsBuffer`.
+        Either way the member cached in the current `member_scope` is updated at once.
+
+        Raises:
+            ValueError: If neither member_id nor member is provided.
+            MemberNotFound: If the member does not exist, only checked when the command is written directly.
+        """
+        if (member_id is None) and (member is None):
+            raise ValueError('You must provide either id or member')
         
-        if (datetime.now(pytz.utc) - member.profile.last_activity) > timedelta(seconds=10):
-            level_exp = exp_add(analytics.name)
-        else:
-            level_exp = 1
+        member_id = member.id if member is not None else int(member_id)
+        now = datetime.now(pytz.utc)
         
-        if len(used_commands) >= 10:
-            used_commands.pop(0)
-            
-        used_commands.append(analytics.model_dump())
-        last_activity = datetime.now(pytz.utc)
-        
-        await self.collection.update_one(
-            {'id': member.id},
-            {'$set': {
-                'profile.used_commands': used_commands, 
-                'profile.last_activity': last_activity,
-                'profile.commands_counter' : member.profile.commands_counter + 1,
-                'profile.level_exp' : member.profile.level_exp + level_exp
-                }
-            }
+        commands = [(analytics, now)]
+        exp = get_commands_exp(commands)
+        cached = get_cached(member_id)
+        cache_update = (
+            build_cached_analytics_update(commands, exp, cached.profile.last_activity)
+            if cached is not None else None
         )
         
+        if self.analytics.put(member_id, analytics, now):
+            if cache_update is not None:
+                update_cached_member(member_id, cache_update)
+            return
+        
+        # The cooldown is checked by the update itself against the stored last activity
+        if not await self._update_member(member_id, build_analytics_update(commands, exp), cache_update=cache_update):
+            _log.info(f'Player with id {member_id} not found')
+            raise database.MemberNotFound()
+        
     async def set_badges(self, member_id: int | str, badges: list[str]) -> None:
         member = await self.check_member_exists(member_id, get_if_exist=True)
         validated_badges = [validate_badge(badge) for badge in badges if validate_badge(badge) is not None]
@@ -1108,31 +1313,31 @@ class PlayersDB:
             _log.warn(f'Badges {badges} are not valid')
             return
         
-        await self.collection.update_one(
-            {'id': member.id},
+        await self._update_member(
+            member.id,
             {'$set': {'profile.badges': list(validated_badges)}}
         )
         
     async def get_badges(self, member_id: int | str | None = None, member: DBPlayer | None = None) -> list[str]:
-        member = await self._multi_args_member_checker(member_id, member)
+        member = await self._partial_member_checker(('profile.badges',), member_id, member)
         return member.profile.badges
     
     async def remove_badges(self, member_id: int | str, badges: list[str]) -> None:
         member = await self.check_member_exists(member_id, get_if_exist=True)
-        await self.collection.update_one(
-            {'id': member.id},
+        await self._update_member(
+            member.id,
             {'$pull': {'profile.badges': {'$in': badges}}}
         )
     
     async def check_badges(self, member_id: int | str | None = None, member: DBPlayer | None = None) -> None:
-        member = await self._multi_args_member_checker(member_id, member)
+        member = await self._partial_member_checker(('profile.badges',), member_id, member)
         for badge in member.profile.badges:
             badge_validated = validate_badge(badge)
             if badge_validated is None:
                 member.profile.badges.remove(badge)
                 
-        await self.collection.update_one(
-            {'id': member.id},
+        await self._update_member(
+            member.id,
             {'$set': {'profile.badges': member.profile.badges}}
         )
         
@@ -1142,14 +1347,14 @@ class PlayersDB:
         if isinstance(badge, BadgesEnum):
             badge = badge.name
             
-        await self.collection.update_one(
-            {'id': member.id},
+        await self._update_member(
+            member.id,
             {'$pull': {'profile.badges': badge}}
         )
         
     async def disable_stats_hook(self, member_id: int | str, slot: AccountSlotsEnum) -> None:
-        await self.collection.update_one(
-            {'id': member_id},
+        await self._update_member(
+            member_id,
             {'$set': {f'game_accounts.{slot.name}.hook_stats.active': False}}
         )
 
@@ -1159,8 +1364,8 @@ class PlayersDB:
         slot: AccountSlotsEnum,
         hook: HookStats,
     ) -> None:
-        await self.collection.update_one(
-            {'id': member_id},
+        await self._update_member(
+            member_id,
             {'$set': {f'game_accounts.{slot.name}.hook_stats': hook.model_dump()}}
         )
 
@@ -1213,3 +1418,58 @@ class PlayersDB:
             
             _log.debug(f'DB: Player {old_member.id} updated')
             await sleep(0.01)
+
+    async def move_blobs(self) -> None:
+        """
+        Moves the background images and the session snapshots stored inline by older versions
+        to `ImagesDB` and `SnapshotsDB`, the players documents keep only the references.
+        Documents without inline data are skipped, so the migration can be run again.
+
+        Note:
+            Use one time only, after updating. Documents that are not moved yet are still read correctly.
+        """
+        cursor = self.collection.find(
+            {
+                '$or': [
+                    {'image': {'$exists': True}},
+                    *[{f'game_accounts.{slot.name}.last_stats': {'$exists': True}} for slot in AccountSlotsEnum]
+                ]
+            }
+        )
+        moved = 0
+        
+        async for member in cursor:
+            to_set = {}
+            to_unset = {}
+            
+            if 'image' in member:
+                to_unset['image'] = ''
+                if member['image']:
+                    to_set['image_id'] = await self.images.set(member['id'], member['image'])
+                elif member.get('image_id') is None:
+                    to_set['image_id'] = None
+                    
+            for slot in AccountSlotsEnum:
+                game_account = (member.get('game_accounts') or {}).get(slot.name)
+                if game_account is None or 'last_stats' not in game_account:
+                    continue
+                
+                to_unset[f'game_accounts.{slot.name}.last_stats'] = ''
+                if game_account['last_stats'] is not None:
+                    to_set[f'game_accounts.{slot.name}.last_stats_id'] = await self.snapshots.set(
+                        member['id'], slot.name, game_account['last_stats']
+                    )
+                elif game_account.get('last_stats_id') is None:
+                    to_set[f'game_accounts.{slot.name}.last_stats_id'] = None
+            
+            update = {'$unset': to_unset}
+            if to_set:
+                update['$set'] = to_set
+                
+            await self.collection.update_one({'_id': member['_id']}, update)
+            moved += 1
+            
+            _log.debug(f'DB: Player {member["id"]} blobs moved')
+            await sleep(0.01)
+            
+        _log.info(f'DB: blobs of {moved} players moved')
@@ -0,0 +1,69 @@
+import pytz
+from motor.motor_asyncio import AsyncIOMotorClient
+from bson.codec_options import CodecOptions
+
+from lib.data_classes.api.api_data import PlayerGlobalData
+from lib.logger.logger import get_logger
+from lib.utils.singleton_factory import singleton
+
+_log = get_logger(__file__, 'SnapshotsDBLogger', 'logs/snapshots_db.log')
+
+
+@singleton
+class SnapshotsDB:
+    """
+    Session `last_stats` snapshots of the game accounts, one per member slot.
+
+    A snapshot holds the stats of every tank of the player, so it is kept out of the players document
+    and referenced by `GameAccount.last_stats_id`. See `PlayersDB.load_last_stats`.
+    """
+    def __init__(self) -> None:
+        self.client = AsyncIOMotorClient("mongodb://localhost:27017")
+        self.db = self.client.get_database('PlayersDB')
+        self.collection = self.db.get_collection('last_stats', codec_options=CodecOptions(tz_aware=True, tzinfo=pytz.utc))
+        self._index_created = False
+        
+    async def _create_index(self) -> None:
+        if self._index_created:
+            return
+        
+        await self.collection.create_index('member_id')
+        self._index_created = True
+        
+    @staticmethod
+    def get_id(member_id: int | str, slot_name: str) -> str:
+        return f'{member_id}:{slot_name}'
+        
+    async def get(self, snapshot_id: str) -> PlayerGlobalData | None:
+        data = await self.collection.find_one({'_id': snapshot_id}, {'data': 1})
+        if data is None:
+            _log.warning(f'Snapshot {snapshot_id} is referenced but not found')
+            return None
+        
+        return PlayerGlobalData.model_validate(data['data'])
+    
+    async def set(self, member_id: int | str, slot_name: str, last_stats: PlayerGlobalData | dict) -> str:
+        """
+        Stores the snapshot of the member slot, replacing the previous one.
+
+        Returns:
+            str: The ID to reference the snapshot by.
+        """
+        await self._create_index()
+        snapshot_id = self.get_id(member_id, slot_name)
+        if isinstance(last_stats, PlayerGlobalData):
+            last_stats = last_stats.model_dump()
+            
+        await self.collection.replace_one(
+            {'_id': snapshot_id},
+            {'member_id': int(member_id), 'data': last_stats},
+            upsert=True
+        )
+        return snapshot_id
+    
+    async def delete(self, snapshot_id: str) -> None:
+        await self.collection.delete_one({'_id': snapshot_id})
+    
+    async def delete_member(self, member_id: int | str) -> None:
+        await self._create_index()
+        await self.collection.delete_many({'member_id': int(member_id)})
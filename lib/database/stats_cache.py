@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+import pytz
+from motor.motor_asyncio import AsyncIOMotorClient
+from bson.codec_options import CodecOptions
+
+from lib.logger.logger import get_logger
+from lib.utils.singleton_factory import singleton
+
+_log = get_logger(__file__, 'StatsCacheDBLogger', 'logs/stats_cache_db.log')
+
+
+@singleton
+class StatsCacheDB:
+    """
+    Shared tier of the player stats cache.
+
+    Entries are stored as serialized JSON and removed by a TTL index on `expires_at`,
+    so a restarted process or another bot instance starts with warm entries.
+    """
+    def __init__(self) -> None:
+        self.client = AsyncIOMotorClient("mongodb://localhost:27017")
+        self.db = self.client.get_database('StatsCacheDB')
+        self.collection = self.db.get_collection('stats', codec_options=CodecOptions(tz_aware=True, tzinfo=pytz.utc))
+        self._index_created = False
+        
+    async def _create_index(self) -> None:
+        if self._index_created:
+            return
+        
+        await self.collection.create_index('expires_at', expireAfterSeconds=0)
+        self._index_created = True
+        
+    async def get(self, key: str) -> bytes | None:
+        await self._create_index()
+        
+        # The TTL monitor runs once per minute, expired entries may still be in the collection
+        data = await self.collection.find_one(
+            {'_id': key, 'expires_at': {'$gt': datetime.now(pytz.utc)}},
+            {'payload': 1}
+        )
+        return data['payload'] if data is not None else None
+    
+    async def set(self, key: str, payload: bytes, ttl: int) -> None:
+        await self._create_index()
+        await self.collection.replace_one(
+            {'_id': key},
+            {'payload': payload, 'expires_at': datetime.now(pytz.utc) + timedelta(seconds=ttl)},
+            upsert=True
+        )
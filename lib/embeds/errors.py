@@ -104,6 +104,13 @@ class ErrorMSG:
             description=Text().get().frequent.errors.locked_player,
             colour=Colour.orange()
         )
+    
+    def region_unavailable(self) -> Embed:
+        return Embed(
+            title=Text().get().frequent.info.warning,
+            description=Text().get().frequent.errors.region_unavailable,
+            colour=Colour.orange()
+        )
 
     def custom(
             self,
@@ -37,6 +37,12 @@ def hook_exceptions(_log: Logger) -> Coroutine:
                 embed = err_msg.need_more_battles()
             elif isinstance(error, api.LockedPlayer):
                 embed = err_msg.locked_player()
+            elif isinstance(error, api.DeadlineExceeded):
+                _log.warning(f'Command {ctx.command.name} gave up: {error.real_exc}')
+                embed = err_msg.api_error(real_exc=error.real_exc)
+            elif isinstance(error, api.RegionUnavailable):
+                _log.warning(f'Command {ctx.command.name} rejected: {error.real_exc}')
+                embed = err_msg.region_unavailable()
             else:
                 _log.error(traceback.format_exc())
                 embed = err_msg.api_error(real_exc=error.real_exc)
@@ -34,5 +34,11 @@ class RequestsLimitExceeded(APIError):
 class APISourceNotAvailable(APIError):
     pass
 
+class RegionUnavailable(APIError):
+    pass
+
 class LockedPlayer(APIError):
+    pass
+
+class DeadlineExceeded(APIError):
     pass
\ No newline at end of file
@@ -22,6 +22,7 @@ from lib.locale.locale import Text
 from lib.logger.logger import get_logger
 from lib.settings.settings import Config
 from lib.utils.singleton_factory import singleton
+from lib.utils.deadline import check_deadline
 from lib.image.for_image.stats_coloring import colorize
 from lib.image.for_image.icons import LeaguesIcons
 from lib.image.utils.val_normalizer import ValueNormalizer
@@ -284,6 +285,8 @@ class ImageGenCommon():
             force_locale: str | None = None,
             return_image: ImageGenReturnTypes = ImageGenReturnTypes.BYTES_IO
         ) -> BytesIO | str | Image.Image:
+        check_deadline('image rendering')
+        
         if force_locale is not None:
             self.text = Text().get(force_locale)
         else:
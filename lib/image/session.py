@@ -28,6 +28,7 @@ from lib.logger.logger import get_logger
 from lib.utils.color_converter import get_tuple_from_color
 from lib.settings.settings import Config
 from lib.utils.singleton_factory import singleton
+from lib.utils.deadline import check_deadline
 from lib.image.utils.resizer import center_crop
 from lib.image.for_image.icons import LeaguesIcons
 
@@ -774,7 +775,9 @@ class ImageGenSession():
 
         Raises:
             TypeError: If the output_type is not an instance of ImageGenReturnTypes.
+            DeadlineExceeded: If the deadline of the interaction has passed.
         """
+        check_deadline('image rendering')
 
         if force_locale is not None:
             self.text = Text().load(lang=force_locale)
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+from lib.data_classes.db_player import UsedCommand
+from lib.utils.calculate_exp import exp_add
+
+# Commands used within the cooldown of the previous activity add 1 experience point
+COOLDOWN = timedelta(seconds=10)
+
+
+def get_commands_exp(commands: list[tuple[UsedCommand, datetime]]) -> tuple[int, int]:
+    """
+    Calculates the level experience of the commands used by a member, in order of use.
+
+    A command adds its full experience if it was used more than `COOLDOWN` after the previous one.
+    For the first command this depends on the stored last activity of the member.
+
+    Args:
+        commands (list[tuple[UsedCommand, datetime]]): The commands and the times they were used.
+
+    Returns:
+        tuple[int, int]: The experience if the first command is within the cooldown, and if it is not.
+    """
+    first, _ = commands[0]
+    following = 0
+    for (_, previous_at), (command, used_at) in zip(commands, commands[1:]):
+        following += exp_add(command.name) if used_at - previous_at > COOLDOWN else 1
+
+    return following + 1, following + exp_add(first.name)
+
+
+def build_analytics_update(commands: list[tuple[UsedCommand, datetime]], exp: tuple[int, int]) -> list[dict]:
+    """
+    Builds the update pipeline that records the commands of a member in a single write:
+    keeps the last 10 commands, counts the commands, adds the experience and sets the last activity.
+    The cooldown of the first command is checked against the stored last activity.
+
+    Args:
+        commands (list[tuple[UsedCommand, datetime]]): The commands and the times they were used, in order of use.
+        exp (tuple[int, int]): The experience of the commands, see `get_commands_exp`.
+    """
+    in_cooldown_exp, exp = exp
+    return [
+        {
+            '$set': {
+                'profile.used_commands': {
+                    '$slice': [
+                        {
+                            '$concatArrays': [
+                                {'$ifNull': ['$profile.used_commands', []]},
+                                {'$literal': [command.model_dump() for command, _ in commands]}
+                            ]
+                        },
+                        -10
+                    ]
+                },
+                'profile.commands_counter': {'$add': [{'$ifNull': ['$profile.commands_counter', 0]}, len(commands)]},
+                'profile.level_exp': {
+                    '$add': [
+                        {'$ifNull': ['$profile.level_exp', 0]},
+                        {'$cond': [{'$gte': ['$profile.last_activity', commands[0][1] - COOLDOWN]}, in_cooldown_exp, exp]}
+                    ]
+                },
+                'profile.last_activity': commands[-1][1],
+            }
+        }
+    ]
+
+
+def build_cached_analytics_update(
+        commands: list[tuple[UsedCommand, datetime]],
+        exp: tuple[int, int],
+        last_activity: datetime | None
+    ) -> dict:
+    """
+    Same as `build_analytics_update`, as an update document for a member whose last activity is known,
+    see `member_scope.update_cached_member`.
+    """
+    in_cooldown = last_activity is not None and last_activity >= commands[0][1] - COOLDOWN
+    return {
+        '$push': {'profile.used_commands': {'$each': [command.model_dump() for command, _ in commands], '$slice': -10}},
+        '$inc': {'profile.commands_counter': len(commands), 'profile.level_exp': exp[0] if in_cooldown else exp[1]},
+        '$set': {'profile.last_activity': commands[-1][1]},
+    }
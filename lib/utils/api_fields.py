@@ -0,0 +1,64 @@
+from collections.abc import Iterable
+from types import NoneType
+from typing import get_args, get_origin
+
+from pydantic import BaseModel
+
+
+def _nested_model(annotation: object) -> type[BaseModel] | None:
+    """
+    Returns the model inside `Optional[...]`, `list[...]` or `dict[..., ...]` annotations, if any.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    if get_origin(annotation) is None:
+        return None
+
+    for arg in get_args(annotation):
+        if arg is NoneType:
+            continue
+
+        model = _nested_model(arg)
+        if model is not None:
+            return model
+
+    return None
+
+
+def get_api_fields(model: type[BaseModel], exclude: Iterable[str] = (), prefix: str = '') -> str:
+    """
+    Builds the value of the `fields` parameter of the WG API from a response model,
+    so the API returns only the fields the model consumes.
+
+    Nested models are expanded to their own fields. Fields listed in the `_derived_fields`
+    class variable of a model are calculated by the bot and are not requested.
+
+    Args:
+        model (type[BaseModel]): The model the response is validated into.
+        exclude (Iterable[str], optional): Top level fields of the model that are not in the response.
+        prefix (str, optional): Path of the model in the response, used for nested models.
+
+    Returns:
+        str: Comma separated field paths, e.g. `nickname,statistics.all.battles`.
+
+    Usage Example:
+        >>> get_api_fields(Tank, exclude=('id',))
+        'name,tier,type'
+    """
+    derived = getattr(model, '_derived_fields', set())
+    fields = []
+
+    for name, field in model.model_fields.items():
+        if name in derived or name in exclude:
+            continue
+
+        path = f'{prefix}{field.alias or name}'
+        nested = _nested_model(field.annotation)
+
+        if nested is None:
+            fields.append(path)
+        else:
+            fields.append(get_api_fields(nested, prefix=f'{path}.'))
+
+    return ','.join(fields)
@@ -7,9 +7,14 @@ from discord import ApplicationContext
 from lib.data_classes.db_player import AccountSlotsEnum, UsedCommand
 from lib.data_classes.member_context import MemberContext, MixedApplicationContext
 from lib.utils.standard_account_validate import standard_account_validate
+from lib.utils.deadline import deadline
+from lib.utils.member_scope import member_scope
 from lib.locale.locale import Text
 from lib.database.players import PlayersDB
 from lib.exceptions.database import InvalidSlot
+from lib.settings.settings import Config
+
+_config = Config().get()
 
 P = ParamSpec('P')
 T = TypeVar('T')
@@ -41,41 +46,50 @@ def with_user_context_wrapper(
         
     # Note: 
     ### This decorator inject a MixedApplicationContext object as the first argument of the wrapped function.
+    ### The command runs with a deadline (`settings.yaml -> deadline`), API requests and image rendering
+    ### give up once the interaction can no longer be answered.
+    ### The member document is read once per command, see `member_scope`.
     """
     def decorator(wrapped_func: Callable[P, T]) -> Callable[P, Awaitable[T]]:
         @wraps(wrapped_func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
-            account = kwargs.get(slot_param_name, None)
-            ctx: ApplicationContext = args[1]
+            # The interaction must be answered within 3 s, or within the followup window after `defer`
+            budget = _config.deadline.deferred if use_defer else _config.deadline.immediate
+            
+            with deadline(budget), member_scope():
+                account = kwargs.get(slot_param_name, None)
+                ctx: ApplicationContext = args[1]
             
-            await Text().load_from_context(ctx)
+                # Fills the member cache, the lang and account checks below read it
+                await PlayersDB().get_member(ctx.author.id, raise_error=False)
+                await Text().load_from_context(ctx)
             
-            if use_defer:
-                await ctx.defer()
+                if use_defer:
+                    await ctx.defer()
             
-            if account is not None:
-                try:
-                    account = int(account[-1])
-                except (IndexError, ValueError, TypeError):
-                    raise InvalidSlot
-                else:
-                    if account not in [x.value for x in AccountSlotsEnum]:
-                        raise InvalidSlot 
+                if account is not None:
+                    try:
+                        account = int(account[-1])
+                    except (IndexError, ValueError, TypeError):
+                        raise InvalidSlot
+                    else:
+                        if account not in [x.value for x in AccountSlotsEnum]:
+                            raise InvalidSlot 
             
-            game_account, member, slot = await standard_account_validate(
-                account_id=ctx.author.id, 
-                slot=account, 
-                check_premium=premium,
-                check_banned=ban_check,
-                check_verified=verified,
-                check_active_session=need_session,
-                allow_empty_slot=allow_empty_slot
-            )
-            await PlayersDB().set_analytics(UsedCommand(name=ctx.command.name), member=member)
-            member_context = MemberContext(member=member, game_account=game_account, slot=slot)
-            mixed_context = MixedApplicationContext(m_ctx=member_context, ctx=ctx)
-            new_args = (args[0], mixed_context) + args[2:]
-            await wrapped_func(*new_args, **kwargs)
+                game_account, member, slot = await standard_account_validate(
+                    account_id=ctx.author.id, 
+                    slot=account, 
+                    check_premium=premium,
+                    check_banned=ban_check,
+                    check_verified=verified,
+                    check_active_session=need_session,
+                    allow_empty_slot=allow_empty_slot
+                )
+                await PlayersDB().set_analytics(UsedCommand(name=ctx.command.name), member=member)
+                member_context = MemberContext(member=member, game_account=game_account, slot=slot)
+                mixed_context = MixedApplicationContext(m_ctx=member_context, ctx=ctx)
+                new_args = (args[0], mixed_context) + args[2:]
+                await wrapped_func(*new_args, **kwargs)
 
         wrapper.__name__ = cmd_name
         return wrapper
@@ -0,0 +1,65 @@
+from contextvars import ContextVar
+from time import monotonic
+
+from lib.exceptions.api import DeadlineExceeded
+
+# `monotonic()` time by which the current interaction must be answered, set by `deadline`
+_deadline: ContextVar[float | None] = ContextVar('deadline', default=None)
+
+
+def get_remaining() -> float | None:
+    """
+    Returns the remaining budget of the current task in seconds, None if it has no deadline.
+    """
+    at = _deadline.get()
+    if at is None:
+        return None
+
+    return at - monotonic()
+
+
+def check_deadline(stage: str, min_remaining: float = 0) -> None:
+    """
+    Raises if the deadline of the current task leaves no time for the next stage.
+
+    Args:
+        stage (str): Name of the stage about to start, used in the error message.
+        min_remaining (float, optional): Minimum budget the stage needs, in seconds. Defaults to 0.
+
+    Raises:
+        DeadlineExceeded: If the remaining budget is not greater than `min_remaining`.
+    """
+    remaining = get_remaining()
+    if remaining is not None and remaining <= min_remaining:
+        raise DeadlineExceeded(
+            real_exc=TimeoutError(f'Deadline exceeded before {stage}, {max(remaining, 0):.2f} s left')
+        )
+
+
+class deadline:
+    """
+    Context manager that sets a deadline `budget` seconds from now for the current task
+    and for the tasks it creates. An earlier deadline set by an outer context is kept.
+
+    `deadline(None)` lifts the deadline, for background work started from an interaction.
+
+    Usage:
+        with deadline(_config.deadline.deferred):
+            await API().get_stats(...)
+    """
+    def __init__(self, budget: float | None) -> None:
+        self.budget = budget
+
+    def __enter__(self) -> float | None:
+        at = None
+        if self.budget is not None:
+            at = monotonic() + self.budget
+            current = _deadline.get()
+            if current is not None:
+                at = min(at, current)
+
+        self._token = _deadline.set(at)
+        return at
+
+    def __exit__(self, *_) -> None:
+        _deadline.reset(self._token)
@@ -0,0 +1,45 @@
+from typing import TypeVar
+import json
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+# `orjson` parses bytes directly and is several times faster than the standard
+# library on the large `tanks/stats` payloads, it is used when installed.
+if orjson is not None:
+    BACKEND = 'orjson'
+    loads = orjson.loads
+else:
+    BACKEND = 'json'
+    # `json.loads` accepts bytes as well and detects the encoding itself
+    loads = json.loads
+
+
+def validate(model: type[ModelT], raw: bytes) -> ModelT:
+    """
+    Parses the raw response body and validates it into `model`.
+
+    The pydantic-core JSON parser of pydantic 2.4 is slower than `orjson` followed by `model_validate`,
+    so `model_validate_json` is only used without a fast backend (see `dev_tools/json_benchmark.py`).
+
+    Args:
+        model (type[ModelT]): The model to validate into.
+        raw (bytes): The response body.
+
+    Raises:
+        ValidationError: If the body does not match the model.
+        ValueError: If the body is not valid JSON.
+
+    Returns:
+        ModelT: The validated model.
+    """
+    if orjson is not None:
+        return model.model_validate(orjson.loads(raw))
+
+    return model.model_validate_json(raw)
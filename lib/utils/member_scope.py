@@ -0,0 +1,162 @@
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from lib.data_classes.db_player import DBPlayer
+
+# Members read during the current command by ID, None marks a member known to be missing
+_members: ContextVar[dict[int, DBPlayer | None] | None] = ContextVar('members', default=None)
+
+
+def is_cached(member_id: int) -> bool:
+    members = _members.get()
+    return members is not None and member_id in members
+
+
+def get_cached(member_id: int) -> DBPlayer | None:
+    """
+    Returns the member cached for the current command, None if it is not cached or is known to be missing.
+    Use `is_cached` to tell these cases apart.
+    """
+    members = _members.get()
+    return members.get(member_id) if members is not None else None
+
+
+def cache_member(member_id: int, member: DBPlayer | None) -> None:
+    members = _members.get()
+    if members is not None:
+        members[member_id] = member
+
+
+def forget_member(member_id: int) -> None:
+    members = _members.get()
+    if members is not None:
+        members.pop(member_id, None)
+
+
+def _traverse(doc: dict, path: str) -> tuple[dict | None, str]:
+    *parents, key = path.split('.')
+    for parent in parents:
+        doc = doc.get(parent)
+        if not isinstance(doc, dict):
+            return None, key
+
+    return doc, key
+
+
+def _apply_update(doc: dict, update: dict[str, dict[str, Any]]) -> bool:
+    """
+    Applies a MongoDB update document to `doc` in place.
+
+    Returns:
+        bool: False if the update uses an operator or a path this function does not support.
+    """
+    for operator, fields in update.items():
+        for path, value in fields.items():
+            parent, key = _traverse(doc, path)
+            if parent is None:
+                return False
+
+            if operator == '$set':
+                parent[key] = value
+            elif operator == '$unset':
+                parent.pop(key, None)
+            elif operator == '$inc':
+                parent[key] = parent.get(key, 0) + value
+            elif operator == '$push':
+                items = parent.setdefault(key, [])
+                if isinstance(value, dict) and '$each' in value:
+                    items.extend(value['$each'])
+                    if '$slice' in value:
+                        items[:] = items[value['$slice']:] if value['$slice'] < 0 else items[:value['$slice']]
+                else:
+                    items.append(value)
+            elif operator == '$pull':
+                removed = value['$in'] if isinstance(value, dict) and '$in' in value else [value]
+                parent[key] = [item for item in parent.get(key, []) if item not in removed]
+            else:
+                return False
+
+    return True
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(model: type[BaseModel], name: str) -> TypeAdapter:
+    return TypeAdapter(model.model_fields[name].annotation)
+
+
+def _resolve_update(member: DBPlayer, update: dict[str, dict[str, Any]]) -> list[tuple[BaseModel, str, Any]] | None:
+    """
+    Computes the new values of the fields on the paths of a MongoDB update document.
+    Only the updated fields are dumped and validated again, not the whole member.
+
+    Returns:
+        list[tuple[BaseModel, str, Any]] | None: The model, the field name and the new value of each updated field,
+        None if the update uses an operator or a path this function does not support.
+    """
+    changes = []
+    for operator, fields in update.items():
+        for path, value in fields.items():
+            *parents, name = path.split('.')
+            model = member
+            for parent in parents:
+                model = getattr(model, parent, None)
+                if not isinstance(model, BaseModel):
+                    return None
+
+            field = type(model).model_fields.get(name)
+            if field is None:
+                # Not a field of the model, a read would drop it as well
+                continue
+
+            if operator == '$unset':
+                changes.append((model, name, field.get_default(call_default_factory=True)))
+                continue
+
+            adapter = _field_adapter(type(model), name)
+            doc = {} if operator == '$set' else {name: adapter.dump_python(getattr(model, name))}
+            if not _apply_update(doc, {operator: {name: value}}):
+                return None
+
+            changes.append((model, name, adapter.validate_python(doc[name])))
+
+    return changes
+
+
+def update_cached_member(member_id: int, update: dict[str, dict[str, Any]]) -> None:
+    """
+    Applies a MongoDB update document of the member to its cached object in place,
+    so the objects the command already holds stay up to date. Unsupported updates drop the member from the cache.
+    """
+    member = get_cached(member_id)
+    if member is None:
+        return
+
+    changes = _resolve_update(member, update) if isinstance(update, dict) else None
+    if changes is None:
+        forget_member(member_id)
+        return
+
+    for model, name, value in changes:
+        setattr(model, name, value)
+
+
+class member_scope:
+    """
+    Context manager that caches the members read by `PlayersDB` for the current task
+    and for the tasks it creates, so one command reads the member document once.
+    `PlayersDB` write methods update the cached objects in place. An outer scope is reused.
+
+    Usage:
+        with member_scope():
+            member = await PlayersDB().get_member(member_id)
+            await PlayersDB().get_lang(member_id)   # No database round-trip
+    """
+    def __enter__(self) -> None:
+        members = _members.get()
+        self._token = _members.set({} if members is None else members)
+
+    def __exit__(self, *_) -> None:
+        _members.reset(self._token)
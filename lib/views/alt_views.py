@@ -267,7 +267,11 @@ class UpdateSession:
                         region=game_account.region,
                         game_id=game_account.game_id
                     )
-                    diff_data = await get_session_stats(game_account.last_stats, stats)
+                    diff_data = await get_session_stats(
+                        await PlayersDB().get_last_stats(account_slot, member=member), 
+                        stats
+                    )
+                    await PlayersDB().load_image(member)
                     
                     await interaction.response.defer()
                     image = ImageGenSession().generate(
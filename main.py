@@ -31,6 +31,8 @@ from lib.exceptions.api import APIError
 from lib.settings.settings import Config
 from workers.pdb_checker import PDBWorker
 from workers.db_backup_worker import DBBackupWorker
+from workers.analytics_worker import AnalyticsWorker
+from workers.metrics_worker import MetricsWorker
 
 _log = get_logger(__file__, 'MainLogger', 'logs/main.log')
 _config = Config().get()
@@ -47,6 +49,22 @@ except IndexError:
     )
     quit(1)
 
+class Bot(commands.Bot):
+    """
+    Bot that writes the buffered command analytics before it is closed.
+    """
+    def __init__(self, *args, analytics_worker: AnalyticsWorker, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.analytics_worker = analytics_worker
+
+    async def close(self):
+        # `Bot.run` closes the event loop right after `Bot.close`, the buffered analytics are written before that
+        try:
+            await self.analytics_worker.stop_worker()
+        finally:
+            await super().close()
+
+
 class App():
     def __init__(self):
         self.api = async_wotb_api.API()
@@ -54,11 +72,19 @@ class App():
         self.workers_running = False
         self.intents = Intents.default()
         self.pbd_worker = PDBWorker()
-        self.bot = commands.Bot(intents=self.intents, command_prefix=_config.default.prefix)
+        self.analytics_worker = AnalyticsWorker()
+        self.metrics_worker = MetricsWorker()
+        self.bot = Bot(
+            intents=self.intents,
+            command_prefix=_config.default.prefix,
+            analytics_worker=self.analytics_worker
+        )
         self.bot.remove_command('help')
         self.workers = [
                 self.pbd_worker.run_worker,
                 self.backup.run_worker,
+                self.analytics_worker.run_worker,
+                self.metrics_worker.run_worker,
             ]
 
         self.extension_names = [
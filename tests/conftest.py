@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The bot runs from the repository root: settings, logs and `lib` are resolved from there
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
@@ -0,0 +1,207 @@
+import asyncio
+import copy
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+from pymongo.errors import BulkWriteError
+
+from lib.data_classes.db_player import DBPlayer, GameAccounts, Profile, UsedCommand
+from lib.database.analytics_buffer import AnalyticsBuffer
+from lib.database.players import PlayersDB
+from lib.utils import analytics_update
+from lib.utils.analytics_update import build_analytics_update, get_commands_exp
+from lib.utils.member_scope import cache_member, member_scope
+
+T0 = datetime(2024, 10, 17, 12, 0, tzinfo=pytz.utc)
+EXP = {'stats': 10, 'session': 20, 'help': 2}
+_MISSING = object()
+
+
+def evaluate(expression, doc: dict):
+    """
+    Evaluates the aggregation expressions used by `build_analytics_update`.
+    """
+    if isinstance(expression, str) and expression.startswith('$'):
+        value = doc
+        for key in expression[1:].split('.'):
+            value = value.get(key, _MISSING) if isinstance(value, dict) else _MISSING
+        return value
+
+    if isinstance(expression, list):
+        return [evaluate(item, doc) for item in expression]
+
+    if not isinstance(expression, dict):
+        return expression
+
+    (operator, args), = expression.items()
+    if operator == '$literal':
+        return copy.deepcopy(args)
+
+    args = evaluate(args, doc)
+    if operator == '$ifNull':
+        return args[1] if args[0] is None or args[0] is _MISSING else args[0]
+    if operator == '$add':
+        return sum(args)
+    if operator == '$gte':
+        # Missing and null values are lower than any date
+        return args[0] is not None and args[0] is not _MISSING and args[0] >= args[1]
+    if operator == '$cond':
+        return args[1] if args[0] else args[2]
+    if operator == '$concatArrays':
+        return [item for array in args for item in array]
+    if operator == '$slice':
+        return args[0][args[1]:] if args[1] < 0 else args[0][:args[1]]
+
+    raise NotImplementedError(operator)
+
+
+def apply_pipeline(doc: dict, pipeline: list[dict]) -> None:
+    for stage in pipeline:
+        (operator, fields), = stage.items()
+        assert operator == '$set'
+
+        # All expressions of a stage see the document as it was before the stage
+        values = {path: evaluate(expression, doc) for path, expression in fields.items()}
+        for path, value in values.items():
+            *parents, key = path.split('.')
+            target = doc
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[key] = value
+
+
+class FakeCollection:
+    def __init__(self, docs: list[dict], rejected: set[int] = frozenset()) -> None:
+        self.docs = {doc['id']: doc for doc in docs}
+        self.rejected = rejected
+        self.bulk_writes = 0
+
+    async def bulk_write(self, operations, ordered: bool = True) -> None:
+        self.bulk_writes += 1
+        errors = []
+        for index, operation in enumerate(operations):
+            if operation._filter['id'] in self.rejected:
+                errors.append({'index': index, 'code': 121, 'errmsg': 'Document failed validation'})
+                continue
+
+            doc = self.docs.get(operation._filter['id'])
+            if doc is not None:
+                apply_pipeline(doc, operation._doc)
+
+        if errors:
+            raise BulkWriteError({'writeErrors': errors, 'nMatched': len(operations) - len(errors)})
+
+
+@pytest.fixture(autouse=True)
+def fixed_exp(monkeypatch):
+    monkeypatch.setattr(analytics_update, 'exp_add', lambda name: EXP[name])
+
+
+def make_doc(member_id: int, last_activity: datetime | None) -> dict:
+    return {
+        'id': member_id,
+        'profile': {'used_commands': [], 'level_exp': 0, 'last_activity': last_activity, 'commands_counter': 0},
+    }
+
+
+def write_directly(docs: dict[int, dict], events: list[tuple[int, UsedCommand, datetime]]) -> None:
+    # The update `PlayersDB.set_analytics` writes for every command
+    for member_id, command, at in events:
+        commands = [(command, at)]
+        apply_pipeline(docs[member_id], build_analytics_update(commands, get_commands_exp(commands)))
+
+
+EVENTS = [
+    # Active exactly 10 s before the first command: still within the cooldown
+    (1, UsedCommand(name='stats'), T0),
+    (2, UsedCommand(name='session'), T0),
+    # Exactly 10 s after the previous command: within the cooldown
+    (1, UsedCommand(name='stats'), T0 + timedelta(seconds=10)),
+    (1, UsedCommand(name='help'), T0 + timedelta(seconds=20, milliseconds=1)),
+    (2, UsedCommand(name='help'), T0 + timedelta(seconds=5)),
+    *[(3, UsedCommand(name='stats'), T0 + timedelta(seconds=11 * i)) for i in range(12)],
+]
+LAST_ACTIVITY = {1: T0 - timedelta(seconds=10), 2: T0 - timedelta(seconds=10, milliseconds=1), 3: None}
+
+
+def test_batch_has_the_same_result_as_direct_writes():
+    direct = {member_id: make_doc(member_id, at) for member_id, at in LAST_ACTIVITY.items()}
+    batched = copy.deepcopy(direct)
+    write_directly(direct, EVENTS)
+
+    operations = AnalyticsBuffer.build_operations(EVENTS)
+    assert len(operations) == 3
+    for operation in operations:
+        apply_pipeline(batched[operation._filter['id']], operation._doc)
+
+    assert batched == direct
+    assert direct[1]['profile']['level_exp'] == 1 + 1 + 2
+    assert direct[2]['profile']['level_exp'] == 20 + 1
+    assert direct[3]['profile']['level_exp'] == 12 * 10
+    assert direct[3]['profile']['commands_counter'] == 12
+    assert len(direct[3]['profile']['used_commands']) == 10
+    assert direct[1]['profile']['last_activity'] == T0 + timedelta(seconds=20, milliseconds=1)
+
+
+def test_events_are_written_in_batches_and_on_stop():
+    collection = FakeCollection([make_doc(member_id, at) for member_id, at in LAST_ACTIVITY.items()])
+    buffer = AnalyticsBuffer(collection)
+    buffer.settings = buffer.settings.model_copy(update={'flush_interval': 60})
+
+    async def run():
+        assert not buffer.put(*EVENTS[0])   # Written directly while the buffer is not running
+
+        task = asyncio.create_task(buffer.run())
+        await asyncio.sleep(0)
+        assert all(buffer.put(*event) for event in EVENTS)
+
+        await buffer.stop()
+        await task
+        assert not buffer.put(*EVENTS[0])
+
+    asyncio.run(run())
+
+    expected = {member_id: make_doc(member_id, at) for member_id, at in LAST_ACTIVITY.items()}
+    write_directly(expected, EVENTS)
+    assert collection.docs == expected
+    assert collection.bulk_writes == 1
+    assert buffer.get_metrics()['flushed'] == len(EVENTS)
+
+
+def test_rejected_updates_do_not_fail_the_batch():
+    collection = FakeCollection([make_doc(member_id, at) for member_id, at in LAST_ACTIVITY.items()], rejected={1})
+    buffer = AnalyticsBuffer(collection)
+
+    async def write():
+        for event in EVENTS:
+            buffer.queue.put_nowait(event)
+        return await buffer.flush()
+
+    member_events = sum(member_id == 1 for member_id, _, _ in EVENTS)
+    assert asyncio.run(write()) == len(EVENTS) - member_events
+
+    metrics = buffer.get_metrics()
+    assert (metrics['flushed'], metrics['failed'], metrics['retry_size']) == (len(EVENTS) - member_events, member_events, 0)
+    assert collection.docs[1] == make_doc(1, LAST_ACTIVITY[1])
+    assert collection.docs[3]['profile']['commands_counter'] == 12
+
+
+def test_buffered_command_updates_the_cached_member(monkeypatch):
+    db = PlayersDB()
+    monkeypatch.setattr(db.analytics, 'running', True)
+    monkeypatch.setattr(db.analytics, 'queue', asyncio.Queue())
+    member = DBPlayer(
+        id=1,
+        game_accounts=GameAccounts(),
+        profile=Profile(level_exp=5, last_activity=datetime.now(pytz.utc) - timedelta(minutes=1))
+    )
+
+    with member_scope():
+        cache_member(1, member)
+        asyncio.run(db.set_analytics(UsedCommand(name='stats'), member_id=1))
+
+    assert db.analytics.queue.qsize() == 1
+    assert member.profile.commands_counter == 1
+    assert member.profile.level_exp == 5 + EXP['stats']
+    assert [command.name for command in member.profile.used_commands] == ['stats']
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+from typing import ClassVar, Optional
+
+from pydantic import BaseModel, Field
+
+from lib.data_classes.api.player_stats import PlayerData
+from lib.data_classes.api.tanks_stats import TankStats
+from lib.utils.api_fields import get_api_fields
+
+FIXTURES_DIR = Path(__file__).parent.parent / 'dev_tools' / 'fake_api' / 'fixtures'
+
+
+class Block(BaseModel):
+    _derived_fields: ClassVar[set[str]] = {'winrate'}
+
+    battles: int
+    wins: int
+    winrate: Optional[float] = None
+
+
+class Account(BaseModel):
+    id: int
+    name: str = Field(alias='nickname')
+    all: Block
+    rating: Optional[Block] = None
+    history: list[Block] = []
+    tanks: dict[str, Block] = {}
+
+
+def project(data: dict, fields: str) -> dict:
+    """
+    Keeps only the `fields` of the data, as the `fields` parameter of the WG API does.
+    """
+    projected: dict = {}
+    for path in fields.split(','):
+        *parents, key = path.split('.')
+        source, target = data, projected
+        for parent in parents:
+            if not isinstance(source, dict) or source.get(parent) is None:
+                break
+            source = source[parent]
+            target = target.setdefault(parent, {})
+        else:
+            if isinstance(source, dict) and key in source:
+                target[key] = source[key]
+
+    return projected
+
+
+def load_fixture(endpoint: str) -> dict | list:
+    return json.loads((FIXTURES_DIR / endpoint / 'default.json').read_text(encoding='utf-8'))
+
+
+def test_nested_models_are_expanded_without_derived_fields():
+    assert get_api_fields(Account, exclude=('id',)) == (
+        'nickname,all.battles,all.wins,rating.battles,rating.wins,'
+        'history.battles,history.wins,tanks.battles,tanks.wins'
+    )
+
+
+def test_derived_fields_are_not_requested():
+    fields = get_api_fields(PlayerData).split(',')
+
+    assert 'statistics.all.battles' in fields
+    assert 'statistics.rating.mm_rating' in fields
+    assert 'statistics.all.winrate' not in fields
+    assert 'statistics.rating.leaderboard_position' not in fields
+    assert 'all.accuracy' not in get_api_fields(TankStats).split(',')
+
+
+def test_projected_responses_validate():
+    PlayerData.model_validate(project(load_fixture('account_info'), get_api_fields(PlayerData)))
+
+    for tank in load_fixture('tanks_stats'):
+        TankStats.model_validate(project(tank, get_api_fields(TankStats)))
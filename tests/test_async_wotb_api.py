@@ -0,0 +1,178 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytz
+from pydantic import BaseModel
+
+from lib.api import async_wotb_api
+from lib.api.async_wotb_api import API, _ACCOUNTS_PER_REQUEST
+from lib.exceptions.api import DeadlineExceeded
+from lib.utils.deadline import deadline, get_remaining
+
+
+def test_players_stats_are_batched_in_input_order(monkeypatch):
+    api = API()
+    players_id = list(range(1, 2 * _ACCOUNTS_PER_REQUEST + 11))
+    missing = {5, 150}
+    batches = []
+
+    async def get_players_stats(players_id, region):
+        batches.append(players_id)
+        # The API does not keep the order of the IDs and omits unknown accounts
+        return {player_id: f'stats {player_id}' for player_id in reversed(players_id) if player_id not in missing}
+
+    monkeypatch.setattr(api, '_get_players_stats', get_players_stats)
+    stats = asyncio.run(api.get_players_stats(players_id, region='eu'))
+
+    assert [len(batch) for batch in batches] == [_ACCOUNTS_PER_REQUEST, _ACCOUNTS_PER_REQUEST, 10]
+    assert sorted(player_id for batch in batches for player_id in batch) == players_id
+    assert stats == [False if player_id in missing else f'stats {player_id}' for player_id in players_id]
+
+
+def test_stale_na_stats_are_refreshed_with_caller_region(monkeypatch):
+    api = API()
+    regions = []
+
+    class Stats(BaseModel):
+        id: int = 1
+        region: str = 'com'     # The cached data keeps the normalized region
+        from_cache: bool = False
+
+    async def get_cached(*_):
+        return SimpleNamespace(data=Stats())
+
+    async def get_player(region, **_):
+        regions.append(region)
+        return {'account_id': 1, 'nickname': 'player'}
+
+    async def collect_stats(player, region, *_):
+        regions.append(region)
+        return Stats()
+
+    monkeypatch.setattr(api.stats_cache, 'get', get_cached)
+    monkeypatch.setattr(api.stats_cache, 'is_fresh', lambda entry, stale=False: stale)
+    monkeypatch.setattr(api, 'get_player', get_player)
+    monkeypatch.setattr(api, '_collect_stats', collect_stats)
+    monkeypatch.setattr(async_wotb_api, 'get_normalized_data', lambda data: data)
+
+    async def run():
+        stats = await api.get_stats(region='na', game_id=1, stale_while_revalidate=True)
+        await asyncio.gather(*api._refreshing.values())
+        return stats
+
+    stats = asyncio.run(run())
+
+    # The refresh requests the stats, including the leaderboard position, with the region of the caller
+    assert stats.from_cache
+    assert regions == ['na', 'na']
+
+
+def test_joined_stats_request_keeps_own_deadline(monkeypatch):
+    api = API()
+    remaining = []
+
+    class Stats(BaseModel):
+        battles: int = 100
+
+    async def get_player(**_):
+        return {'account_id': 1, 'nickname': 'player'}
+
+    async def get_cached(*_):
+        return None
+
+    async def collect_stats(*_):
+        remaining.append(get_remaining())
+        await asyncio.sleep(0.2)
+        return Stats()
+
+    monkeypatch.setattr(api, 'get_player', get_player)
+    monkeypatch.setattr(api.stats_cache, 'get', get_cached)
+    monkeypatch.setattr(api, '_collect_stats', collect_stats)
+
+    async def get_stats(budget: float):
+        with deadline(budget):
+            return await api.get_stats(region='eu', search='player', raw_dict=True)
+
+    async def run():
+        return await asyncio.gather(get_stats(0.05), get_stats(5), return_exceptions=True)
+
+    starter, joiner = asyncio.run(run())
+
+    # One fan-out for both callers, not bound by the deadline of the one that started it
+    assert remaining == [None]
+    assert isinstance(starter, DeadlineExceeded)
+    assert joiner == {'battles': 100}
+
+
+def test_slow_data_of_an_old_reference_is_requested_again(monkeypatch):
+    api = API()
+    requests = []
+
+    class PlayerData(BaseModel):
+        statistics: str = 'reference'
+        achievements: str = 'reference'
+        clan_stats: object = 'reference'
+        clan_tag: str | None = 'REF'
+        tank_stats: dict = {}
+
+    def request(name, result):
+        async def get(region, account_id, **_):
+            requests.append(name)
+            return result
+        return get
+
+    async def cache_stats(*_):
+        pass
+
+    monkeypatch.setattr(api, '_is_unchanged', lambda player, reference: True)
+    monkeypatch.setattr(api, '_cache_stats', cache_stats)
+    monkeypatch.setattr(
+        api, '_build_global_data',
+        lambda player, region, player_data: SimpleNamespace(data=player_data, timestamp=datetime.now(pytz.utc))
+    )
+    monkeypatch.setattr(api, 'get_player_stats', request('statistics', SimpleNamespace(data=SimpleNamespace(statistics='new'))))
+    monkeypatch.setattr(api, 'get_player_achievements', request('achievements', 'new'))
+    monkeypatch.setattr(api, 'get_player_clan_stats', request('clan_stats', SimpleNamespace(clan=SimpleNamespace(tag='NEW'))))
+
+    def collect(age: timedelta) -> PlayerData:
+        reference = SimpleNamespace(id=1, data=PlayerData(), timestamp=datetime.now(pytz.utc) - age)
+        return asyncio.run(api._collect_stats({'account_id': 1}, 'eu', reference=reference)).data
+
+    recent = collect(timedelta(minutes=5))
+    assert requests == ['statistics']
+    assert (recent.statistics, recent.achievements, recent.clan_tag) == ('new', 'reference', 'REF')
+
+    requests.clear()
+    old = collect(timedelta(days=2))
+    assert sorted(requests) == ['achievements', 'clan_stats', 'statistics']
+    assert (old.statistics, old.achievements, old.clan_tag) == ('new', 'new', 'NEW')
+
+
+def test_players_search_waits_for_the_cancelled_regions(monkeypatch):
+    api = API()
+    slow_regions = {'ru'}
+    cancelled = []
+
+    async def request(region, url, params, **_):
+        if region in slow_regions:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(region)
+                raise
+        return {'data': [{'account_id': region, 'nickname': 'player'}]}
+
+    monkeypatch.setattr(api, '_request', request)
+    monkeypatch.setattr(async_wotb_api._config.default, 'available_regions', ['eu', 'ru', 'asia'])
+
+    async def search():
+        players = await api.get_players_list('player', timeout=0.05)
+        # Nothing of the search is left running once it returns
+        return players, [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+    players, running = asyncio.run(search())
+
+    assert players == {'eu': 'player | EU', 'asia': 'player | ASIA'}
+    assert cancelled == ['ru']
+    assert running == []
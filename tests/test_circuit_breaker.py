@@ -0,0 +1,103 @@
+import pytest
+
+from lib.api import circuit_breaker
+from lib.api.circuit_breaker import CircuitBreaker, CircuitState
+from lib.data_classes.settings import CircuitBreaker as CircuitBreakerSettings
+from lib.exceptions import api as api_exceptions
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(circuit_breaker, 'monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def breaker() -> CircuitBreaker:
+    return CircuitBreaker('eu', CircuitBreakerSettings(failure_threshold=3, open_time=30))
+
+
+def fail(breaker: CircuitBreaker, exc: Exception | None = None) -> None:
+    with pytest.raises(type(exc) if exc is not None else api_exceptions.APISourceNotAvailable):
+        with breaker.guard():
+            raise exc if exc is not None else api_exceptions.APISourceNotAvailable()
+
+
+def succeed(breaker: CircuitBreaker) -> None:
+    with breaker.guard():
+        pass
+
+
+def test_opens_after_consecutive_failures(clock, breaker):
+    fail(breaker)
+    fail(breaker, TimeoutError())
+    succeed(breaker)
+    fail(breaker)
+    fail(breaker)
+    assert breaker.state is CircuitState.CLOSED
+
+    fail(breaker)
+    assert breaker.state is CircuitState.OPEN
+
+    with pytest.raises(api_exceptions.RegionUnavailable):
+        succeed(breaker)
+
+
+def test_other_errors_mean_the_api_is_up(clock, breaker):
+    fail(breaker)
+    fail(breaker)
+    fail(breaker, api_exceptions.NoPlayersFound())
+    fail(breaker)
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_lets_a_single_probe_through(clock, breaker):
+    for _ in range(3):
+        fail(breaker)
+
+    clock.now += 30
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    with breaker.guard():
+        # Other requests fail at once while the probe is in flight
+        with pytest.raises(api_exceptions.RegionUnavailable):
+            succeed(breaker)
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.failures == 0
+
+
+def test_failed_probe_opens_again(clock, breaker):
+    for _ in range(3):
+        fail(breaker)
+
+    clock.now += 30
+    fail(breaker)
+    assert breaker.state is CircuitState.OPEN
+
+    clock.now += 29
+    assert breaker.state is CircuitState.OPEN
+    clock.now += 1
+    assert breaker.state is CircuitState.HALF_OPEN
+
+
+def test_deadline_of_the_probe_says_nothing_about_the_api(clock, breaker):
+    for _ in range(3):
+        fail(breaker)
+
+    clock.now += 30
+    fail(breaker, api_exceptions.DeadlineExceeded())
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    succeed(breaker)
+    assert breaker.state is CircuitState.CLOSED
@@ -0,0 +1,69 @@
+import pytest
+
+from lib.api import hedging
+from lib.api.hedging import HedgingPolicy
+from lib.data_classes.settings import Hedging as HedgingSettings
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(hedging, 'monotonic', clock)
+    return clock
+
+
+def make_policy(rate: float, max_share: float, enabled: bool = True) -> HedgingPolicy:
+    return HedgingPolicy(
+        HedgingSettings(enabled=enabled, percentile=90, min_samples=10, window_size=20, max_share=max_share),
+        rate
+    )
+
+
+def test_hedges_are_limited_to_the_share_of_the_rate(clock):
+    policy = make_policy(rate=20, max_share=0.1)   # 2 hedges per second
+
+    assert [policy.acquire('eu') for _ in range(3)] == [True, True, False]
+
+    clock.now += 0.5
+    assert [policy.acquire('eu') for _ in range(2)] == [True, False]
+
+    clock.now += 10   # The bucket holds no more than one second of hedges
+    assert [policy.acquire('eu') for _ in range(3)] == [True, True, False]
+
+    assert policy.get_metrics() == {'hedges_sent': 5, 'hedges_won': 0, 'hedges_rejected': 3}
+
+
+def test_slow_regions_get_one_hedge_at_a_time(clock):
+    policy = make_policy(rate=5, max_share=0.05)   # One hedge every 4 seconds
+
+    assert [policy.acquire('eu') for _ in range(2)] == [True, False]
+    assert policy.acquire('asia')
+
+    clock.now += 3.9
+    assert not policy.acquire('eu')
+    clock.now += 0.1
+    assert policy.acquire('eu')
+
+
+def test_delay_is_the_percentile_of_recent_latencies(clock):
+    policy = make_policy(rate=20, max_share=0.1)
+    for latency in range(1, 10):
+        policy.record('/wotb/account/info/', 'eu', latency / 10)
+
+    assert policy.get_delay('/wotb/account/info/', 'eu') is None   # Not enough samples
+
+    for latency in range(10, 31):
+        policy.record('/wotb/account/info/', 'eu', latency / 10)
+
+    # The window keeps the last 20 samples: 1.1 .. 3.0 s
+    assert policy.get_delay('/wotb/account/info/', 'eu') == pytest.approx(2.9)
+    assert policy.get_delay('/wotb/tanks/stats/', 'eu') is None
+    assert make_policy(rate=20, max_share=0.1, enabled=False).get_delay('/wotb/account/info/', 'eu') is None
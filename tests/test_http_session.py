@@ -0,0 +1,24 @@
+import asyncio
+
+from lib.api.http_session import HttpSessionManager
+
+
+def test_session_of_previous_loop_is_closed():
+    http = HttpSessionManager()
+
+    async def get_session():
+        return http.session
+
+    previous = asyncio.run(get_session())
+
+    async def change_loop():
+        session = http.session
+        await asyncio.gather(*http._closing)
+        return session
+
+    session = asyncio.run(change_loop())
+
+    assert session is not previous
+    assert previous.closed
+    assert not session.closed
+    asyncio.run(http.close())
@@ -0,0 +1,110 @@
+from lib.data_classes.db_player import DBPlayer, GameAccount, GameAccounts, Profile
+from lib.utils.member_scope import (
+    _apply_update,
+    cache_member,
+    get_cached,
+    is_cached,
+    member_scope,
+    update_cached_member
+)
+
+
+def make_member() -> DBPlayer:
+    return DBPlayer(
+        id=1,
+        image='base64',
+        game_accounts=GameAccounts(slot_1=GameAccount(nickname='player', game_id=1, region='eu')),
+        profile=Profile(badges=['a', 'b', 'c'], used_commands=[{'name': f'c{i}'} for i in range(9)])
+    )
+
+
+def test_apply_update_operators():
+    doc = {'id': 1, 'lang': 'en', 'image': 'base64', 'profile': {'level_exp': 5, 'badges': ['a', 'b', 'c']}}
+
+    assert _apply_update(
+        doc,
+        {
+            '$set': {'lang': 'ru', 'profile.premium': True},
+            '$unset': {'image': '', 'missing': ''},
+            '$inc': {'profile.level_exp': 3, 'profile.commands_counter': 1},
+        }
+    )
+    assert doc == {
+        'id': 1,
+        'lang': 'ru',
+        'profile': {'level_exp': 8, 'badges': ['a', 'b', 'c'], 'premium': True, 'commands_counter': 1},
+    }
+
+    assert _apply_update(doc, {'$pull': {'profile.badges': 'b'}})
+    assert doc['profile']['badges'] == ['a', 'c']
+    assert _apply_update(doc, {'$pull': {'profile.badges': {'$in': ['a', 'x']}}})
+    assert doc['profile']['badges'] == ['c']
+
+
+def test_apply_update_push():
+    doc = {'profile': {}}
+
+    assert _apply_update(doc, {'$push': {'profile.badges': 'a'}})
+    assert _apply_update(doc, {'$push': {'profile.badges': {'$each': ['b', 'c', 'd']}}})
+    assert doc['profile']['badges'] == ['a', 'b', 'c', 'd']
+
+    assert _apply_update(doc, {'$push': {'profile.badges': {'$each': ['e'], '$slice': -3}}})
+    assert doc['profile']['badges'] == ['c', 'd', 'e']
+    assert _apply_update(doc, {'$push': {'profile.badges': {'$each': ['f'], '$slice': 2}}})
+    assert doc['profile']['badges'] == ['c', 'd']
+
+
+def test_apply_update_rejects_unsupported_updates():
+    assert not _apply_update({'profile': {}}, {'$rename': {'profile': 'p'}})
+    assert not _apply_update({'profile': None}, {'$set': {'profile.level_exp': 1}})
+
+
+def test_cached_member_is_updated_in_place():
+    member = make_member()
+    slot = member.game_accounts.slot_1
+
+    with member_scope():
+        cache_member(1, member)
+        update_cached_member(
+            1,
+            {
+                '$set': {'lang': 'ru', 'game_accounts.slot_1.verified': True},
+                '$unset': {'image': ''},
+                '$inc': {'profile.level_exp': 5},
+                '$push': {'profile.used_commands': {'$each': [{'name': 'stats'}], '$slice': -9}},
+                '$pull': {'profile.badges': {'$in': ['a', 'c']}},
+            }
+        )
+
+        assert get_cached(1) is member
+        assert member.game_accounts.slot_1 is slot
+
+    assert member.lang == 'ru'
+    assert member.image is None
+    assert slot.verified
+    assert member.profile.level_exp == 5
+    assert [command.name for command in member.profile.used_commands] == [*(f'c{i}' for i in range(1, 9)), 'stats']
+    assert member.profile.badges == ['b']
+
+
+def test_unsupported_updates_drop_the_cached_member():
+    with member_scope():
+        cache_member(1, make_member())
+        update_cached_member(1, {'$set': {'game_accounts.slot_2.verified': True}})
+        assert not is_cached(1)
+
+        cache_member(1, make_member())
+        update_cached_member(1, [{'$set': {'lang': 'ru'}}])
+        assert not is_cached(1)
+
+
+def test_nothing_is_cached_outside_of_a_scope():
+    cache_member(1, make_member())
+    assert not is_cached(1)
+
+    with member_scope():
+        cache_member(2, None)
+        with member_scope():
+            assert is_cached(2)   # The outer scope is reused
+
+    assert not is_cached(2)
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from lib.api import rate_limiter
+from lib.api.rate_limiter import AdaptiveLimiter, RequestPriority, request_priority
+from lib.data_classes.settings import RateLimit
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(rate_limiter, 'monotonic', clock)
+    return clock
+
+
+def make_limiter(rate: float = 10) -> AdaptiveLimiter:
+    return AdaptiveLimiter(
+        'eu:0',
+        RateLimit(rate=rate, min_rate=2, backoff_factor=0.5, recovery_step=1, recovery_interval=5)
+    )
+
+
+def test_penalties_within_recovery_interval_count_once(clock):
+    limiter = make_limiter()
+
+    limiter.penalize()
+    clock.now += 1
+    limiter.penalize()
+    assert limiter.rate == 5
+
+    clock.now += 5
+    limiter.penalize()
+    assert limiter.rate == 2.5
+
+    clock.now += 5
+    limiter.penalize()
+    assert limiter.rate == 2   # Not below min_rate
+
+
+def test_rate_recovers_by_step_per_interval(clock):
+    limiter = make_limiter(rate=50)
+    limiter.penalize()
+    rates = []
+
+    async def wait_after(seconds: float) -> None:
+        clock.now += seconds
+        await limiter.wait()
+        rates.append(limiter.rate)
+
+    async def run():
+        await wait_after(4)
+        await wait_after(11)
+        await wait_after(1000)   # Not above the configured rate
+
+    asyncio.run(run())
+    # Three full recovery intervals have passed 15 s after the penalty
+    assert rates == [25, 28, 50]
+
+
+def test_tokens_are_handed_out_by_priority():
+    limiter = make_limiter(rate=100)
+    served = []
+
+    async def request(name: str, priority: RequestPriority | None = None) -> None:
+        await limiter.wait(priority)
+        served.append(name)
+
+    async def run():
+        with request_priority(RequestPriority.WIDGET):
+            await asyncio.gather(
+                request('background_1', RequestPriority.BACKGROUND),
+                request('widget_1'),
+                request('interactive_1', RequestPriority.INTERACTIVE),
+                request('background_2', RequestPriority.BACKGROUND),
+                request('widget_2'),
+                request('interactive_2', RequestPriority.INTERACTIVE),
+            )
+
+    asyncio.run(run())
+    assert served == ['interactive_1', 'interactive_2', 'widget_1', 'widget_2', 'background_1', 'background_2']
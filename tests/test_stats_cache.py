@@ -0,0 +1,118 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytz
+from pydantic import ValidationError
+
+from lib.api import stats_cache
+from lib.api.stats_cache import StatsCache
+from lib.data_classes.settings import StatsCache as StatsCacheSettings
+
+
+class FakeDB:
+    def __init__(self, payloads: dict[str, bytes] | None = None) -> None:
+        self.payloads = payloads or {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.payloads.get(key)
+
+
+class FakeEntry:
+    """
+    Parses the age of the entry in seconds from the payload.
+    """
+    @staticmethod
+    def model_validate_json(payload: bytes) -> SimpleNamespace:
+        if payload == b'invalid':
+            raise ValidationError.from_exception_data('StatsCacheEntry', [])
+        return SimpleNamespace(stored_at=ago(float(payload)))
+
+
+def make_cache(memory_max_size: int = 100) -> StatsCache:
+    cache = StatsCache(
+        StatsCacheSettings(ttl=60, stale_ttl=120, reference_ttl=1800, memory_max_size=memory_max_size, metrics_interval=600)
+    )
+    cache.db = FakeDB()
+    return cache
+
+
+def ago(seconds: float) -> datetime:
+    return datetime.now(pytz.utc) - timedelta(seconds=seconds)
+
+
+def test_memory_tier_evicts_least_recently_used_by_size():
+    cache = make_cache(memory_max_size=100)
+    for key in ('a', 'b', 'c'):
+        cache._memory_set(key, ago(0), b'x' * 40)
+
+    assert list(cache._memory) == ['b', 'c']
+    assert cache.get_metrics()['memory_size'] == 80
+
+    cache._memory_get('b')
+    cache._memory_set('d', ago(0), b'x' * 40)
+
+    assert list(cache._memory) == ['b', 'd']
+    assert cache.evictions == 2
+
+
+def test_memory_tier_replaces_entries_and_skips_oversized_ones():
+    cache = make_cache(memory_max_size=100)
+    cache._memory_set('a', ago(0), b'x' * 40)
+    cache._memory_set('a', ago(0), b'x' * 60)
+    cache._memory_set('b', ago(0), b'x' * 101)
+
+    assert list(cache._memory) == ['a']
+    assert cache.get_metrics()['memory_size'] == 60
+    assert cache.evictions == 0
+
+
+def test_memory_entries_expire_after_reference_ttl():
+    cache = make_cache()
+    cache._memory_set('old', ago(1801), b'x')
+    cache._memory_set('new', ago(1799), b'x')
+
+    assert cache._memory_get('old') is None
+    assert cache._memory_get('new') == b'x'
+    assert list(cache._memory) == ['new']
+
+
+def test_is_fresh_uses_ttl_or_stale_ttl():
+    cache = make_cache()
+    fresh, stale, expired = (SimpleNamespace(stored_at=ago(seconds)) for seconds in (59, 119, 121))
+
+    assert cache.is_fresh(fresh)
+    assert not cache.is_fresh(stale)
+    assert cache.is_fresh(stale, stale=True)
+    assert not cache.is_fresh(expired, stale=True)
+
+
+def test_miss_is_counted():
+    cache = make_cache()
+
+    assert asyncio.run(cache.get(1, 'eu')) is None
+    assert cache.get_metrics()['misses'] == 1
+
+
+def test_only_servable_entries_are_hits(monkeypatch):
+    monkeypatch.setattr(stats_cache, 'StatsCacheEntry', FakeEntry)
+    cache = make_cache()
+    cache.db = FakeDB({'eu:2': b'30', 'eu:3': b'90', 'eu:4': b'invalid'})
+    cache._memory_set('eu:1', ago(0), b'600')
+
+    async def get_all():
+        return [
+            await cache.get(1, 'eu', stale=True),
+            await cache.get(2, 'eu'),
+            await cache.get(2, 'eu'),
+            await cache.get(3, 'eu'),
+            await cache.get(3, 'eu', stale=True),
+            await cache.get(4, 'eu'),
+        ]
+
+    entries = asyncio.run(get_all())
+
+    # Expired entries are still returned as the last known data of the player
+    assert [entry is not None for entry in entries] == [True, True, True, True, True, False]
+    metrics = cache.get_metrics()
+    assert (metrics['memory_hits'], metrics['db_hits'], metrics['reference_hits'], metrics['misses']) == (2, 1, 2, 1)
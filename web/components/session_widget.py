@@ -7,6 +7,7 @@ from nicegui import ui, Client, run
 from lib.database.players import PlayersDB
 from lib.exceptions.database import *
 from lib.api.async_wotb_api import API, _log as _api_log
+from lib.api.rate_limiter import RequestPriority, request_priority
 from lib.data_classes.api.api_data import PlayerGlobalData
 from lib.image.session import ImageGenSession, ImageGenReturnTypes, _log as _image_log
 from lib.data_parser.parse_data import get_session_stats, _log as _parser_log
@@ -62,8 +63,11 @@ def init_app(app: FastAPI) -> None:
         
         await client.connected()
 
-        stats = await _api.get_stats(game_account.region, game_account.game_id, ignore_lock=True)
+        await _pdb.load_last_stats(member, [slot])
+        await _pdb.load_image(member)
         last_stats = PlayerGlobalData.model_validate(game_account.last_stats)
+        with request_priority(RequestPriority.WIDGET):
+            stats = await _api.get_stats(game_account.region, game_account.game_id, ignore_lock=True, reference=last_stats)
         
         diff_battles = (
             stats.data.statistics.all.battles - last_stats.data.statistics.all.battles,
@@ -92,7 +96,8 @@ def init_app(app: FastAPI) -> None:
             if last_stats is None:
                 return ui.label('Session not found')
 
-            stats = await _api.get_stats(game_account.region, game_account.game_id, ignore_lock=True)
+            with request_priority(RequestPriority.WIDGET):
+                stats = await _api.get_stats(game_account.region, game_account.game_id, ignore_lock=True, reference=last_stats)
             diff_battles = (
                 stats.data.statistics.all.battles - last_stats.data.statistics.all.battles,
                 stats.data.statistics.rating.battles - last_stats.data.statistics.rating.battles
@@ -0,0 +1,28 @@
+from discord.ext.commands import Bot
+
+from lib.database.players import PlayersDB
+from lib.logger.logger import get_logger
+from lib.settings.settings import Config
+
+_log = get_logger(__file__, 'AnalyticsWorkerLogger', 'logs/analytics_worker.log')
+_config = Config().get()
+
+
+class AnalyticsWorker:
+    def __init__(self):
+        self.buffer = PlayersDB().analytics
+
+    async def stop_worker(self):
+        """
+        Stops the worker and waits until the buffered analytics are written.
+        """
+        _log.debug('WORKERS: stopping analytics worker')
+        await self.buffer.stop()
+
+    async def run_worker(self, bot: Bot, *args):
+        if not _config.analytics_buffer.enabled:
+            _log.info('WORKERS: analytics buffer is disabled, analytics are written directly')
+            return
+
+        _log.info('WORKERS: analytics worker started')
+        await self.buffer.run()
@@ -0,0 +1,33 @@
+from asyncio import sleep
+
+from discord.ext.commands import Bot
+
+from lib.api.async_wotb_api import API
+from lib.api.http_session import HttpSessionManager
+from lib.logger.logger import get_logger
+from lib.settings.settings import Config
+
+_log = get_logger(__file__, 'MetricsWorkerLogger', 'logs/metrics_worker.log')
+_config = Config().get()
+
+
+class MetricsWorker:
+    """
+    Logs the counters of the stats cache and the HTTP session of the bot process,
+    see `StatsCache.log_metrics` and `HttpSessionManager.log_metrics`.
+    """
+    def __init__(self):
+        self.STOP_FLAG = False
+        self.api = API()
+        self.http = HttpSessionManager()
+
+    def stop_worker(self):
+        _log.debug('WORKERS: setting STOP_WORKER_FLAG to True')
+        self.STOP_FLAG = True
+
+    async def run_worker(self, bot: Bot, *args):
+        _log.info('WORKERS: metrics worker started')
+        while not self.STOP_FLAG:
+            await sleep(_config.game_api.stats_cache.metrics_interval)
+            self.api.stats_cache.log_metrics()
+            self.http.log_metrics()
@@ -5,6 +5,7 @@ from discord import Bot
 import pytz
 
 from lib.api.async_wotb_api import API
+from lib.api.rate_limiter import RequestPriority, request_priority
 from lib.data_classes.db_player import BadgesEnum, HookStatsTriggers, HookWatchFor, SessionStatesEnum
 from lib.database.internal import InternalDB
 from lib.database.players import PlayersDB
@@ -87,7 +88,9 @@ class PDBWorker:
         _log.info('WORKERS: PDB worker started')
         
         while not self.STOP_FLAG:
-            await self.check_database()
+            # Worker requests use only the API capacity left over by the users
+            with request_priority(RequestPriority.BACKGROUND):
+                await self.check_database()
             await sleep(200)
             
         _log.info('WORKERS: PDB worker stopped')
@@ -164,7 +167,11 @@ class PDBWorker:
                 hook = game_account.hook_stats
                 if hook.active:
                     try:
-                        data = await self.api.get_stats(game_id=hook.target_game_id, region=hook.target_game_region)
+                        data = await self.api.get_stats(
+                            game_id=hook.target_game_id, 
+                            region=hook.target_game_region, 
+                            reference=hook.last_stats
+                        )
                     except Exception:
                         _log.warning(f'Failed to get stats for {member_id} in slot {slot.name}')
                         await self.db.disable_stats_hook(member_id, slot)
@@ -213,7 +220,12 @@ class PDBWorker:
                 if session_state is not SessionStatesEnum.RESTART_NEEDED:
                     continue
                 
-                new_last_stats = await self.api.get_stats(game_id=game_account.game_id, region=game_account.region)
+                await self.db.load_last_stats(member, [slot])
+                new_last_stats = await self.api.get_stats(
+                    game_id=game_account.game_id, 
+                    region=game_account.region, 
+                    reference=game_account.last_stats
+                )
                 game_account.session_settings.time_to_restart += timedelta(days=1)
                 _log.info(f'Session updated for {member_id} in slot {slot.name}')
                 await self.db.update_session(slot, member_id, game_account.session_settings, new_last_stats)